@@ -1,5 +1,152 @@
+from collections import defaultdict
+
 from django.contrib import admin
-from .models import Tag, Word, Meaning, Definition, UserExample
+from django.contrib.auth.models import User
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
+from .models import Tag, Word, Meaning, WordMeaning, Definition, UserExample, ReviewLog, AccountDeletion, DictionaryEntry
+from .services.content_service import refresh_content
+from .services.deletion_service import delete_tag, delete_words
+from .services.stats_service import StatsService
+
+
+# ===================================================
+# CHANGELIST HELPERS
+# ===================================================
+
+def related_count(model, fk_name):
+    """
+    Count of `model` rows pointing at the outer row through `fk_name`.
+
+    Evaluated as a correlated subquery, so it only runs for the rows on the
+    current changelist page instead of grouping the whole table.
+    """
+    counts = (
+        model.objects.filter(**{fk_name: OuterRef('pk')})
+        .order_by()
+        .values(fk_name)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def is_unfiltered(queryset):
+    """
+    True when `queryset` filters no more than its model's default manager.
+
+    The soft-delete manager hides deleted rows from every Word and Tag
+    queryset; that alone doesn't make a changelist filtered.
+    """
+    return queryset.query.where == queryset.model._default_manager.all().query.where
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Use PostgreSQL's planner estimate for unfiltered changelists of big tables.
+
+    An exact COUNT(*) over millions of rows is what makes the admin time out;
+    the estimate is close enough to build the page links. Filtered lists and
+    small tables keep the exact count.
+    """
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and is_unfiltered(queryset):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.estimate_threshold:
+                return row[0]
+        return super().count
+
+
+class InputFilter(admin.SimpleListFilter):
+    """
+    Sidebar filter rendered as a text box.
+
+    Replaces related-field filters whose choices would otherwise load every
+    user or tag in the database into the sidebar.
+    """
+    template = 'admin/vocabloom/input_filter.html'
+    lookup = None
+
+    def lookups(self, request, model_admin):
+        # A single placeholder choice so Django renders the filter at all
+        return ((None, None),)
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value:
+            return queryset.filter(**{f'{self.lookup}__iexact': value.strip()})
+        return queryset
+
+    def choices(self, changelist):
+        query_params = changelist.get_filters_params()
+        query_params.pop(self.parameter_name, None)
+        yield {'query_parts': query_params.items()}
+
+
+def username_filter(field_path):
+    return type('UsernameFilter', (InputFilter,), {
+        'title': 'username',
+        'parameter_name': 'username',
+        'lookup': f'{field_path}__username',
+    })
+
+
+def tag_name_filter(field_path):
+    return type('TagNameFilter', (InputFilter,), {
+        'title': 'tag name',
+        'parameter_name': 'tag_name',
+        'lookup': f'{field_path}__name',
+    })
+
+
+# ===================================================
+# CONTENT SNAPSHOT
+# ===================================================
+
+class WordContentAdminMixin:
+    """
+    Re-render Word.content for the words whose nested rows were changed here.
+
+    Subclasses say which content part they feed and how to find the words
+    using a queryset of their rows.
+    """
+    content_part = None
+
+    def content_word_ids(self, queryset):
+        raise NotImplementedError
+
+    def _affected(self, queryset):
+        return set(self.content_word_ids(queryset))
+
+    def save_model(self, request, obj, form, change):
+        # Words that used the row before the edit lose it, the rest gain it
+        before = self._affected(type(obj).objects.filter(pk=obj.pk)) if change else set()
+        super().save_model(request, obj, form, change)
+        after = self._affected(type(obj).objects.filter(pk=obj.pk))
+        refresh_content(before | after, parts=(self.content_part,))
+
+    def delete_model(self, request, obj):
+        word_ids = self._affected(type(obj).objects.filter(pk=obj.pk))
+        super().delete_model(request, obj)
+        refresh_content(word_ids, parts=(self.content_part,))
+
+    def delete_queryset(self, request, queryset):
+        word_ids = self._affected(queryset)
+        super().delete_queryset(request, queryset)
+        refresh_content(word_ids, parts=(self.content_part,))
 
 
 # ===================================================
@@ -8,13 +155,33 @@ from .models import Tag, Word, Meaning, Definition, UserExample
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
-    list_display = ('name', 'user', 'word_count')
-    list_filter = ('user',)
+    list_display = ('name', 'user', 'words_count')
+    list_filter = (username_filter('user'),)
+    list_select_related = ('user',)
     search_fields = ('name', 'user__username')
+    autocomplete_fields = ('user',)
+    readonly_fields = ('word_count',)
+    show_full_result_count = False
 
-    def word_count(self, obj):
-        return obj.words.count()
-    word_count.short_description = 'Words Count'
+    def get_queryset(self, request):
+        # Exact count, not the word_count rollup, so drift is visible here
+        return super().get_queryset(request).annotate(
+            words_count=related_count(Word, 'tag')
+        )
+
+    def words_count(self, obj):
+        return obj.words_count
+    words_count.short_description = 'Words Count'
+    words_count.admin_order_field = 'words_count'
+
+    # Soft delete, like the API; 'manage.py purge_deleted' removes the rows.
+    # No rollup changes: a hidden tag's word_count is simply no longer read
+    def delete_model(self, request, obj):
+        delete_tag(obj)
+
+    def delete_queryset(self, request, queryset):
+        for tag in queryset:
+            delete_tag(tag)
 
 
 # ===================================================
@@ -24,9 +191,19 @@ class TagAdmin(admin.ModelAdmin):
 @admin.register(Word)
 class WordAdmin(admin.ModelAdmin):
     list_display = ('word', 'user', 'tag', 'phonetic', 'has_audio', 'meanings_count', 'examples_count', 'created_at')
-    list_filter = ('user', 'tag', 'created_at')
+    list_filter = (username_filter('user'), tag_name_filter('tag'), 'created_at')
+    list_select_related = ('user', 'tag')
     search_fields = ('word', 'user__username', 'phonetic')
     readonly_fields = ('created_at',)
+    autocomplete_fields = ('user', 'tag')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            meanings_count=related_count(WordMeaning, 'word'),
+            examples_count=related_count(UserExample, 'word'),
+        )
 
     def has_audio(self, obj):
         return bool(obj.audio)
@@ -34,12 +211,40 @@ class WordAdmin(admin.ModelAdmin):
     has_audio.short_description = 'Has Audio'
 
     def meanings_count(self, obj):
-        return obj.meanings.count()
+        return obj.meanings_count
     meanings_count.short_description = 'Meanings'
+    meanings_count.admin_order_field = 'meanings_count'
 
     def examples_count(self, obj):
-        return obj.user_examples.count()
+        return obj.examples_count
     examples_count.short_description = 'User Examples'
+    examples_count.admin_order_field = 'examples_count'
+
+    # Soft delete, like the API; 'manage.py purge_deleted' removes the rows
+    def delete_model(self, request, obj):
+        self._delete_words(Word.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        self._delete_words(queryset)
+
+    def _delete_words(self, queryset):
+        """Hide the words and take them off their owners' statistics, as the API does"""
+        with transaction.atomic():
+            words = list(
+                Word.objects.filter(pk__in=queryset.values('pk'))
+                .select_for_update()
+                .only('id', 'user_id', 'tag_id', 'created_at')
+            )
+            examples = defaultdict(list)
+            for user_id, created_at in UserExample.objects.filter(word__in=words).values_list('user_id', 'created_at'):
+                examples[user_id].append(created_at)
+            delete_words(Word.objects.filter(pk__in=[word.pk for word in words]))
+
+            by_user = defaultdict(list)
+            for word in words:
+                by_user[word.user_id].append(word)
+            for user_id, user_words in by_user.items():
+                StatsService(User(id=user_id)).words_deleted(user_words, examples=examples[user_id])
 
 
 # ===================================================
@@ -47,14 +252,43 @@ class WordAdmin(admin.ModelAdmin):
 # ===================================================
 
 @admin.register(Meaning)
-class MeaningAdmin(admin.ModelAdmin):
-    list_display = ('word', 'part_of_speech', 'definitions_count')
-    list_filter = ('part_of_speech', 'word__user')
-    search_fields = ('word__word', 'part_of_speech')
+class MeaningAdmin(WordContentAdminMixin, admin.ModelAdmin):
+    list_display = ('__str__', 'words_count', 'definitions_count', 'in_lexicon')
+    list_filter = ('part_of_speech',)
+    search_fields = ('words__word', 'definitions__definition')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    content_part = 'meanings'
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            words_count=related_count(WordMeaning, 'meaning'),
+            definitions_count=related_count(Definition, 'meaning')
+        )
+
+    def get_readonly_fields(self, request, obj=None):
+        # Shared rows are read by every word linked to them
+        if obj and obj.content_hash:
+            return ('part_of_speech', 'content_hash')
+        return ('content_hash',)
+
+    def content_word_ids(self, queryset):
+        return WordMeaning.objects.filter(meaning__in=queryset).values_list('word_id', flat=True)
+
+    def words_count(self, obj):
+        return obj.words_count
+    words_count.short_description = 'Words'
+    words_count.admin_order_field = 'words_count'
 
     def definitions_count(self, obj):
-        return obj.definitions.count()
+        return obj.definitions_count
     definitions_count.short_description = 'Definitions'
+    definitions_count.admin_order_field = 'definitions_count'
+
+    def in_lexicon(self, obj):
+        return bool(obj.content_hash)
+    in_lexicon.boolean = True
+    in_lexicon.short_description = 'In Lexicon'
 
 
 # ===================================================
@@ -62,14 +296,25 @@ class MeaningAdmin(admin.ModelAdmin):
 # ===================================================
 
 @admin.register(Definition)
-class DefinitionAdmin(admin.ModelAdmin):
-    list_display = ('meaning_word', 'definition_preview', 'has_example')
-    list_filter = ('meaning__part_of_speech', 'meaning__word__user')
-    search_fields = ('definition', 'example', 'meaning__word__word')
+class DefinitionAdmin(WordContentAdminMixin, admin.ModelAdmin):
+    list_display = ('meaning', 'definition_preview', 'has_example')
+    list_filter = ('meaning__part_of_speech',)
+    list_select_related = ('meaning',)
+    search_fields = ('definition', 'example', 'meaning__words__word')
+    raw_id_fields = ('meaning',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    content_part = 'meanings'
+
+    def get_readonly_fields(self, request, obj=None):
+        # Editing a shared definition would change it for every linked word
+        if obj and obj.meaning.content_hash:
+            return ('meaning', 'definition', 'example')
+        return ()
 
-    def meaning_word(self, obj):
-        return obj.meaning.word.word
-    meaning_word.short_description = 'Word'
+    def content_word_ids(self, queryset):
+        meanings = queryset.values('meaning_id')
+        return WordMeaning.objects.filter(meaning_id__in=meanings).values_list('word_id', flat=True)
 
     def definition_preview(self, obj):
         return obj.definition[:100] + '...' if len(obj.definition) > 100 else obj.definition
@@ -86,12 +331,79 @@ class DefinitionAdmin(admin.ModelAdmin):
 # ===================================================
 
 @admin.register(UserExample)
-class UserExampleAdmin(admin.ModelAdmin):
+class UserExampleAdmin(WordContentAdminMixin, admin.ModelAdmin):
     list_display = ('word', 'user', 'example_preview', 'created_at')
-    list_filter = ('user', 'word__tag', 'created_at')
+    list_filter = (username_filter('user'), tag_name_filter('word__tag'), 'created_at')
+    list_select_related = ('word', 'user')
     search_fields = ('example_text', 'word__word', 'user__username')
     readonly_fields = ('created_at',)
+    autocomplete_fields = ('word', 'user')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    content_part = 'user_examples'
+
+    def content_word_ids(self, queryset):
+        return queryset.values_list('word_id', flat=True)
 
     def example_preview(self, obj):
         return obj.example_text[:100] + '...' if len(obj.example_text) > 100 else obj.example_text
-    example_preview.short_description = 'Example Text'
\ No newline at end of file
+    example_preview.short_description = 'Example Text'
+
+
+# ===================================================
+# REVIEW LOG ADMIN
+# ===================================================
+
+@admin.register(ReviewLog)
+class ReviewLogAdmin(admin.ModelAdmin):
+    list_display = ('word', 'user', 'rating', 'interval', 'reviewed_at')
+    list_filter = (username_filter('user'), 'rating', 'reviewed_at')
+    list_select_related = ('word', 'user')
+    search_fields = ('word__word', 'user__username')
+    raw_id_fields = ('word', 'user')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # The log is append-only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+# ===================================================
+# ACCOUNT DELETION ADMIN
+# ===================================================
+
+@admin.register(AccountDeletion)
+class AccountDeletionAdmin(admin.ModelAdmin):
+    list_display = ('user', 'requested_at')
+    list_select_related = ('user',)
+    search_fields = ('user__username',)
+    readonly_fields = ('user', 'requested_at')
+
+    # Written by DELETE /api/account/; deleting one here does not reactivate the user
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+# ===================================================
+# DICTIONARY CACHE ADMIN
+# ===================================================
+
+@admin.register(DictionaryEntry)
+class DictionaryEntryAdmin(admin.ModelAdmin):
+    list_display = ('term', 'found', 'fetched_at', 'expires_at')
+    list_filter = ('found',)
+    search_fields = ('term',)
+    readonly_fields = ('term', 'found', 'payload', 'fetched_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # Entries are written by lookups; an admin may only expire or delete them
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,200 @@
+"""
+Load-test harness for the main API endpoints.
+
+Requests go through Django's test client in-process, so results measure
+the application (views, serializers, ORM, database) without network noise.
+Polly and Gemini are replaced by local stub HTTP servers with configurable
+latency, so the audio and generate scenarios exercise the real SDK clients
+and resilience layer without calling AWS or Google.
+"""
+import json
+import random
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import Tag, Word
+
+SCENARIOS = ("list", "detail", "create", "by_tag", "audio", "generate")
+
+
+# ===================================================
+# STUB UPSTREAM SERVERS
+# ===================================================
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.wait()
+        body, content_type = self.server.respond(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local HTTP server answering every POST after an injected delay"""
+    daemon_threads = True
+
+    def __init__(self, respond, latency_ms=0, jitter_ms=0):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.respond = respond
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def wait(self):
+        delay = self.latency_ms + random.uniform(0, self.jitter_ms)
+        time.sleep(delay / 1000)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+def polly_response(path):
+    # SynthesizeSpeech returns the audio as the raw response body
+    return b"\xff\xfb\x90\x00" * 1024, "audio/mpeg"
+
+
+def gemini_response(path):
+    body = {
+        "candidates": [{
+            "content": {"parts": [{"text": "This is a generated benchmark sentence."}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+        }]
+    }
+    return json.dumps(body).encode("utf-8"), "application/json"
+
+
+# ===================================================
+# LOAD GENERATION
+# ===================================================
+
+class Fixture:
+    """Seeded users with a token and their word/tag ids, picked at random"""
+
+    def __init__(self, users, seed):
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.users = []
+        for user in users:
+            word_ids = list(Word.objects.filter(user=user).values_list("id", flat=True))
+            tag_ids = list(Tag.objects.filter(user=user).values_list("id", flat=True))
+            if not word_ids:
+                continue
+            token = str(RefreshToken.for_user(user).access_token)
+            self.users.append({"user": user, "token": token, "word_ids": word_ids, "tag_ids": tag_ids})
+        self.created = []
+
+    def pick(self):
+        with self.lock:
+            entry = self.rng.choice(self.users)
+            return entry, self.rng.choice(entry["word_ids"]), (
+                self.rng.choice(entry["tag_ids"]) if entry["tag_ids"] else None
+            )
+
+
+def _request(client, scenario, fixture):
+    entry, word_id, tag_id = fixture.pick()
+    auth = {"HTTP_AUTHORIZATION": f"Bearer {entry['token']}"}
+
+    if scenario == "list":
+        return client.get("/api/words/", **auth), 200
+    if scenario == "detail":
+        return client.get(f"/api/words/{word_id}/", **auth), 200
+    if scenario == "by_tag":
+        if tag_id is None:
+            return client.get("/api/tags/", **auth), 200
+        return client.get(f"/api/tags/{tag_id}/words/", **auth), 200
+    if scenario == "create":
+        data = {
+            "word": f"bench-{uuid.uuid4().hex[:12]}",
+            "meanings": [{"part_of_speech": "noun", "definitions": [{"definition": "A benchmark word."}]}],
+        }
+        response = client.post("/api/words/", data, content_type="application/json", **auth)
+        if response.status_code == 201:
+            with fixture.lock:
+                fixture.created.append(response.json()["id"])
+        return response, 201
+    if scenario == "audio":
+        # Distinct texts so single-flight doesn't collapse the load
+        data = {"text": f"Benchmark sentence {uuid.uuid4().hex[:8]}"}
+        return client.post("/api/audio/", data, content_type="application/json", **auth), 200
+    if scenario == "generate":
+        data = {"context": uuid.uuid4().hex[:8], "difficulty_level": "intermediate"}
+        url = f"/api/words/{word_id}/examples/generate/"
+        return client.post(url, data, content_type="application/json", **auth), 200
+    raise ValueError(f"Unknown scenario '{scenario}'")
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(scenario, fixture, requests, concurrency):
+    """Send `requests` requests from `concurrency` threads; return stats"""
+    local = threading.local()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def one_request(_):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = Client(HTTP_HOST="localhost")
+        started = time.perf_counter()
+        try:
+            response, expected = _request(client, scenario, fixture)
+            ok = response.status_code == expected
+        except Exception:
+            ok = False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with lock:
+            latencies.append(elapsed_ms)
+            if not ok:
+                errors.append(elapsed_ms)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(one_request, range(requests)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "concurrency": concurrency,
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else None,
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else None,
+        "p50_ms": round(percentile(latencies, 0.50), 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95), 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99), 2) if latencies else None,
+        "max_ms": round(latencies[-1], 2) if latencies else None,
+    }
@@ -0,0 +1,126 @@
+"""
+Brotli/gzip encoders for CompressionMiddleware.
+
+Brotli is optional: without the `brotli` package installed only gzip is
+offered. Each encoder works incrementally so streamed responses (exports)
+are compressed chunk by chunk instead of being buffered.
+"""
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Compressible media types; images, audio and archives are already compressed
+TEXT_PREFIXES = ("text/",)
+TEXT_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/yaml",
+    "application/jsonl",
+    "application/x-ndjson",
+    "application/vnd.oai.openapi",
+}
+TEXT_SUFFIXES = ("+json", "+xml")
+
+
+def is_compressible(content_type):
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith(TEXT_PREFIXES)
+        or media_type in TEXT_TYPES
+        or media_type.endswith(TEXT_SUFFIXES)
+    )
+
+
+def available_encodings():
+    """Supported encodings, most preferred first"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding):
+    """
+    Pick the encoding for an Accept-Encoding header, or None for identity.
+
+    The client's q-values win; ties go to the server's preference (brotli).
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available_encodings():
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class GzipEncoder:
+    def __init__(self, level):
+        # wbits=31: zlib stream with a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+def encoder(encoding, gzip_level, brotli_quality):
+    if encoding == "br":
+        return BrotliEncoder(brotli_quality)
+    return GzipEncoder(gzip_level)
+
+
+def compress(encoder, content):
+    return encoder.compress(content) + encoder.finish()
+
+
+def compress_stream(encoder, chunks):
+    # Flush after every chunk so clients receive rows as they are produced
+    for chunk in chunks:
+        data = encoder.compress(chunk) + encoder.flush()
+        if data:
+            yield data
+    yield encoder.finish()
+
+
+async def compress_async_stream(encoder, chunks):
+    async for chunk in chunks:
+        data = encoder.compress(chunk) + encoder.flush()
+        if data:
+            yield data
+    yield encoder.finish()
@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class _Entry:
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.released_at = self.created_at
+
+
+class ConnectionPool:
+    """
+    A bounded, thread-safe pool of DB-API connections.
+
+    At most `max_size` connections exist at once; `acquire(connect)` reuses
+    an idle connection or calls `connect()` for a new one, waiting up to
+    `timeout` seconds for one to be released. Idle connections are reused
+    most-recently-released first, checked with `check(connection)` if they
+    sat idle longer than `check_after` seconds, and replaced once older than
+    `max_lifetime`.
+    """
+
+    def __init__(self, check, max_size=10, timeout=10, max_lifetime=1800, check_after=30):
+        self._check = check
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+        self._idle = deque()
+        self._in_use = {}
+        self._connecting = 0
+        self._condition = threading.Condition()
+
+    @property
+    def size(self):
+        with self._condition:
+            return len(self._idle) + len(self._in_use) + self._connecting
+
+    def acquire(self, connect):
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while True:
+                while self._idle:
+                    entry = self._idle.pop()
+                    if self._usable(entry):
+                        self._in_use[id(entry.connection)] = entry
+                        return entry.connection
+                    self._discard(entry.connection)
+                if len(self._in_use) + self._connecting < self.max_size:
+                    # Reserve the slot, then connect without holding the lock
+                    self._connecting += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(f"No database connection free after {self.timeout}s ({self.max_size} in use)")
+                self._condition.wait(remaining)
+
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._connecting -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._connecting -= 1
+            self._in_use[id(connection)] = _Entry(connection)
+        return connection
+
+    def release(self, connection, reusable=True):
+        """Return a connection; `reusable=False` closes it instead"""
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+            if entry is not None and reusable:
+                entry.released_at = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._discard(connection)
+            self._condition.notify()
+
+    def close_all(self):
+        with self._condition:
+            while self._idle:
+                self._discard(self._idle.pop().connection)
+
+    def _usable(self, entry):
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime:
+            return False
+        if now - entry.released_at > self.check_after:
+            try:
+                return self._check(entry.connection)
+            except Exception:
+                return False
+        return True
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except Exception as error:
+            logger.debug(f"Error closing pooled connection: {error}")
@@ -0,0 +1,60 @@
+"""
+PostgreSQL backend that borrows connections from an in-process pool.
+
+Django opens a connection per thread and, with CONN_MAX_AGE=0, closes it at
+the end of each request. Here "open" takes a connection from a pool shared
+by every thread in the process and "close" hands it back, so ASGI workers
+(which run sync code on short-lived threads) still reuse connections.
+Enabled with DB_POOL=True; see settings.
+"""
+import threading
+
+from django.db.backends.postgresql import base
+
+from ..pool import ConnectionPool, PoolTimeout
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(wrapper):
+    """The pool for a connection alias, created on first use"""
+    with _pools_lock:
+        pool = _pools.get(wrapper.alias)
+        if pool is None:
+            pool = _pools[wrapper.alias] = ConnectionPool(
+                check=_is_usable,
+                **wrapper.settings_dict.get("POOL", {}),
+            )
+        return pool
+
+
+def _is_usable(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    return True
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_new_connection(self, conn_params):
+        def connect():
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+
+        try:
+            return get_pool(self).acquire(connect)
+        except PoolTimeout as error:
+            raise self.Database.OperationalError(str(error)) from error
+
+    def _close(self):
+        if self.connection is None:
+            return
+        connection = self.connection
+        # A connection abandoned mid-transaction may still be referenced by
+        # this wrapper (closed_in_transaction), so it is never reused.
+        reusable = not self.in_atomic_block and not connection.closed
+        if reusable and connection.info.transaction_status != 0:  # not idle
+            try:
+                connection.rollback()
+            except self.Database.Error:
+                reusable = False
+        get_pool(self).release(connection, reusable=reusable)
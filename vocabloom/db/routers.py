@@ -0,0 +1,78 @@
+"""
+Read-replica routing.
+
+Writes always go to `default`. Reads go to a replica (DATABASE_REPLICAS)
+only inside a request whose view opted in with ReplicaReadMixin, and only
+while that request hasn't written anything itself. A user who wrote in the
+last REPLICA_STICKY_SECONDS reads from the primary, so their own edits
+never seem to disappear while replicas catch up.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Routing state of the request being handled, or None outside requests
+_current = ContextVar("vocabloom_db_routing", default=None)
+
+
+class RoutingState:
+    def __init__(self):
+        self.replica_reads = False
+        self.wrote = False
+
+
+@contextmanager
+def request_routing():
+    """Track routing for one request; reads stay on the primary until allowed"""
+    state = RoutingState()
+    token = _current.set(state)
+    try:
+        yield state
+    finally:
+        _current.reset(token)
+
+
+def allow_replica_reads():
+    state = _current.get()
+    if state is not None:
+        state.replica_reads = True
+
+
+def _sticky_key(user_id):
+    return f"replica-sticky:{user_id}"
+
+
+def mark_recent_write(user_id):
+    caches[settings.REPLICA_STICKY_CACHE].set(_sticky_key(user_id), True, settings.REPLICA_STICKY_SECONDS)
+
+
+def wrote_recently(user_id):
+    return bool(caches[settings.REPLICA_STICKY_CACHE].get(_sticky_key(user_id)))
+
+
+def pick_replica():
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _current.get()
+        if state is None or not state.replica_reads or state.wrote or not settings.DATABASE_REPLICAS:
+            return "default"
+        return pick_replica()
+
+    def db_for_write(self, model, **hints):
+        state = _current.get()
+        if state is not None:
+            state.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
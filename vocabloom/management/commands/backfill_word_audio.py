@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from vocabloom.services.word_audio_service import WordAudioService, words_missing_audio
+
+
+class Command(BaseCommand):
+    help = "Synthesize and store pronunciations for words that have no audio yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Concurrent Polly requests (default: 8)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Only process this many distinct words",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.MEDIA_URL_IS_PUBLIC:
+            # Clients can't fetch a relative /media/ URL; see WORD_AUDIO_PRECOMPUTE
+            raise CommandError("MEDIA_URL must be an absolute URL clients can fetch audio from")
+
+        # Many users save the same word; synthesize each distinct text once
+        texts = (
+            words_missing_audio()
+            .order_by("word")
+            .values_list("word", flat=True)
+            .distinct()
+        )
+        if options["limit"]:
+            texts = texts[:options["limit"]]
+        texts = list(texts)
+
+        service = WordAudioService()
+        updated = failed = 0
+
+        # Threads only talk to Polly and storage; DB updates stay on this thread
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {
+                executor.submit(service.get_or_create_audio_url, text): text
+                for text in texts
+            }
+            for future in as_completed(futures):
+                text = futures[future]
+                try:
+                    url = future.result()
+                except Exception as error:
+                    failed += 1
+                    self.stderr.write(f"Failed '{text}': {error}")
+                    continue
+                updated += words_missing_audio().filter(word=text).update(audio=url)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored audio for {len(texts) - failed} distinct words "
+            f"({updated} word rows updated, {failed} failed)"
+        ))
@@ -0,0 +1,123 @@
+import json
+import platform
+import random
+import subprocess
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from vocabloom.benchmark import (
+    SCENARIOS,
+    Fixture,
+    StubServer,
+    gemini_response,
+    polly_response,
+    run_scenario,
+)
+from vocabloom.models import Word
+from vocabloom.services.stats_service import reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the main API endpoints against seeded data (see seed_vocab) with "
+        "stubbed Polly/Gemini and report throughput and latency percentiles as JSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenarios",
+            default=",".join(SCENARIOS),
+            help=f"Comma-separated scenarios (default: {','.join(SCENARIOS)})",
+        )
+        parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+        parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client threads")
+        parser.add_argument("--users", type=int, default=20, help="Seeded users to spread requests over")
+        parser.add_argument("--user-prefix", default="seed_user", help="Username prefix used by seed_vocab")
+        parser.add_argument("--polly-latency-ms", type=float, default=150, help="Stub Polly latency")
+        parser.add_argument("--gemini-latency-ms", type=float, default=800, help="Stub Gemini latency")
+        parser.add_argument("--jitter-ms", type=float, default=50, help="Random extra stub latency")
+        parser.add_argument("--seed", type=int, default=1, help="Random seed")
+        parser.add_argument("--output", help="Also write the JSON report to this file")
+        parser.add_argument(
+            "--keep-created",
+            action="store_true",
+            help="Keep the words made by the create scenario",
+        )
+
+    def handle(self, *args, **options):
+        scenarios = [name.strip() for name in options["scenarios"].split(",") if name.strip()]
+        unknown = set(scenarios) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+        usernames = list(
+            User.objects.filter(username__startswith=options["user_prefix"])
+            .order_by("id")
+            .values_list("username", flat=True)
+        )
+        if not usernames:
+            raise CommandError("No seeded users found. Run 'manage.py seed_vocab' first.")
+        random.Random(options["seed"]).shuffle(usernames)
+        fixture = Fixture(
+            User.objects.filter(username__in=usernames[:options["users"]]),
+            options["seed"],
+        )
+
+        polly = StubServer(polly_response, options["polly_latency_ms"], options["jitter_ms"])
+        gemini = StubServer(gemini_response, options["gemini_latency_ms"], options["jitter_ms"])
+        results = {}
+        with polly, gemini, override_settings(
+            POLLY_ENDPOINT_URL=polly.url,
+            GEMINI_API_ENDPOINT=gemini.url,
+            WORD_AUDIO_PRECOMPUTE=False,
+            PERFORMANCE_TIMING_SAMPLE_RATE=0,
+        ):
+            for scenario in scenarios:
+                self.stderr.write(f"Running {scenario}...")
+                results[scenario] = run_scenario(
+                    scenario, fixture, options["requests"], options["concurrency"]
+                )
+
+        if fixture.created and not options["keep_created"]:
+            created = Word.objects.filter(id__in=fixture.created)
+            user_ids = set(created.values_list("user_id", flat=True))
+            created.delete()
+            # The words were counted when created; rebuild their users' rollups without them
+            reconcile(users=User.objects.filter(id__in=user_ids))
+
+        report = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "commit": self._commit(),
+                "python": platform.python_version(),
+                "database": connection.vendor,
+                "users": len(fixture.users),
+                "words": sum(len(entry["word_ids"]) for entry in fixture.users),
+                "options": {
+                    key: options[key]
+                    for key in (
+                        "requests", "concurrency", "polly_latency_ms",
+                        "gemini_latency_ms", "jitter_ms", "seed",
+                    )
+                },
+            },
+            "scenarios": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as report_file:
+                report_file.write(output + "\n")
+        self.stdout.write(output)
+
+    def _commit(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
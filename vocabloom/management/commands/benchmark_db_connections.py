@@ -0,0 +1,131 @@
+import copy
+import json
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.test import Client
+from django.test.utils import override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from vocabloom.benchmark import percentile
+from vocabloom.db.pooled_postgresql.base import DatabaseWrapper as PooledDatabaseWrapper, get_pool
+
+MODES = ("new", "persistent", "pool")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how much of p50 request latency is connection setup, comparing "
+        "a new connection per request, persistent connections and the in-process pool"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Requests per mode (default: 200)")
+        parser.add_argument("--path", default="/api/tags/", help="Endpoint to request (default: /api/tags/)")
+        parser.add_argument("--user-prefix", default="seed_user", help="Username prefix used by seed_vocab")
+        parser.add_argument(
+            "--modes",
+            default=",".join(MODES),
+            help=f"Comma-separated modes (default: {','.join(MODES)})",
+        )
+
+    def handle(self, *args, **options):
+        modes = [mode.strip() for mode in options["modes"].split(",") if mode.strip()]
+        if set(modes) - set(MODES):
+            raise CommandError(f"Unknown modes: {', '.join(sorted(set(modes) - set(MODES)))}")
+
+        user = User.objects.filter(username__startswith=options["user_prefix"]).order_by("id").first()
+        if user is None:
+            raise CommandError("No seeded users found. Run 'manage.py seed_vocab' first.")
+        token = str(RefreshToken.for_user(user).access_token)
+
+        vendor = connections[DEFAULT_DB_ALIAS].vendor
+        if "pool" in modes and vendor != "postgresql":
+            self.stderr.write("Skipping pool mode: it needs PostgreSQL")
+            modes.remove("pool")
+
+        results = {}
+        with override_settings(PERFORMANCE_TIMING_SAMPLE_RATE=0):
+            for mode in modes:
+                self.stderr.write(f"Running {mode}...")
+                results[mode] = self._run(mode, options["requests"], options["path"], token)
+
+        if "new" in results:
+            for mode, stats in results.items():
+                stats["p50_saved_ms"] = round(results["new"]["p50_ms"] - stats["p50_ms"], 2)
+
+        self.stdout.write(json.dumps({
+            "database": vendor,
+            "path": options["path"],
+            "requests": options["requests"],
+            "modes": results,
+        }, indent=2))
+
+    def _wrapper(self, mode):
+        settings_dict = copy.deepcopy(connections.settings[DEFAULT_DB_ALIAS])
+        if mode == "new":
+            settings_dict["CONN_MAX_AGE"] = 0
+        elif mode == "persistent":
+            settings_dict["CONN_MAX_AGE"] = 600
+            settings_dict["CONN_HEALTH_CHECKS"] = True
+        else:
+            settings_dict["CONN_MAX_AGE"] = 0
+            settings_dict.setdefault("POOL", {})
+            return PooledDatabaseWrapper(settings_dict, DEFAULT_DB_ALIAS)
+        wrapper_class = type(connections[DEFAULT_DB_ALIAS])
+        if issubclass(wrapper_class, PooledDatabaseWrapper):
+            # Measure Django's own connection handling, not the pool
+            wrapper_class = PooledDatabaseWrapper.__bases__[0]
+        return wrapper_class(settings_dict, DEFAULT_DB_ALIAS)
+
+    def _run(self, mode, requests, path, token):
+        original = connections[DEFAULT_DB_ALIAS]
+        wrapper = self._wrapper(mode)
+        connect_ms = []
+
+        get_new_connection = wrapper.get_new_connection
+
+        def timed_get_new_connection(conn_params):
+            started = time.perf_counter()
+            try:
+                return get_new_connection(conn_params)
+            finally:
+                connect_ms.append((time.perf_counter() - started) * 1000)
+
+        wrapper.get_new_connection = timed_get_new_connection
+        connections[DEFAULT_DB_ALIAS] = wrapper
+        client = Client(HTTP_HOST="localhost", HTTP_AUTHORIZATION=f"Bearer {token}")
+        latencies = []
+        try:
+            # The test client leaves connections open; close them like a
+            # WSGI server does at the start and end of each request.
+            for _ in range(requests):
+                started = time.perf_counter()
+                close_old_connections()
+                response = client.get(path)
+                close_old_connections()
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    raise CommandError(f"{path} answered {response.status_code}")
+        finally:
+            wrapper.close()
+            if mode == "pool":
+                get_pool(wrapper).close_all()
+            connections[DEFAULT_DB_ALIAS] = original
+
+        latencies.sort()
+        connect_ms.sort()
+        p50 = percentile(latencies, 0.50)
+        connect_p50 = percentile(connect_ms, 0.50) if connect_ms else 0
+        return {
+            "p50_ms": round(p50, 2),
+            "p95_ms": round(percentile(latencies, 0.95), 2),
+            "mean_ms": round(statistics.fmean(latencies), 2),
+            "connections_opened": len(connect_ms),
+            "connect_p50_ms": round(connect_p50, 2),
+            # Share of a typical request spent opening (or checking out) its connection
+            "connect_share_of_p50": round(connect_p50 * len(connect_ms) / requests / p50, 3) if p50 else None,
+        }
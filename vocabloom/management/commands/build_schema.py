@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from drf_spectacular.drainage import GENERATOR_STATS
+
+from vocabloom.schema import build_schema
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI schema files served by /api/schema/ (run at deploy)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            default=settings.SCHEMA_DIR,
+            help="Directory to write to (default: SCHEMA_DIR)",
+        )
+        parser.add_argument(
+            "--fail-on-warn",
+            action="store_true",
+            help="Fail if the generator reports warnings or errors",
+        )
+
+    def handle(self, *args, **options):
+        GENERATOR_STATS.reset()
+        version = build_schema(options["output_dir"])
+        GENERATOR_STATS.emit_summary()
+
+        if options["fail_on_warn"] and GENERATOR_STATS:
+            raise CommandError("Schema generation reported warnings")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"OpenAPI schema {version} written to {options['output_dir']}"
+        ))
@@ -0,0 +1,54 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from vocabloom.models import Word
+from vocabloom.services.content_service import REBUILD_BATCH_SIZE, find_drift, refresh_content
+
+SHOWN_IDS = 20
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare every word's content snapshot with the source tables and list the "
+        "words that drifted. Exits with an error when any did, unless --repair is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Only check this username's words")
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Re-render the words that drifted",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f"Words compared per query batch (default: {REBUILD_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        words = None
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"User '{options['user']}' does not exist")
+            words = Word.objects.filter(user=user)
+
+        drifted = find_drift(batch_size=options["batch_size"], queryset=words)
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("Every word's content matches its source rows"))
+            return
+
+        shown = ", ".join(str(word_id) for word_id in drifted[:SHOWN_IDS])
+        more = f" and {len(drifted) - SHOWN_IDS} more" if len(drifted) > SHOWN_IDS else ""
+        self.stdout.write(f"{len(drifted)} words drifted: {shown}{more}")
+
+        if not options["repair"]:
+            raise CommandError("Content drift found; run with --repair or rebuild_word_content")
+        for start in range(0, len(drifted), options["batch_size"]):
+            refresh_content(drifted[start:start + options["batch_size"]])
+        self.stdout.write(self.style.SUCCESS(f"Repaired the content of {len(drifted)} words"))
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from vocabloom.services.lexicon_service import (
+    MERGE_BATCH_SIZE,
+    merge_unhashed,
+    prune_orphans,
+    storage_report,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge meanings with identical content into the shared lexicon, delete "
+        "meanings no word uses any more, and report the storage saved by sharing. "
+        "Run off-peak: a meaning deleted here may be one a concurrent save just picked."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--report-only",
+            action="store_true",
+            help="Only print the storage report",
+        )
+        parser.add_argument(
+            "--keep-orphans",
+            action="store_true",
+            help="Keep meanings that no word links to",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MERGE_BATCH_SIZE,
+            help=f"Meanings hashed per transaction (default: {MERGE_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        if not options["report_only"]:
+            result = merge_unhashed(batch_size=options["batch_size"])
+            pruned = 0 if options["keep_orphans"] else prune_orphans()
+            self.stdout.write(self.style.SUCCESS(
+                f"Hashed {result['hashed']} meanings, merged {result['merged']} duplicates "
+                f"({result['definitions']} definitions) and deleted {pruned} unused meanings"
+            ))
+
+        for name, counts in storage_report().items():
+            saved = counts["linked"] - counts["stored"]
+            share = f" ({saved / counts['linked']:.0%})" if counts["linked"] else ""
+            self.stdout.write(
+                f"{name}: {counts['stored']} stored for {counts['linked']} per-word copies, "
+                f"{saved} saved{share}"
+            )
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from vocabloom.services.import_service import DeckImportError, DeckImportService
+
+
+class Command(BaseCommand):
+    help = "Import an Anki package (.apkg) or CSV/TSV deck into a user's vocabulary"
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the imported words")
+        parser.add_argument("path", help="Path to the .apkg, .csv, .tsv or .txt deck")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Words written per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' does not exist")
+
+        service = DeckImportService(user, batch_size=options["batch_size"])
+        try:
+            with open(options["path"], "rb") as deck:
+                report = service.import_file(deck, options["path"])
+        except (OSError, DeckImportError) as error:
+            raise CommandError(str(error))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} words from {report['rows']} rows "
+            f"({report['duplicates']} duplicates, {report['merged']} merged, "
+            f"{report['skipped']} skipped) in {report['elapsed_seconds']}s "
+            f"- {report['rows_per_second']} rows/s"
+        ))
@@ -0,0 +1,100 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Boot the way a gunicorn worker does: settings, apps, WSGI handler, URLconf
+BOOT_SCRIPT = """
+import importlib, sys
+import django
+django.setup()
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+importlib.import_module({module!r})
+print("\\n".join(sorted(sys.modules)))
+"""
+
+# SDKs that should only load when a request actually needs them
+LAZY_MODULES = ["boto3", "botocore", "google.generativeai", "grpc"]
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output.
+
+    Returns (total_us, {top-level package: cumulative us}) counting only
+    imports made directly by the boot script, so nothing is counted twice.
+    """
+    packages = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative = int(cumulative)
+        except ValueError:
+            continue  # header line
+        # Nested imports are indented further; depth 0 has one space
+        if name.startswith("  "):
+            continue
+        packages[name.strip().split(".")[0]] += cumulative
+    return sum(packages.values()), dict(packages)
+
+
+class Command(BaseCommand):
+    help = "Profile worker boot import time with python -X importtime"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module",
+            default=settings.ROOT_URLCONF,
+            help="Module imported after Django setup (default: ROOT_URLCONF)",
+        )
+        parser.add_argument("--top", type=int, default=15, help="Packages to list (default: 15)")
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            help="Fail if total import time exceeds this many milliseconds",
+        )
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    def handle(self, *args, **options):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT.format(module=options["module"])],
+            capture_output=True,
+            text=True,
+            # Under the test runner, boot the child with the test settings
+            # (in-memory SQLite) rather than requiring a development database
+            env={**os.environ, "DJANGO_TESTING": "True"} if settings.TESTING else None,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Boot failed:\n{result.stderr[-2000:]}")
+
+        total_us, packages = parse_importtime(result.stderr)
+        loaded = set(result.stdout.split())
+        eager = [name for name in LAZY_MODULES if name in loaded]
+        top = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:options["top"]]
+
+        report = {
+            "module": options["module"],
+            "total_ms": round(total_us / 1000, 1),
+            "packages_ms": {name: round(us / 1000, 1) for name, us in top},
+            "eager_sdks": eager,
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(f"Import time to load {report['module']}: {report['total_ms']} ms\n")
+            for name, ms in report["packages_ms"].items():
+                self.stdout.write(f"  {ms:>9.1f} ms  {name}")
+            if eager:
+                self.stdout.write(self.style.WARNING(f"\nLoaded at boot but meant to be lazy: {', '.join(eager)}"))
+
+        budget = options["budget_ms"]
+        if budget is not None and report["total_ms"] > budget:
+            raise CommandError(f"Import time {report['total_ms']} ms is over the {budget} ms budget")
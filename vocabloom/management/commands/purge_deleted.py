@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from vocabloom.services.deletion_service import PURGE_BATCH_SIZE, purge_deleted
+
+
+class Command(BaseCommand):
+    help = (
+        "Physically remove deleted words, tags and closed accounts, with their "
+        "examples, meaning links and statistics, in batched raw DELETEs. Run "
+        "regularly (e.g. hourly); dedupe_lexicon then drops meanings no word uses."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=0,
+            help="Only purge rows deleted at least this many days ago (default: 0)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PURGE_BATCH_SIZE,
+            help=f"Rows deleted per statement (default: {PURGE_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than_days"] < 0:
+            raise CommandError("--older-than-days cannot be negative")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        purged = purge_deleted(older_than=cutoff, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Purged {purged['words']} words, {purged['tags']} tags and {purged['accounts']} accounts"
+        ))
@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from vocabloom.models import Word
+from vocabloom.services.content_service import REBUILD_BATCH_SIZE, rebuild_content
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-render every word's content snapshot (meanings, definitions and user "
+        "examples) from the source tables. Use check_word_content to find drift first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Only rebuild this username's words")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=REBUILD_BATCH_SIZE,
+            help=f"Words rebuilt per transaction (default: {REBUILD_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        words = None
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"User '{options['user']}' does not exist")
+            words = Word.objects.filter(user=user)
+
+        rebuilt = rebuild_content(batch_size=options["batch_size"], queryset=words)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the content of {rebuilt} words"))
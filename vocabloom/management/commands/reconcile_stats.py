@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from vocabloom.services.stats_service import reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the statistics rollups from words, examples and review logs. "
+        "Run nightly; use --full once after deploying the rollup tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="Recompute daily rows for this many recent days (default: 2)",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute the daily rows of all history",
+        )
+        parser.add_argument("--user", help="Only reconcile this username")
+
+    def handle(self, *args, **options):
+        if options["days"] < 1:
+            raise CommandError("--days must be at least 1")
+        since = None if options["full"] else timezone.localdate() - timedelta(days=options["days"] - 1)
+
+        users = None
+        if options["user"]:
+            users = User.objects.filter(username=options["user"])
+            if not users.exists():
+                raise CommandError(f"User '{options['user']}' does not exist")
+
+        written = reconcile(since=since, users=users)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled {written['daily']} daily rows "
+            f"{'(all history)' if since is None else f'since {since}'}, "
+            f"{written['totals']} user totals and {written['tags']} tags"
+        ))
@@ -0,0 +1,149 @@
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from vocabloom.models import Tag, Word, UserExample
+from vocabloom.services.content_service import refresh_content
+from vocabloom.services.lexicon_service import set_meanings
+from vocabloom.services.stats_service import reconcile
+
+SYLLABLES = [
+    "al", "an", "ar", "ba", "be", "ca", "co", "de", "di", "el", "en", "er",
+    "fa", "ga", "in", "is", "la", "le", "lo", "ma", "me", "mi", "na", "ne",
+    "no", "or", "pa", "pe", "ra", "re", "ri", "ro", "sa", "se", "si", "ta",
+    "te", "ti", "to", "un", "ur", "va", "ve", "vi",
+]
+PARTS_OF_SPEECH = ["noun", "verb", "adjective", "adverb"]
+TAG_NAMES = [
+    "Movies", "Tech", "Travel", "Work", "Food", "Science", "Music", "Books",
+    "Sports", "Health", "Business", "Idioms", "Exam Prep", "Daily Life",
+]
+FILLER = (
+    "the a of to in and with for on that by from about as into over after "
+    "people place time thing way day world life hand part child eye work"
+).split()
+
+SEED_PASSWORD = "seedpass123"
+
+
+class Command(BaseCommand):
+    help = "Generate users with realistic vocabularies for benchmarking"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100, help="Users to create (default: 100)")
+        parser.add_argument(
+            "--words",
+            type=int,
+            default=200,
+            help="Median words per user; sizes follow a long-tailed distribution (default: 200)",
+        )
+        parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+        parser.add_argument("--prefix", default="seed_user", help="Username prefix (default: seed_user)")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Rows per bulk insert")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        batch_size = options["batch_size"]
+        started = time.monotonic()
+
+        # Hashing is deliberately slow; every seeded user shares one hash
+        password = make_password(SEED_PASSWORD)
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=f"{options['prefix']}_{i}",
+                    email=f"{options['prefix']}_{i}@example.com",
+                    password=password,
+                )
+                for i in range(options["users"])
+            ],
+            batch_size=batch_size,
+        )
+
+        totals = {"users": len(users), "tags": 0, "words": 0, "meanings": 0, "definitions": 0, "examples": 0}
+        for user in users:
+            with transaction.atomic():
+                counts = self._seed_user(rng, user, options["words"], batch_size)
+            for key, value in counts.items():
+                totals[key] += value
+        # Bulk inserts skip StatsService; build the seeded users' rollups in one pass
+        reconcile(users=User.objects.filter(id__in=[user.id for user in users]))
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            ", ".join(f"{value} {key}" for key, value in totals.items())
+            + f" created in {elapsed:.1f}s (password: {SEED_PASSWORD})"
+        ))
+
+    def _seed_user(self, rng, user, median_words, batch_size):
+        tags = Tag.objects.bulk_create([
+            Tag(user=user, name=name)
+            for name in rng.sample(TAG_NAMES, rng.randint(2, 8))
+        ])
+
+        # Most learners save a handful of words, a few save thousands
+        word_count = max(1, int(median_words * rng.lognormvariate(0, 0.8)))
+        seen = set()
+        words = []
+        while len(words) < word_count:
+            text = self._word(rng)
+            if text in seen:
+                continue
+            seen.add(text)
+            words.append(Word(
+                user=user,
+                word=text,
+                tag=rng.choice(tags) if rng.random() < 0.8 else None,
+                phonetic=f"/{text}/" if rng.random() < 0.7 else None,
+                note=self._sentence(rng, 4, 12) if rng.random() < 0.2 else None,
+            ))
+        words = Word.objects.bulk_create(words, batch_size=batch_size)
+
+        contents = []
+        examples = []
+        for word in words:
+            contents.append(self._meanings(word.word))
+            for _ in range(rng.choices([0, 1, 2, 3], [60, 25, 10, 5])[0]):
+                examples.append(UserExample(word=word, user=user, example_text=self._sentence(rng, 5, 15)))
+        UserExample.objects.bulk_create(examples, batch_size=batch_size)
+        pairs = list(zip(words, contents))
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            set_meanings(batch)
+            refresh_content([word.id for word, _ in batch], parts=("user_examples",))
+
+        meanings = [meaning for word_meanings in contents for meaning in word_meanings]
+        definitions = [definition for _, word_definitions in meanings for definition in word_definitions]
+
+        return {
+            "tags": len(tags),
+            "words": len(words),
+            "meanings": len(meanings),
+            "definitions": len(definitions),
+            "examples": len(examples),
+        }
+
+    def _meanings(self, text):
+        """A word's dictionary content; the same for every user who saves it"""
+        rng = random.Random(text)
+        return [
+            (
+                part_of_speech,
+                [
+                    (self._sentence(rng, 6, 20), self._sentence(rng, 5, 15) if rng.random() < 0.5 else None)
+                    for _ in range(rng.choices([1, 2, 3, 4], [50, 30, 15, 5])[0])
+                ],
+            )
+            for part_of_speech in rng.sample(PARTS_OF_SPEECH, rng.choices([1, 2, 3], [70, 25, 5])[0])
+        ]
+
+    def _word(self, rng):
+        return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+
+    def _sentence(self, rng, shortest, longest):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(shortest, longest))]
+        return " ".join(words).capitalize() + "."
@@ -0,0 +1,353 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Latencies go into log-linear (HDR-style) histograms: every power of two is
+split into 16 linear sub-buckets, so any recorded value is known to within
+about 6% and histograms from different threads or workers merge exactly,
+which is what makes p95/p99 across gunicorn workers meaningful.
+
+Recording is lock-free: each thread writes to its own shard and shards are
+only summed when metrics are read. With METRICS_MULTIPROC_DIR set, every
+worker periodically writes its totals to a file there and the metrics
+endpoint merges the files of the workers still running.
+"""
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+SUB_BUCKETS = 16
+QUANTILES = (0.5, 0.95, 0.99)
+
+_local = threading.local()
+_shards = []
+_shards_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_last_flush = 0.0
+# (pid, random token) of this process's snapshot file, metrics-<pid>-<token>.json.
+# The token tells a worker's file from one left by an earlier process with
+# the same pid; it is made on the first flush after the fork.
+_snapshot_owner = None
+
+
+# ===================================================
+# HISTOGRAM BUCKETS
+# ===================================================
+
+def bucket_index(value):
+    """Bucket for a non-negative integer value"""
+    if value < SUB_BUCKETS:
+        return value
+    exponent = value.bit_length() - 5
+    return SUB_BUCKETS * exponent + (value >> exponent)
+
+
+def bucket_bounds(index):
+    """Inclusive (lowest, highest) value stored in bucket `index`"""
+    if index < SUB_BUCKETS * 2:
+        return index, index
+    exponent = index // SUB_BUCKETS - 1
+    sub_bucket = index - SUB_BUCKETS * exponent
+    return sub_bucket << exponent, ((sub_bucket + 1) << exponent) - 1
+
+
+class Histogram:
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+
+    def record(self, value):
+        value = max(int(value), 0)
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def merge(self, buckets, count, total):
+        for index, hits in buckets.items():
+            index = int(index)
+            self.buckets[index] = self.buckets.get(index, 0) + hits
+        self.count += count
+        self.total += total
+
+    def quantile(self, q):
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return (low + high) / 2
+        return bucket_bounds(max(self.buckets))[1]
+
+
+# ===================================================
+# RECORDING
+# ===================================================
+
+class _Shard:
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+
+
+def _shard():
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = _Shard()
+        with _shards_lock:
+            _shards.append(shard)
+    return shard
+
+
+def observe(name, value, **labels):
+    """Record `value` in histogram `name`. Durations are in microseconds."""
+    key = (name, tuple(sorted(labels.items())))
+    histograms = _shard().histograms
+    histogram = histograms.get(key)
+    if histogram is None:
+        histogram = histograms[key] = Histogram()
+    histogram.record(value)
+    _maybe_flush()
+
+
+def increment(name, amount=1, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    counters = _shard().counters
+    counters[key] = counters.get(key, 0) + amount
+
+
+def count_cache(cache, hit):
+    increment("cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+
+@contextmanager
+def upstream_call(service):
+    """Record latency and outcome of a call to Polly, Gemini, ..."""
+    from .services.resilience import CircuitOpenError
+
+    started = time.perf_counter()
+    outcome = "success"
+    try:
+        yield
+    except CircuitOpenError:
+        outcome = "rejected"
+        raise
+    except Exception:
+        outcome = "error"
+        raise
+    finally:
+        if outcome != "rejected":
+            observe("upstream_call_duration", (time.perf_counter() - started) * 1e6, service=service)
+        increment("upstream_calls_total", service=service, outcome=outcome)
+
+
+# ===================================================
+# AGGREGATION
+# ===================================================
+
+def _local_snapshot():
+    """Sum every thread's shard in this process"""
+    histograms = {}
+    counters = {}
+    with _shards_lock:
+        shards = list(_shards)
+    for shard in shards:
+        for key, histogram in list(shard.histograms.items()):
+            merged = histograms.setdefault(key, Histogram())
+            merged.merge(dict(histogram.buckets), histogram.count, histogram.total)
+        for key, value in list(shard.counters.items()):
+            counters[key] = counters.get(key, 0) + value
+    return histograms, counters
+
+
+def _breaker_states():
+    from .services.resilience import breakers
+    return {name: breaker.snapshot()["state"] for name, breaker in breakers.items()}
+
+
+def _snapshot_pid(filename):
+    """pid in a snapshot file name, or None for other files"""
+    if not (filename.startswith("metrics-") and filename.endswith(".json")):
+        return None
+    try:
+        return int(filename[len("metrics-"):].split("-")[0].split(".")[0])
+    except ValueError:
+        return None
+
+
+def _pid_alive(pid):
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def flush():
+    """Write this worker's totals to METRICS_MULTIPROC_DIR"""
+    global _last_flush, _snapshot_owner
+    directory = settings.METRICS_MULTIPROC_DIR
+    if not directory:
+        return
+    histograms, counters = _local_snapshot()
+    payload = {
+        "pid": os.getpid(),
+        "histograms": [
+            [name, labels, h.buckets, h.count, h.total]
+            for (name, labels), h in histograms.items()
+        ],
+        "counters": [[name, labels, value] for (name, labels), value in counters.items()],
+        "breakers": _breaker_states(),
+    }
+    os.makedirs(directory, exist_ok=True)
+    if _snapshot_owner is None or _snapshot_owner[0] != os.getpid():
+        _snapshot_owner = (os.getpid(), secrets.token_hex(4))
+        # Files with our pid were left by a dead process that had it before
+        for filename in os.listdir(directory):
+            if _snapshot_pid(filename) == os.getpid():
+                _remove(os.path.join(directory, filename))
+    path = os.path.join(directory, "metrics-{}-{}.json".format(*_snapshot_owner))
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as snapshot:
+        json.dump(payload, snapshot)
+    os.replace(temp_path, path)
+    _last_flush = time.monotonic()
+
+
+def _maybe_flush():
+    if not settings.METRICS_MULTIPROC_DIR:
+        return
+    if time.monotonic() - _last_flush < settings.METRICS_FLUSH_INTERVAL:
+        return
+    # Whoever gets the lock flushes; everyone else just carries on
+    if _flush_lock.acquire(blocking=False):
+        try:
+            flush()
+        finally:
+            _flush_lock.release()
+
+
+def collect():
+    """Return (histograms, counters, breaker states per pid) for all workers"""
+    directory = settings.METRICS_MULTIPROC_DIR
+    if not directory:
+        histograms, counters = _local_snapshot()
+        return histograms, counters, {os.getpid(): _breaker_states()}
+
+    with _flush_lock:
+        flush()
+
+    histograms = {}
+    counters = {}
+    breaker_states = {}
+    for filename in os.listdir(directory):
+        pid = _snapshot_pid(filename)
+        if pid is None:
+            continue
+        if not _pid_alive(pid):
+            # A worker that exited (or was restarted): its counters and
+            # breaker states would otherwise be reported forever
+            _remove(os.path.join(directory, filename))
+            continue
+        try:
+            with open(os.path.join(directory, filename)) as snapshot:
+                payload = json.load(snapshot)
+        except (OSError, ValueError):
+            continue
+        for name, labels, buckets, count, total in payload["histograms"]:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            histograms.setdefault(key, Histogram()).merge(buckets, count, total)
+        for name, labels, value in payload["counters"]:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            counters[key] = counters.get(key, 0) + value
+        breaker_states[payload["pid"]] = payload["breakers"]
+    return histograms, counters, breaker_states
+
+
+# ===================================================
+# PROMETHEUS TEXT FORMAT
+# ===================================================
+
+# name -> (prometheus name, help, unit divisor)
+HISTOGRAMS = {
+    "http_request_duration": ("vocabloom_http_request_duration_seconds", "Request latency by route", 1e6),
+    "db_queries_per_request": ("vocabloom_db_queries_per_request", "Database queries per request by route", 1),
+    "db_time_per_request": ("vocabloom_db_time_per_request_seconds", "Database time per request by route", 1e6),
+    "upstream_call_duration": ("vocabloom_upstream_call_duration_seconds", "Latency of external API calls", 1e6),
+}
+
+COUNTERS = {
+    "http_requests_total": ("vocabloom_http_requests_total", "Requests by route, method and status"),
+    "upstream_calls_total": ("vocabloom_upstream_calls_total", "External API calls by outcome"),
+    "cache_requests_total": ("vocabloom_cache_requests_total", "Cache lookups by result"),
+}
+
+BREAKER_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def render_prometheus():
+    histograms, counters, breaker_states = collect()
+    lines = []
+
+    for name, (metric, help_text, divisor) in HISTOGRAMS.items():
+        series = sorted((labels, h) for (n, labels), h in histograms.items() if n == name)
+        if not series:
+            continue
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} summary"]
+        for labels, histogram in series:
+            for q in QUANTILES:
+                value = histogram.quantile(q) / divisor
+                lines.append(f"{metric}{_labels(labels, quantile=q)} {value:.6g}")
+            lines.append(f"{metric}_sum{_labels(labels)} {histogram.total / divisor:.6g}")
+            lines.append(f"{metric}_count{_labels(labels)} {histogram.count}")
+
+    for name, (metric, help_text) in COUNTERS.items():
+        series = sorted((labels, value) for (n, labels), value in counters.items() if n == name)
+        if not series:
+            continue
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        lines += [f"{metric}{_labels(labels)} {value}" for labels, value in series]
+
+    metric = "vocabloom_circuit_breaker_state"
+    lines += [
+        f"# HELP {metric} Circuit breaker state per worker (0 closed, 1 half open, 2 open)",
+        f"# TYPE {metric} gauge",
+    ]
+    for pid, states in sorted(breaker_states.items()):
+        for service, state in sorted(states.items()):
+            labels = _labels((("service", service), ("pid", pid)))
+            lines.append(f"{metric}{labels} {BREAKER_STATE_VALUES[state]}")
+
+    return "\n".join(lines) + "\n"
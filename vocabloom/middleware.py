@@ -0,0 +1,169 @@
+import json
+import logging
+import random
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+
+from . import compression, metrics, timing
+from .db import routers
+
+logger = logging.getLogger("vocabloom.performance")
+
+
+class ServerTimingMiddleware:
+    """
+    Break each request down into DB, external service, serializer and
+    render time.
+
+    Every request feeds the per-route metrics. Sampled requests also get
+    the breakdown back in a `Server-Timing` header (visible in the
+    browser's network panel) and log it as one JSON line.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.PERFORMANCE_TIMING_SAMPLE_RATE
+        sampled = rate >= 1 or (rate > 0 and random.random() < rate)
+        if not sampled and not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        timings, token = timing.start()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings.record_query))
+                response = self.get_response(request)
+        finally:
+            timing.finish(token)
+
+        total_ms = timings.total_ms()
+        route = getattr(request.resolver_match, "view_name", None) or "unmatched"
+
+        if settings.METRICS_ENABLED:
+            self._record_metrics(request, response, route, timings, total_ms)
+
+        if not sampled:
+            return response
+
+        response["Server-Timing"] = self._header(timings, total_ms)
+
+        origin = request.headers.get("Origin")
+        if origin and origin in settings.CORS_ALLOWED_ORIGINS:
+            # Browsers hide Server-Timing from cross-origin pages without this
+            response["Timing-Allow-Origin"] = origin
+
+        logger.info(json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "route": route,
+            "status": response.status_code,
+            "total_ms": round(total_ms, 2),
+            "db_queries": timings.db_queries,
+            "db_ms": round(timings.db_ms, 2),
+            **{f"{name}_ms": round(ms, 2) for name, ms in timings.spans.items()},
+        }))
+        return response
+
+    def _header(self, timings, total_ms):
+        parts = [f'db;dur={timings.db_ms:.1f};desc="{timings.db_queries} queries"']
+        parts += [f"{name};dur={ms:.1f}" for name, ms in timings.spans.items()]
+        parts.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(parts)
+
+    def _record_metrics(self, request, response, route, timings, total_ms):
+        metrics.increment(
+            "http_requests_total",
+            route=route,
+            method=request.method,
+            status=response.status_code,
+        )
+        metrics.observe("db_queries_per_request", timings.db_queries, route=route)
+        metrics.observe("db_time_per_request", timings.db_ms * 1000, route=route)
+        metrics.observe("http_request_duration", total_ms * 1000, route=route, method=request.method)
+
+
+class CompressionMiddleware:
+    """
+    Compress text responses with brotli or gzip, as the client prefers.
+
+    Responses shorter than COMPRESSION_MIN_SIZE are sent as they are.
+    Streamed responses are compressed chunk by chunk. COMPRESSION_GZIP_LEVEL
+    and COMPRESSION_BROTLI_QUALITY trade CPU time against bandwidth.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if (
+            response.status_code == 206  # byte ranges of the identity encoding
+            or response.has_header("Content-Encoding")
+            or not compression.is_compressible(response.get("Content-Type", ""))
+        ):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = compression.negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        encoder = compression.encoder(
+            encoding,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        )
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compression.compress_async_stream(encoder, response.streaming_content)
+            else:
+                response.streaming_content = compression.compress_stream(encoder, response.streaming_content)
+            # The compressed size is only known once the stream ends
+            del response.headers["Content-Length"]
+        else:
+            content = compression.compress(encoder, response.content)
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        # The bytes differ from the identity representation, so a strong
+        # ETag must become weak; conditional requests still match it.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Scope read-replica routing to each request.
+
+    Views opt into replica reads with ReplicaReadMixin. When a request
+    writes to the database, its user is pinned to the primary for
+    REPLICA_STICKY_SECONDS so their next reads see the change.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        with routers.request_routing() as state:
+            response = self.get_response(request)
+
+        user = getattr(request, "user", None)
+        if state.wrote and user is not None and user.is_authenticated:
+            routers.mark_recent_write(user.id)
+        return response
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:07
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def existing_words_due_in_creation_order(apps, schema_editor):
+    Word = apps.get_model('vocabloom', 'Word')
+    Word.objects.update(due_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabloom', '0003_userexample'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='due_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='ease',
+            field=models.FloatField(default=2.5),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='interval',
+            field=models.PositiveIntegerField(default=0, help_text='Days until the next review'),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='lapses',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='last_reviewed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='repetitions',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['user', 'due_at'], name='word_user_due_idx'),
+        ),
+        migrations.RunPython(existing_words_due_in_creation_order, migrations.RunPython.noop),
+    ]
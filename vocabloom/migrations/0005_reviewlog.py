@@ -0,0 +1,34 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:11
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('vocabloom', '0004_word_review_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.UUIDField(help_text='Client-generated id; resending an event is a no-op')),
+                ('rating', models.PositiveSmallIntegerField()),
+                ('reviewed_at', models.DateTimeField()),
+                ('interval', models.PositiveIntegerField()),
+                ('ease', models.FloatField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='review_logs', to=settings.AUTH_USER_MODEL)),
+                ('word', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='review_logs', to='vocabloom.word')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='reviewlog',
+            constraint=models.UniqueConstraint(fields=('user', 'event_id'), name='reviewlog_user_event_unique'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabloom', '0005_reviewlog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['user', 'id'], name='word_user_id_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:19
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('vocabloom', '0006_word_user_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('words', models.IntegerField(default=0)),
+                ('examples', models.IntegerField(default=0)),
+                ('reviews', models.IntegerField(default=0)),
+                ('reviews_correct', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='word_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('words_added', models.IntegerField(default=0)),
+                ('examples_added', models.IntegerField(default=0)),
+                ('reviews', models.IntegerField(default=0)),
+                ('reviews_correct', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='dailystats',
+            constraint=models.UniqueConstraint(fields=('user', 'date'), name='dailystats_user_date_unique'),
+        ),
+    ]
@@ -0,0 +1,152 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:38
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Q
+import django.db.models.deletion
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 2000
+
+
+# A frozen copy of lexicon_service.meaning_hash, so this migration keeps
+# hashing the way it did when it was written
+def meaning_hash(part_of_speech, definitions):
+    payload = [part_of_speech or None, [[definition, example or None] for definition, example in definitions]]
+    return hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def share_meanings(apps, schema_editor):
+    """Link words to their meanings, merging meanings with identical content"""
+    Meaning = apps.get_model('vocabloom', 'Meaning')
+    Definition = apps.get_model('vocabloom', 'Definition')
+    WordMeaning = apps.get_model('vocabloom', 'WordMeaning')
+
+    saved = {'meanings': 0, 'definitions': 0, 'characters': 0}
+    last_word, last_id = 0, 0
+    current_word, position, linked = None, 0, set()
+    while True:
+        # Walk meanings word by word so link positions follow the old order
+        batch = list(
+            Meaning.objects.filter(Q(word_id__gt=last_word) | Q(word_id=last_word, id__gt=last_id))
+            .order_by('word_id', 'id')[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        last_word, last_id = batch[-1].word_id, batch[-1].id
+
+        contents = defaultdict(list)
+        for meaning_id, definition, example in (
+            Definition.objects.filter(meaning_id__in=[meaning.id for meaning in batch])
+            .order_by('id')
+            .values_list('meaning_id', 'definition', 'example')
+        ):
+            contents[meaning_id].append((definition, example))
+        hashes = {meaning.id: meaning_hash(meaning.part_of_speech, contents[meaning.id]) for meaning in batch}
+        canonical = dict(
+            Meaning.objects.filter(content_hash__in=set(hashes.values())).values_list('content_hash', 'id')
+        )
+
+        keep, duplicates, links = [], [], []
+        for meaning in batch:
+            if meaning.word_id != current_word:
+                current_word, position, linked = meaning.word_id, 0, set()
+            digest = hashes[meaning.id]
+            target = canonical.get(digest)
+            if target is None:
+                canonical[digest] = target = meaning.id
+                meaning.content_hash = digest
+                keep.append(meaning)
+            else:
+                duplicates.append(meaning.id)
+                saved['meanings'] += 1
+                saved['definitions'] += len(contents[meaning.id])
+                saved['characters'] += sum(
+                    len(definition) + len(example or '') for definition, example in contents[meaning.id]
+                )
+            if target not in linked:
+                linked.add(target)
+                links.append(WordMeaning(word_id=meaning.word_id, meaning_id=target, position=position))
+                position += 1
+
+        Meaning.objects.bulk_update(keep, ['content_hash'])
+        WordMeaning.objects.bulk_create(links)
+        Definition.objects.filter(meaning_id__in=duplicates).delete()
+        Meaning.objects.filter(id__in=duplicates).delete()
+
+    if saved['meanings']:
+        logger.info(
+            f"Merged {saved['meanings']} duplicate meanings: {saved['definitions']} definition rows "
+            f"and {saved['characters']} characters of text are no longer stored."
+        )
+
+
+def unshare_meanings(apps, schema_editor):
+    """Give every word its own copy of its meanings again"""
+    Meaning = apps.get_model('vocabloom', 'Meaning')
+    Definition = apps.get_model('vocabloom', 'Definition')
+    WordMeaning = apps.get_model('vocabloom', 'WordMeaning')
+
+    owned = set()
+    for link in WordMeaning.objects.order_by('word_id', 'position').iterator():
+        if link.meaning_id not in owned:
+            owned.add(link.meaning_id)
+            Meaning.objects.filter(id=link.meaning_id).update(word_id=link.word_id)
+            continue
+        shared = Meaning.objects.get(id=link.meaning_id)
+        copy = Meaning.objects.create(word_id=link.word_id, part_of_speech=shared.part_of_speech)
+        Definition.objects.bulk_create([
+            Definition(meaning=copy, definition=definition.definition, example=definition.example)
+            for definition in Definition.objects.filter(meaning_id=shared.id).order_by('id')
+        ])
+    Meaning.objects.filter(word__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabloom', '0007_stats_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meaning',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.CreateModel(
+            name='WordMeaning',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('meaning', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='word_links', to='vocabloom.meaning')),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meaning_links', to='vocabloom.word')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='wordmeaning',
+            constraint=models.UniqueConstraint(fields=('word', 'meaning'), name='wordmeaning_word_meaning_unique'),
+        ),
+        # Free the Word.meanings name for the many-to-many field
+        migrations.AlterField(
+            model_name='meaning',
+            name='word',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='vocabloom.word'),
+        ),
+        migrations.AddField(
+            model_name='word',
+            name='meanings',
+            field=models.ManyToManyField(blank=True, related_name='words', through='vocabloom.WordMeaning', to='vocabloom.meaning'),
+        ),
+        # Meaning.word is dropped in 0009: on PostgreSQL the rows deleted here
+        # leave deferred foreign key checks that would block the ALTER TABLE
+        # until this migration's transaction commits
+        migrations.RunPython(share_meanings, unshare_meanings),
+    ]
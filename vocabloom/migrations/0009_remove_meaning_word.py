@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:38
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabloom', '0008_shared_lexicon'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='meaning',
+            name='word',
+        ),
+    ]
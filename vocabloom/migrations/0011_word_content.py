@@ -0,0 +1,90 @@
+# Generated by Django 4.2.23 on 2026-10-19 01:53
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from rest_framework.fields import DateTimeField
+import vocabloom.models
+
+BATCH_SIZE = 500
+
+# Frozen copies of content_service.meaning_item and example_item, so this
+# migration keeps rendering the content it was written for
+_datetime = DateTimeField()
+
+
+def meaning_item(meaning_id, part_of_speech, definitions):
+    return {
+        'id': meaning_id,
+        'part_of_speech': part_of_speech,
+        'definitions': [
+            {'id': definition_id, 'definition': definition, 'example': example}
+            for definition_id, definition, example in definitions
+        ],
+    }
+
+
+def example_item(example_id, example_text, created_at):
+    return {
+        'id': example_id,
+        'example_text': example_text,
+        'created_at': _datetime.to_representation(created_at),
+    }
+
+
+def render_content(apps, schema_editor):
+    """Fill in the content snapshot of every existing word"""
+    Word = apps.get_model('vocabloom', 'Word')
+    WordMeaning = apps.get_model('vocabloom', 'WordMeaning')
+    Definition = apps.get_model('vocabloom', 'Definition')
+    UserExample = apps.get_model('vocabloom', 'UserExample')
+
+    last_id = 0
+    while True:
+        ids = list(Word.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:BATCH_SIZE])
+        if not ids:
+            break
+        last_id = ids[-1]
+
+        contents = {word_id: {'meanings': [], 'user_examples': []} for word_id in ids}
+        links = list(
+            WordMeaning.objects.filter(word_id__in=ids)
+            .order_by('word_id', 'position', 'id')
+            .values_list('word_id', 'meaning_id', 'meaning__part_of_speech')
+        )
+        definitions = defaultdict(list)
+        for meaning_id, *definition in (
+            Definition.objects.filter(meaning_id__in={link[1] for link in links})
+            .order_by('id')
+            .values_list('meaning_id', 'id', 'definition', 'example')
+        ):
+            definitions[meaning_id].append(definition)
+        for word_id, meaning_id, part_of_speech in links:
+            contents[word_id]['meanings'].append(meaning_item(meaning_id, part_of_speech, definitions[meaning_id]))
+        for word_id, *example in (
+            UserExample.objects.filter(word_id__in=ids)
+            .order_by('id')
+            .values_list('word_id', 'id', 'example_text', 'created_at')
+        ):
+            contents[word_id]['user_examples'].append(example_item(*example))
+
+        Word.objects.bulk_update(
+            [Word(id=word_id, content=content) for word_id, content in contents.items()],
+            ['content'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vocabloom', '0010_dictionary_entry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='content',
+            field=models.JSONField(default=vocabloom.models.empty_word_content, editable=False),
+        ),
+        migrations.RunPython(render_content, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,18 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+# ===================================================
+# SOFT DELETE
+# ===================================================
+# Deleting a tag or word only stamps deleted_at; the default manager hides
+# the row from then on, and 'manage.py purge_deleted' removes it (and what
+# hangs off it) later in batches. all_objects still sees every row.
+
+class LiveManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
 
 # ===================================================
 # TAG MODEL
@@ -12,6 +25,18 @@ class Tag(models.Model):
         related_name='tags'
     )
     name = models.CharField(max_length=50)
+    # Rollup kept by StatsService and 'manage.py reconcile_stats'
+    word_count = models.IntegerField(default=0)
+    deleted_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = LiveManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        indexes = [
+            # Only deleted rows are indexed: the purge finds them without a scan
+            models.Index(fields=['deleted_at'], name='tag_deleted_idx', condition=models.Q(deleted_at__isnull=False)),
+        ]
 
     def __str__(self):
         return self.name
@@ -21,6 +46,10 @@ class Tag(models.Model):
 # WORD MODEL
 # ===================================================
 
+def empty_word_content():
+    return {"meanings": [], "user_examples": []}
+
+
 class Word(models.Model):
     user = models.ForeignKey(
         User,
@@ -40,6 +69,37 @@ class Word(models.Model):
     note = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Spaced-repetition state, updated by ReviewService
+    ease = models.FloatField(default=2.5)
+    interval = models.PositiveIntegerField(default=0, help_text="Days until the next review")
+    repetitions = models.PositiveIntegerField(default=0)
+    lapses = models.PositiveIntegerField(default=0)
+    due_at = models.DateTimeField(default=timezone.now)
+    last_reviewed_at = models.DateTimeField(blank=True, null=True)
+
+    meanings = models.ManyToManyField(
+        'Meaning',
+        through='WordMeaning',
+        related_name='words',
+        blank=True
+    )
+    # Rendered meanings and user examples, kept by content_service and
+    # 'manage.py rebuild_word_content' so reads need no joins
+    content = models.JSONField(default=empty_word_content, editable=False)
+    deleted_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = LiveManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        indexes = [
+            # Due cards for a user come from one range scan, already in order
+            models.Index(fields=['user', 'due_at'], name='word_user_due_idx'),
+            # Random sampling seeks through a user's words by id
+            models.Index(fields=['user', 'id'], name='word_user_id_idx'),
+            models.Index(fields=['deleted_at'], name='word_deleted_idx', condition=models.Q(deleted_at__isnull=False)),
+        ]
+
     def __str__(self):
         return self.word
 
@@ -47,17 +107,43 @@ class Word(models.Model):
 # ===================================================
 # MEANING MODEL
 # ===================================================
+# Meanings come from the dictionary API and are the same for every user who
+# saves the word, so they are stored once in a shared lexicon keyed by a hash
+# of their content and linked to words through WordMeaning. Shared rows are
+# never edited in place: a user who changes a word's meanings is linked to
+# rows with the new content instead (see services/lexicon_service.py).
 
 class Meaning(models.Model):
+    part_of_speech = models.CharField(max_length=50, blank=True, null=True)
+    # Set on shared rows; rows without a hash belong to no lexicon entry yet
+    # and are merged by 'manage.py dedupe_lexicon'
+    content_hash = models.CharField(max_length=64, unique=True, blank=True, null=True)
+
+    def __str__(self):
+        return self.part_of_speech or 'Meaning'
+
+
+class WordMeaning(models.Model):
     word = models.ForeignKey(
         Word,
         on_delete=models.CASCADE,
-        related_name='meanings'
+        related_name='meaning_links'
     )
-    part_of_speech = models.CharField(max_length=50, blank=True, null=True)
+    meaning = models.ForeignKey(
+        Meaning,
+        on_delete=models.CASCADE,
+        related_name='word_links'
+    )
+    # Order of the meaning within the word, as the dictionary returned it
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['word', 'meaning'], name='wordmeaning_word_meaning_unique'),
+        ]
 
     def __str__(self):
-        return f"{self.part_of_speech or 'Meaning'} of {self.word.word}"
+        return f"{self.meaning} of {self.word}"
 
 
 # ===================================================
@@ -96,4 +182,129 @@ class UserExample(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"Example for '{self.word.word}': {self.example_text[:50]}..."
\ No newline at end of file
+        return f"Example for '{self.word.word}': {self.example_text[:50]}..."
+
+
+# ===================================================
+# REVIEW LOG MODEL
+# ===================================================
+
+class ReviewLog(models.Model):
+    """One answer from a study session; rows are only ever inserted"""
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='review_logs'
+    )
+    # Kept when the word is deleted so study history stays complete
+    word = models.ForeignKey(
+        Word,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='review_logs'
+    )
+    event_id = models.UUIDField(help_text="Client-generated id; resending an event is a no-op")
+    rating = models.PositiveSmallIntegerField()
+    reviewed_at = models.DateTimeField()
+    # Schedule after this answer was applied
+    interval = models.PositiveIntegerField()
+    ease = models.FloatField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'event_id'], name='reviewlog_user_event_unique'),
+        ]
+
+    def __str__(self):
+        return f"Review {self.event_id} rated {self.rating}"
+
+
+# ===================================================
+# STATISTICS ROLLUP MODELS
+# ===================================================
+# Counters maintained incrementally by StatsService on every write and
+# recomputed from the source tables by 'manage.py reconcile_stats'.
+
+class DailyStats(models.Model):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    date = models.DateField()
+    words_added = models.IntegerField(default=0)
+    examples_added = models.IntegerField(default=0)
+    reviews = models.IntegerField(default=0)
+    reviews_correct = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='dailystats_user_date_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} on {self.date}"
+
+
+class UserStats(models.Model):
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    words = models.IntegerField(default=0)
+    examples = models.IntegerField(default=0)
+    reviews = models.IntegerField(default=0)
+    reviews_correct = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Stats for {self.user}"
+
+
+# ===================================================
+# ACCOUNT DELETION MODEL
+# ===================================================
+
+class AccountDeletion(models.Model):
+    """
+    A closed account waiting for 'manage.py purge_deleted'.
+
+    The user is deactivated when this row is written, which locks them out
+    of every endpoint; the purge then removes their data in batches.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='deletion'
+    )
+    requested_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"Deletion of {self.user}"
+
+
+# ===================================================
+# DICTIONARY CACHE MODEL
+# ===================================================
+# Upstream dictionary answers shared by every user, see
+# services/dictionary_service.py.
+
+class DictionaryEntry(models.Model):
+    # Lowercased, trimmed lookup term
+    term = models.CharField(max_length=100, unique=True)
+    # False records that the dictionary has no such word (negative cache)
+    found = models.BooleanField()
+    # WordSerializer-shaped word, meanings and definitions when found
+    payload = models.JSONField(blank=True, null=True)
+    fetched_at = models.DateTimeField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name_plural = 'dictionary entries'
+
+    def __str__(self):
+        return self.term
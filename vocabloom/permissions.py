@@ -0,0 +1,25 @@
+import ipaddress
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class IsStaffOrAllowedIP(BasePermission):
+    """
+    Staff users, or unauthenticated scrapers calling from METRICS_ALLOWED_IPS.
+
+    Only REMOTE_ADDR is trusted; X-Forwarded-For can be set by anyone.
+    """
+
+    def has_permission(self, request, view):
+        if request.user and request.user.is_staff:
+            return True
+
+        try:
+            address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+        except ValueError:
+            return False
+        return any(
+            address in ipaddress.ip_network(network, strict=False)
+            for network in settings.METRICS_ALLOWED_IPS
+        )
@@ -0,0 +1,99 @@
+"""
+Build-time OpenAPI schema.
+
+`build_schema()` runs the drf-spectacular generator once (at deploy, via
+`manage.py build_schema`) and writes the schema as YAML and JSON under
+SCHEMA_DIR, named by a hash of its content. `built_schema()` loads the
+current files for the schema views, which serve them with an ETag instead
+of introspecting every view and serializer per request.
+"""
+import glob
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+from django.conf import settings
+
+MANIFEST = "manifest.json"
+
+# Spectacular's renderer formats, also used as file extensions
+FORMATS = ("yaml", "json")
+
+
+class BuiltSchema:
+    def __init__(self, version, contents):
+        self.version = version
+        self.contents = contents
+
+    def etag(self, fmt):
+        return f'"{self.version}-{fmt}"'
+
+
+_lock = threading.Lock()
+_cached = {"key": None, "schema": None}
+
+
+def build_schema(schema_dir=None):
+    """Generate the schema and write it to `schema_dir`; return the version"""
+    from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    schema_dir = schema_dir or settings.SCHEMA_DIR
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+
+    rendered = {
+        "yaml": OpenApiYamlRenderer().render(schema, renderer_context={}),
+        "json": OpenApiJsonRenderer().render(schema, renderer_context={}),
+    }
+    version = hashlib.sha256(rendered["json"]).hexdigest()[:16]
+
+    os.makedirs(schema_dir, exist_ok=True)
+    files = {}
+    for extension, content in rendered.items():
+        files[extension] = f"schema.{version}.{extension}"
+        _write(os.path.join(schema_dir, files[extension]), content)
+
+    manifest = {
+        "version": version,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "files": files,
+    }
+    # The manifest goes last so readers never see it point at missing files
+    _write(os.path.join(schema_dir, MANIFEST), json.dumps(manifest, indent=2).encode("utf-8"))
+
+    current = set(files.values())
+    for path in glob.glob(os.path.join(schema_dir, "schema.*.*")):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+    return version
+
+
+def _write(path, content):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as output:
+        output.write(content)
+    os.replace(tmp_path, path)
+
+
+def built_schema():
+    """The schema written by build_schema, or None if it hasn't been built"""
+    manifest_path = os.path.join(settings.SCHEMA_DIR, MANIFEST)
+    try:
+        key = (manifest_path, os.stat(manifest_path).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+
+    with _lock:
+        if _cached["key"] != key:
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+            contents = {}
+            for fmt in FORMATS:
+                with open(os.path.join(settings.SCHEMA_DIR, manifest["files"][fmt]), "rb") as schema_file:
+                    contents[fmt] = schema_file.read()
+            _cached["key"] = key
+            _cached["schema"] = BuiltSchema(manifest["version"], contents)
+        return _cached["schema"]
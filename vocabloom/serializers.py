@@ -1,6 +1,43 @@
+from urllib.parse import urlsplit
+from django.urls import Resolver404, resolve
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import Tag, Word, Meaning, Definition, UserExample
+from .models import Tag, Word, Meaning, Definition, UserExample, DailyStats
+from .services.lexicon_service import meaning_content, set_meanings
+from .services.review_service import RATINGS
+from .timing import timed
+
+
+# ===================================================
+# INSTRUMENTATION
+# ===================================================
+
+class TimedSerializerMixin:
+    """Report top-level serialization time in the Server-Timing header"""
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+class WordContentListSerializer(serializers.ListSerializer):
+    """
+    A nested list read from the word's content snapshot.
+
+    Word.content already holds the list rendered by the child serializer,
+    so it is returned as stored; writes still go through the child.
+    """
+
+    def get_attribute(self, instance):
+        return instance.content[self.field_name]
+
+    def to_representation(self, data):
+        return data
 
 
 # ===================================================
@@ -59,6 +96,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return user
 
 
+class AccountDeletionSerializer(serializers.Serializer):
+    password = serializers.CharField(write_only=True)
+
+    def validate_password(self, value):
+        """Closing an account needs the current password"""
+        if not self.context["request"].user.check_password(value):
+            raise serializers.ValidationError("Password is incorrect")
+        return value
+
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -69,10 +116,11 @@ class UserSerializer(serializers.ModelSerializer):
 # TAG SERIALIZERS
 # ===================================================
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = ["id", "name"]
+        list_serializer_class = TimedListSerializer
 
     def validate_name(self, value):
         """Ensure tag name is unique per user"""
@@ -97,11 +145,12 @@ class TagSerializer(serializers.ModelSerializer):
 # USER EXAMPLE SERIALIZERS
 # ===================================================
 
-class UserExampleSerializer(serializers.ModelSerializer):
+class UserExampleSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = UserExample
         fields = ['id', 'example_text', 'created_at']
         read_only_fields = ['id', 'created_at']
+        list_serializer_class = TimedListSerializer
 
     def validate_example_text(self, value):
         """Validate that example text is not empty"""
@@ -140,9 +189,9 @@ class MeaningSerializer(serializers.ModelSerializer):
 # WORD SERIALIZERS
 # ===================================================
 
-class WordSerializer(serializers.ModelSerializer):
-    meanings = MeaningSerializer(many=True, required=False)
-    user_examples = UserExampleSerializer(many=True, read_only=True)
+class WordSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    meanings = WordContentListSerializer(child=MeaningSerializer(), required=False)
+    user_examples = WordContentListSerializer(child=UserExampleSerializer(), read_only=True)
     tag = serializers.PrimaryKeyRelatedField(
         queryset=Tag.objects.none(), required=False, allow_null=True
     )
@@ -167,6 +216,7 @@ class WordSerializer(serializers.ModelSerializer):
             "note": {"required": False},
             "created_at": {"read_only": True},
         }
+        list_serializer_class = TimedListSerializer
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -205,7 +255,7 @@ class WordSerializer(serializers.ModelSerializer):
 
         request = self.context.get("request")
         if request and hasattr(request, "user"):
-            if value.user != request.user:
+            if value.user_id != request.user.id:
                 raise serializers.ValidationError("Tag does not belong to current user")
 
         return value
@@ -213,21 +263,227 @@ class WordSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         meanings_data = validated_data.pop("meanings", [])
         word = Word.objects.create(**validated_data)
-
-        for meaning_data in meanings_data:
-            definitions_data = meaning_data.pop("definitions", [])
-            meaning = Meaning.objects.create(word=word, **meaning_data)
-
-            for definition_data in definitions_data:
-                Definition.objects.create(meaning=meaning, **definition_data)
+        set_meanings([(word, [meaning_content(data) for data in meanings_data])])
 
         return word
 
     def update(self, instance, validated_data):
-        validated_data.pop("meanings", None)
+        meanings_data = validated_data.pop("meanings", None)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        # Only the sent fields: a full save would write back a content
+        # snapshot another request may have refreshed since it was read
+        instance.save(update_fields=list(validated_data))
+
+        # Sent meanings become this user's own; other users keep theirs
+        if meanings_data is not None:
+            set_meanings([(instance, [meaning_content(data) for data in meanings_data])], replace=True)
 
         return instance
+
+
+WORD_BATCH_MAX_OPERATIONS = 100
+WORD_BATCH_MAX_WORDS = 1000
+WORD_BATCH_OPERATIONS = ["set_tag", "update_note", "delete"]
+
+
+class WordBatchOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=WORD_BATCH_OPERATIONS)
+    words = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=WORD_BATCH_MAX_WORDS
+    )
+    tag = serializers.IntegerField(min_value=1, allow_null=True, required=False, help_text="set_tag: tag id, or null to untag")
+    note = serializers.CharField(allow_blank=True, allow_null=True, required=False, help_text="update_note: the new note")
+
+    def validate(self, data):
+        """Each operation carries the value it sets"""
+        field = {"set_tag": "tag", "update_note": "note"}.get(data["op"])
+        if field and field not in data:
+            raise serializers.ValidationError({field: f"Required for {data['op']}."})
+        return data
+
+
+class WordBatchSerializer(serializers.Serializer):
+    operations = WordBatchOperationSerializer(many=True, allow_empty=False, max_length=WORD_BATCH_MAX_OPERATIONS)
+
+    def validate_operations(self, operations):
+        """Words across all operations are capped, and tags must be the user's own"""
+        if sum(len(operation["words"]) for operation in operations) > WORD_BATCH_MAX_WORDS:
+            raise serializers.ValidationError(f"At most {WORD_BATCH_MAX_WORDS} words per batch.")
+
+        tag_ids = {operation["tag"] for operation in operations if operation.get("tag") is not None}
+        if tag_ids:
+            user = self.context["request"].user
+            unknown = tag_ids - set(Tag.objects.filter(user=user, id__in=tag_ids).values_list("id", flat=True))
+            if unknown:
+                raise serializers.ValidationError(f"Unknown tags: {sorted(unknown)}")
+        return operations
+
+
+class DictionaryWordSerializer(serializers.Serializer):
+    """A dictionary lookup, ready to be sent to POST /api/words/"""
+    word = serializers.CharField()
+    phonetic = serializers.CharField(allow_null=True)
+    audio = serializers.CharField(allow_null=True)
+    meanings = MeaningSerializer(many=True)
+
+
+# ===================================================
+# REVIEW SERIALIZERS
+# ===================================================
+
+REVIEW_BATCH_MAX = 500
+
+
+class ReviewStateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Word
+        fields = ["id", "ease", "interval", "repetitions", "lapses", "due_at", "last_reviewed_at"]
+        read_only_fields = fields
+        list_serializer_class = TimedListSerializer
+
+
+class ReviewCardSerializer(ReviewStateSerializer):
+    meanings = WordContentListSerializer(child=MeaningSerializer(), read_only=True)
+
+    class Meta(ReviewStateSerializer.Meta):
+        fields = [
+            "id",
+            "word",
+            "phonetic",
+            "audio",
+            "note",
+            "tag",
+            "meanings",
+            "ease",
+            "interval",
+            "repetitions",
+            "lapses",
+            "due_at",
+            "last_reviewed_at",
+        ]
+        read_only_fields = fields
+
+
+class ReviewSerializer(serializers.Serializer):
+    event_id = serializers.UUIDField()
+    word = serializers.IntegerField(min_value=1)
+    rating = serializers.ChoiceField(choices=list(RATINGS.items()))
+    reviewed_at = serializers.DateTimeField(required=False)
+
+
+class ReviewBatchSerializer(serializers.Serializer):
+    reviews = ReviewSerializer(many=True, allow_empty=False, max_length=REVIEW_BATCH_MAX)
+
+
+# ===================================================
+# QUIZ SERIALIZERS
+# ===================================================
+
+class QuizWordSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Word
+        fields = ["id", "word", "phonetic", "audio"]
+        read_only_fields = fields
+
+
+class QuizQuestionSerializer(serializers.Serializer):
+    word = QuizWordSerializer(read_only=True)
+    choices = serializers.ListField(child=serializers.CharField(), read_only=True)
+    answer = serializers.IntegerField(read_only=True, help_text="Index of the correct definition in choices")
+
+
+class QuizQuerySerializer(serializers.Serializer):
+    count = serializers.IntegerField(min_value=1, max_value=50, default=10)
+    choices = serializers.IntegerField(min_value=2, max_value=6, default=4)
+    tag = serializers.IntegerField(min_value=1, required=False)
+
+
+# ===================================================
+# STATISTICS SERIALIZERS
+# ===================================================
+
+def accuracy(correct, total):
+    return round(correct / total, 3) if total else None
+
+
+class StatsQuerySerializer(serializers.Serializer):
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
+
+
+class DailyStatsSerializer(serializers.ModelSerializer):
+    accuracy = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DailyStats
+        fields = ["date", "words_added", "examples_added", "reviews", "reviews_correct", "accuracy"]
+        read_only_fields = fields
+
+    def get_accuracy(self, obj) -> float:
+        return accuracy(obj.reviews_correct, obj.reviews)
+
+
+class TagStatsSerializer(serializers.ModelSerializer):
+    words = serializers.IntegerField(source="word_count", read_only=True)
+
+    class Meta:
+        model = Tag
+        fields = ["id", "name", "words"]
+        read_only_fields = fields
+
+
+class StatsTotalsSerializer(serializers.Serializer):
+    words = serializers.IntegerField()
+    untagged_words = serializers.IntegerField()
+    examples = serializers.IntegerField()
+    reviews = serializers.IntegerField()
+    reviews_correct = serializers.IntegerField()
+    accuracy = serializers.FloatField(allow_null=True)
+
+
+class StatsSerializer(serializers.Serializer):
+    totals = StatsTotalsSerializer()
+    daily = DailyStatsSerializer(many=True)
+    tags = TagStatsSerializer(many=True)
+
+
+# ===================================================
+# BATCH SERIALIZERS
+# ===================================================
+
+API_BATCH_MAX_REQUESTS = 20
+# Read-only JSON routes a batch may call (names in vocabloom/urls.py)
+API_BATCH_ROUTES = {
+    "is_authenticated",
+    "tags_list_create",
+    "tag_detail",
+    "words_list_create",
+    "word_detail",
+    "words_by_tag",
+    "user-example-list",
+    "user-example-detail",
+    "review_next",
+    "quiz",
+    "stats",
+}
+
+
+class BatchSubRequestSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=["GET"], default="GET")
+    path = serializers.CharField(help_text="An API path with an optional query string, e.g. /api/words/?limit=5")
+
+    def validate_path(self, value):
+        """The path must resolve to a route that can be batched"""
+        parts = urlsplit(value)
+        try:
+            match = resolve(parts.path)
+        except Resolver404:
+            raise serializers.ValidationError(f"No route for {parts.path}.")
+        if match.url_name not in API_BATCH_ROUTES:
+            raise serializers.ValidationError(f"{parts.path} cannot be batched.")
+        return value
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = BatchSubRequestSerializer(many=True, allow_empty=False, max_length=API_BATCH_MAX_REQUESTS)
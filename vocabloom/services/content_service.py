@@ -0,0 +1,145 @@
+from collections import defaultdict
+
+from django.db import transaction
+from rest_framework.fields import DateTimeField
+
+from ..models import Definition, UserExample, Word, WordMeaning, empty_word_content
+
+# Word.content holds one key per part, rendered the way WordSerializer
+# used to render the nested rows
+CONTENT_PARTS = ("meanings", "user_examples")
+REBUILD_BATCH_SIZE = 500
+
+_datetime = DateTimeField()
+
+
+def meaning_item(meaning_id, part_of_speech, definitions):
+    """One rendered meaning; `definitions` are (id, definition, example) rows"""
+    return {
+        "id": meaning_id,
+        "part_of_speech": part_of_speech,
+        "definitions": [
+            {"id": definition_id, "definition": definition, "example": example}
+            for definition_id, definition, example in definitions
+        ],
+    }
+
+
+def example_item(example_id, example_text, created_at):
+    return {
+        "id": example_id,
+        "example_text": example_text,
+        "created_at": _datetime.to_representation(created_at),
+    }
+
+
+def example_created_at(content):
+    """Creation times of the user examples listed in a word's content"""
+    return [_datetime.to_internal_value(item["created_at"]) for item in content["user_examples"]]
+
+
+def render_contents(word_ids, parts=CONTENT_PARTS):
+    """
+    {word_id: content} rendered from the source tables.
+
+    Only `parts` are filled in. Costs two queries for meanings and one for
+    user examples, whatever the number of words.
+    """
+    contents = {word_id: {part: [] for part in parts} for word_id in word_ids}
+    if not contents:
+        return contents
+
+    if "meanings" in parts:
+        links = list(
+            WordMeaning.objects.filter(word_id__in=contents)
+            .order_by("word_id", "position", "id")
+            .values_list("word_id", "meaning_id", "meaning__part_of_speech")
+        )
+        definitions = defaultdict(list)
+        for meaning_id, *definition in (
+            Definition.objects.filter(meaning_id__in={link[1] for link in links})
+            .order_by("id")
+            .values_list("meaning_id", "id", "definition", "example")
+        ):
+            definitions[meaning_id].append(definition)
+        for word_id, meaning_id, part_of_speech in links:
+            contents[word_id]["meanings"].append(
+                meaning_item(meaning_id, part_of_speech, definitions[meaning_id])
+            )
+
+    if "user_examples" in parts:
+        for word_id, *example in (
+            UserExample.objects.filter(word_id__in=contents)
+            .order_by("id")
+            .values_list("word_id", "id", "example_text", "created_at")
+        ):
+            contents[word_id]["user_examples"].append(example_item(*example))
+
+    return contents
+
+
+def refresh_content(word_ids, parts=CONTENT_PARTS):
+    """
+    Re-render `parts` of the words' content from the source tables.
+
+    Call it in the transaction that changed the nested rows. The words are
+    locked first, so concurrent refreshes of one word apply in turn and each
+    writes what the source tables hold once the other has committed.
+    Returns {word_id: content} for the words that still exist.
+    """
+    # No savepoint: a failure here must undo the caller's changes too
+    with transaction.atomic(savepoint=False):
+        current = dict(
+            Word.objects.select_for_update()
+            .filter(id__in=set(word_ids))
+            .order_by("id")
+            .values_list("id", "content")
+        )
+        if not current:
+            return current
+        for word_id, rendered in render_contents(current, parts).items():
+            current[word_id] = {**empty_word_content(), **current[word_id], **rendered}
+        Word.objects.bulk_update(
+            [Word(id=word_id, content=content) for word_id, content in current.items()],
+            ["content"],
+        )
+    return current
+
+
+# ===================================================
+# MAINTENANCE
+# ===================================================
+
+def _batches(batch_size, queryset=None):
+    """Word ids in keyset-paginated batches"""
+    queryset = Word.objects.all() if queryset is None else queryset
+    last_id = 0
+    while True:
+        ids = list(
+            queryset.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+        last_id = ids[-1]
+        yield ids
+
+
+def find_drift(batch_size=REBUILD_BATCH_SIZE, queryset=None):
+    """Ids of words whose stored content differs from their source rows"""
+    drifted = []
+    for ids in _batches(batch_size, queryset):
+        stored = dict(Word.objects.filter(id__in=ids).values_list("id", "content"))
+        drifted.extend(
+            word_id
+            for word_id, content in render_contents(ids).items()
+            if stored.get(word_id, content) != content
+        )
+    return drifted
+
+
+def rebuild_content(batch_size=REBUILD_BATCH_SIZE, queryset=None):
+    """Re-render every word's content, one transaction per batch; returns how many"""
+    rebuilt = 0
+    for ids in _batches(batch_size, queryset):
+        rebuilt += len(refresh_content(ids))
+    return rebuilt
@@ -0,0 +1,133 @@
+from django.contrib.auth.models import User
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from ..models import (
+    AccountDeletion,
+    DailyStats,
+    ReviewLog,
+    Tag,
+    UserExample,
+    UserStats,
+    Word,
+    WordMeaning,
+)
+
+PURGE_BATCH_SIZE = 500
+
+
+# ===================================================
+# SOFT DELETE
+# ===================================================
+# Each is a single UPDATE: nothing is loaded into Python, whatever the
+# number of rows that hang off what is deleted.
+
+def delete_words(words):
+    """Hide a queryset of words; returns how many"""
+    return words.update(deleted_at=timezone.now())
+
+
+def delete_tag(tag):
+    """
+    Hide a tag and untag its words.
+
+    Untagging is one UPDATE on the tag's index, so words show as untagged
+    at once; only removing the tag row is left to the purge.
+    """
+    with transaction.atomic():
+        Tag.objects.filter(id=tag.id).update(deleted_at=timezone.now())
+        Word.all_objects.filter(tag_id=tag.id).update(tag=None)
+
+
+def delete_account(user):
+    """Deactivate a user, which rejects their tokens, and queue their data for the purge"""
+    with transaction.atomic():
+        # A repeated request keeps the first request time
+        AccountDeletion.objects.bulk_create([AccountDeletion(user=user)], ignore_conflicts=True)
+        User.objects.filter(id=user.id).update(is_active=False)
+
+
+# ===================================================
+# PURGE
+# ===================================================
+
+def raw_delete(model, column, ids):
+    """
+    DELETE ... WHERE column IN (ids) as one statement.
+
+    Unlike QuerySet.delete() no rows are collected first, so no signals are
+    sent and nothing cascades: callers delete dependent rows themselves.
+    """
+    if not ids:
+        return 0
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(model._meta.db_table)} "
+            f"WHERE {quote(column)} IN ({', '.join(['%s'] * len(ids))})",
+            list(ids),
+        )
+        return cursor.rowcount
+
+
+def _id_batches(queryset, batch_size):
+    """Primary keys of `queryset` in batches, for loops that delete what they read"""
+    while True:
+        ids = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+
+
+def purge_words(word_ids):
+    """Physically delete words with their examples and meaning links"""
+    with transaction.atomic():
+        # Study history outlives the word, as with on_delete=SET_NULL
+        ReviewLog.objects.filter(word_id__in=word_ids).update(word=None)
+        raw_delete(UserExample, "word_id", word_ids)
+        raw_delete(WordMeaning, "word_id", word_ids)
+        return raw_delete(Word, "id", word_ids)
+
+
+def purge_tags(tag_ids):
+    with transaction.atomic():
+        # delete_tag untagged these already; catch any word tagged since
+        Word.all_objects.filter(tag_id__in=tag_ids).update(tag=None)
+        return raw_delete(Tag, "id", tag_ids)
+
+
+def purge_account(user_id, batch_size=PURGE_BATCH_SIZE):
+    """Delete everything a closed account owns in batches, then the user"""
+    for ids in _id_batches(Word.all_objects.filter(user_id=user_id), batch_size):
+        purge_words(ids)
+    for model in (ReviewLog, UserExample, DailyStats):
+        for ids in _id_batches(model.objects.filter(user_id=user_id), batch_size):
+            raw_delete(model, "id", ids)
+    for ids in _id_batches(Tag.all_objects.filter(user_id=user_id), batch_size):
+        raw_delete(Tag, "id", ids)
+    raw_delete(UserStats, "user_id", [user_id])
+    # What is left (the deletion marker, auth and token rows) is small, and
+    # deleting the user through the ORM keeps other apps' cascades and signals
+    User.objects.filter(id=user_id).delete()
+
+
+def purge_deleted(older_than=None, batch_size=PURGE_BATCH_SIZE):
+    """
+    Physically remove rows soft-deleted before `older_than` (default: now).
+
+    Each batch is its own transaction, so the purge can be stopped and
+    resumed, and never holds locks for long. Returns how many words, tags
+    and accounts were removed.
+    """
+    cutoff = older_than or timezone.now()
+    result = {"words": 0, "tags": 0, "accounts": 0}
+
+    for ids in _id_batches(Word.all_objects.filter(deleted_at__lte=cutoff), batch_size):
+        result["words"] += purge_words(ids)
+    for ids in _id_batches(Tag.all_objects.filter(deleted_at__lte=cutoff), batch_size):
+        result["tags"] += purge_tags(ids)
+    for user_id in AccountDeletion.objects.filter(requested_at__lte=cutoff).values_list("user_id", flat=True):
+        purge_account(user_id, batch_size)
+        result["accounts"] += 1
+    return result
@@ -0,0 +1,170 @@
+import json
+import logging
+from datetime import timedelta
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .. import metrics
+from ..models import DictionaryEntry, Meaning, Word
+from ..timing import timed
+from .resilience import CircuitBreaker, call_with_deadline
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+TERM_MAX_LENGTH = DictionaryEntry._meta.get_field("term").max_length
+PHONETIC_MAX_LENGTH = Word._meta.get_field("phonetic").max_length
+AUDIO_MAX_LENGTH = Word._meta.get_field("audio").max_length
+PART_OF_SPEECH_MAX_LENGTH = Meaning._meta.get_field("part_of_speech").max_length
+
+# Concurrent lookups of the same term share one upstream request
+single_flight = SingleFlight("dictionary")
+
+# Shared by every DictionaryService in this worker so failures add up
+breaker = CircuitBreaker("dictionary")
+
+
+class DictionaryUnavailable(Exception):
+    """Raised when the upstream failed and nothing cached can stand in"""
+
+
+def normalize_term(term):
+    return " ".join(term.split()).lower()
+
+
+# ===================================================
+# UPSTREAM CLIENTS
+# ===================================================
+# A client's fetch(term) returns the upstream's list of entries in the
+# Free Dictionary API format, None when the word is unknown, and raises on
+# any other failure. DICTIONARY_CLIENT names the class to use.
+
+class FreeDictionaryClient:
+    """dictionaryapi.dev, the service the frontend used to call directly"""
+
+    def fetch(self, term):
+        url = settings.DICTIONARY_API_URL.format(term=quote(term))
+        request = Request(url, headers={"Accept": "application/json"})
+        try:
+            with urlopen(request, timeout=settings.DICTIONARY_TIMEOUT) as response:
+                return json.load(response)
+        except HTTPError as error:
+            if error.code == 404:
+                return None
+            raise
+
+
+class FixtureDictionaryClient:
+    """Entries from a local JSON file keyed by term, for tests and development"""
+
+    _entries = {}
+
+    def fetch(self, term):
+        path = settings.DICTIONARY_FIXTURE_PATH
+        if path not in self._entries:
+            with open(path, encoding="utf-8") as fixture:
+                self._entries[path] = json.load(fixture)
+        return self._entries[path].get(term)
+
+
+def get_client():
+    return import_string(settings.DICTIONARY_CLIENT)()
+
+
+def to_word_payload(term, entries):
+    """Merge upstream entries into the body POST /api/words/ accepts"""
+    phonetic = next((entry["phonetic"] for entry in entries if entry.get("phonetic")), None)
+    sounds = [sound for entry in entries for sound in entry.get("phonetics", [])]
+    phonetic = phonetic or next((sound["text"] for sound in sounds if sound.get("text")), None)
+    audio = next((sound["audio"] for sound in sounds if sound.get("audio")), None)
+
+    meanings = [
+        {
+            "part_of_speech": (meaning.get("partOfSpeech") or "")[:PART_OF_SPEECH_MAX_LENGTH] or None,
+            "definitions": [
+                {"definition": item["definition"], "example": item.get("example") or None}
+                for item in meaning.get("definitions", [])
+                if item.get("definition")
+            ],
+        }
+        for entry in entries
+        for meaning in entry.get("meanings", [])
+    ]
+    return {
+        "word": entries[0].get("word") or term,
+        "phonetic": phonetic[:PHONETIC_MAX_LENGTH] if phonetic else None,
+        "audio": audio if audio and len(audio) <= AUDIO_MAX_LENGTH else None,
+        "meanings": [meaning for meaning in meanings if meaning["definitions"]],
+    }
+
+
+# ===================================================
+# LOOKUP SERVICE
+# ===================================================
+
+class DictionaryService:
+    """
+    Dictionary lookups shared by every user.
+
+    Answers are kept in DictionaryEntry: found words for
+    DICTIONARY_CACHE_TTL seconds, unknown words for the shorter
+    DICTIONARY_NEGATIVE_CACHE_TTL. Misses for the same term are coalesced
+    into one upstream request, and while the upstream is failing an expired
+    entry is served rather than an error.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or get_client()
+
+    def lookup(self, term):
+        """The word payload for `term`, or None when the dictionary doesn't know it"""
+        term = normalize_term(term)
+        entry = DictionaryEntry.objects.filter(term=term).first()
+        fresh = entry is not None and entry.expires_at > timezone.now()
+        metrics.count_cache("dictionary", fresh)
+        if fresh:
+            return entry.payload
+
+        try:
+            return single_flight.do(single_flight.key(term), lambda: self._refresh(term))
+        except Exception as error:
+            if entry is not None:
+                logger.warning(f"Dictionary lookup failed, serving stale entry for '{term}': {error}")
+                return entry.payload
+            logger.error(f"Dictionary lookup failed for '{term}': {error}")
+            raise DictionaryUnavailable(str(error)) from error
+
+    def _refresh(self, term):
+        # Another worker may have stored it while this one waited its turn
+        entry = DictionaryEntry.objects.filter(term=term, expires_at__gt=timezone.now()).first()
+        if entry is not None:
+            return entry.payload
+
+        with timed("dictionary"), metrics.upstream_call("dictionary"):
+            entries = breaker.call(lambda: call_with_deadline(
+                lambda: self.client.fetch(term),
+                settings.DICTIONARY_DEADLINE,
+            ))
+
+        payload = to_word_payload(term, entries) if entries else None
+        ttl = settings.DICTIONARY_CACHE_TTL if payload else settings.DICTIONARY_NEGATIVE_CACHE_TTL
+        now = timezone.now()
+        DictionaryEntry.objects.bulk_create(
+            [DictionaryEntry(
+                term=term,
+                found=payload is not None,
+                payload=payload,
+                fetched_at=now,
+                expires_at=now + timedelta(seconds=ttl),
+            )],
+            update_conflicts=True,
+            unique_fields=["term"],
+            update_fields=["found", "payload", "fetched_at", "expires_at"],
+        )
+        return payload
+
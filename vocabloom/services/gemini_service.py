@@ -1,15 +1,37 @@
-import google.generativeai as genai
 from django.conf import settings
 import logging
 import json
 import re
 
+from .. import metrics
+from ..timing import timed
+from .lazy import LazyModule
+from .resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded, call_with_deadline
+from .single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+# Imported on first use: the SDK pulls in grpc and protobuf
+genai = LazyModule("google.generativeai")
+
+# Identical concurrent generate requests share one Gemini call
+single_flight = SingleFlight("gemini")
+
+# Shared by every GeminiService in this worker so failures add up
+breaker = CircuitBreaker("gemini")
+
 class GeminiService:
     def __init__(self):
         try:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
+            if settings.GEMINI_API_ENDPOINT:
+                # Alternate endpoint (e.g. the benchmark stub) over plain REST
+                genai.configure(
+                    api_key=settings.GEMINI_API_KEY,
+                    transport="rest",
+                    client_options={"api_endpoint": settings.GEMINI_API_ENDPOINT},
+                )
+            else:
+                genai.configure(api_key=settings.GEMINI_API_KEY)
             self.model = genai.GenerativeModel(model_name="gemini-1.5-flash")
         except Exception as e:
             logger.error(f"Failed to initialize Gemini: {e}")
@@ -23,14 +45,28 @@ class GeminiService:
         if not self.model:
             return {"error": "Gemini service not available"}
 
+        return single_flight.do(
+            single_flight.key(word, context, difficulty_level),
+            lambda: self._generate_user_example(word, context, difficulty_level),
+            share_if=lambda result: result.get("success"),
+        )
+
+    def _generate_user_example(self, word, context, difficulty_level):
         try:
             # Construct the prompt
             prompt = self._build_prompt(word, context, difficulty_level)
             
             logger.info(f"Generating example for word: '{word}' with Gemini")
             
-            # Generate content
-            response = self.model.generate_content(prompt)
+            # Generate content, failing fast while Gemini is unhealthy
+            with timed("gemini"), metrics.upstream_call("gemini"):
+                response = breaker.call(lambda: call_with_deadline(
+                    lambda: self.model.generate_content(
+                        prompt, request_options={"timeout": settings.GEMINI_TIMEOUT}
+                    ),
+                    settings.GEMINI_DEADLINE,
+                    hedge_after=settings.GEMINI_HEDGE_AFTER,
+                ))
             
             if not response.text:
                 return {"error": "No response generated"}
@@ -47,6 +83,9 @@ class GeminiService:
                 "word": word
             }
             
+        except (CircuitOpenError, DeadlineExceeded) as e:
+            logger.error(f"Gemini unavailable: {e}")
+            return {"error": "AI service is temporarily unavailable", "unavailable": True}
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
             return {"error": f"Failed to generate example: {str(e)}"}
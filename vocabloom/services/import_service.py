@@ -0,0 +1,262 @@
+import csv
+import html
+import io
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import zipfile
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from ..models import Tag, Word, Meaning
+from .lexicon_service import set_meanings
+from .stats_service import StatsService
+
+logger = logging.getLogger(__name__)
+
+# Anki packs note fields into one column separated by the unit separator
+ANKI_FIELD_SEPARATOR = "\x1f"
+ANKI_COLLECTION_NAMES = ("collection.anki21", "collection.anki2")
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# CSV header aliases -> normalized column name
+CSV_COLUMNS = {
+    "word": "word",
+    "front": "word",
+    "term": "word",
+    "definition": "definition",
+    "back": "definition",
+    "meaning": "definition",
+    "example": "example",
+    "part_of_speech": "part_of_speech",
+    "phonetic": "phonetic",
+    "note": "note",
+    "tag": "tag",
+    "tags": "tag",
+}
+
+WORD_MAX_LENGTH = Word._meta.get_field("word").max_length
+PHONETIC_MAX_LENGTH = Word._meta.get_field("phonetic").max_length
+PART_OF_SPEECH_MAX_LENGTH = Meaning._meta.get_field("part_of_speech").max_length
+TAG_MAX_LENGTH = Tag._meta.get_field("name").max_length
+
+
+class DeckImportError(Exception):
+    """Raised when an uploaded deck cannot be read at all"""
+
+
+def clean_field(value):
+    """Turn an Anki/CSV field into plain text"""
+    if not value:
+        return ""
+    value = re.sub(r"\[sound:[^\]]*\]", "", value)
+    value = re.sub(r"<br\s*/?>|</div>|</p>", "\n", value, flags=re.IGNORECASE)
+    value = re.sub(r"<[^>]+>", "", value)
+    # PostgreSQL rejects NUL in text columns
+    value = html.unescape(value).replace("\xa0", " ").replace("\x00", "")
+    lines = [line.strip() for line in value.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+class DeckImportService:
+    """
+    Import Anki packages (.apkg) and CSV/TSV decks into a user's vocabulary.
+
+    Cards are parsed one at a time and written in batches, each batch in its
+    own transaction, so a large deck never sits in memory as a whole.
+    """
+
+    def __init__(self, user, batch_size=500):
+        self.user = user
+        self.batch_size = batch_size
+        # Lower-cased words the user already has (or that this import added)
+        self.known_words = set(
+            Word.objects.filter(user=user)
+            .annotate(word_lower=Lower("word"))
+            .values_list("word_lower", flat=True)
+        )
+        self.tags = {tag.name.lower(): tag for tag in Tag.objects.filter(user=user)}
+        self.stats = {"rows": 0, "created": 0, "merged": 0, "duplicates": 0, "skipped": 0}
+
+    def import_file(self, fileobj, filename):
+        """Import a deck, picking the parser from the file extension"""
+        extension = os.path.splitext(filename or "")[1].lower()
+        if extension == ".apkg":
+            records = self._read_apkg(fileobj)
+        elif extension in (".csv", ".tsv", ".txt"):
+            delimiter = "," if extension == ".csv" else "\t"
+            records = self._read_csv(fileobj, delimiter)
+        else:
+            raise DeckImportError("Unsupported file type. Upload an .apkg, .csv, .tsv or .txt deck.")
+
+        return self.import_records(records)
+
+    def import_records(self, records):
+        """Write parsed card records to the database in batches"""
+        started = time.monotonic()
+        batch = {}
+
+        for record in records:
+            self.stats["rows"] += 1
+            word_text = record.get("word", "")
+            key = word_text.lower()
+
+            if not word_text or len(word_text) > WORD_MAX_LENGTH:
+                self.stats["skipped"] += 1
+                continue
+
+            if key in batch:
+                # Same word on consecutive rows (e.g. one row per definition)
+                self._add_definition(batch[key], record)
+                self.stats["merged"] += 1
+                continue
+
+            if key in self.known_words:
+                self.stats["duplicates"] += 1
+                continue
+
+            self.known_words.add(key)
+            batch[key] = self._new_entry(record)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = {}
+
+        if batch:
+            self._flush(batch)
+
+        elapsed = time.monotonic() - started
+        report = dict(self.stats)
+        report["elapsed_seconds"] = round(elapsed, 3)
+        report["rows_per_second"] = round(self.stats["rows"] / elapsed, 1) if elapsed else None
+        logger.info(f"Imported deck for user {self.user.pk}: {report}")
+        return report
+
+    # ----------- PARSERS -----------
+
+    def _read_csv(self, fileobj, delimiter):
+        text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+        try:
+            # Skip Anki's "#separator:tab" style header lines
+            lines = (line for line in text if not line.startswith("#"))
+            reader = csv.reader(lines, delimiter=delimiter)
+
+            first = next(reader, None)
+            if first is None:
+                return
+            header = [CSV_COLUMNS.get(column.strip().lower()) for column in first]
+            if "word" not in header:
+                # No header row: treat columns as front, back, tags like Anki does
+                header = ["word", "definition", "tag"]
+                yield self._record(header, first)
+
+            for row in reader:
+                yield self._record(header, row)
+        except UnicodeDecodeError:
+            raise DeckImportError("The deck is not UTF-8 text. Save it as UTF-8 and upload it again.")
+        except csv.Error as error:
+            raise DeckImportError(f"The deck could not be read at line {reader.line_num}: {error}.")
+        finally:
+            # Don't let the wrapper close the caller's file
+            text.detach()
+
+    def _read_apkg(self, fileobj):
+        try:
+            package = zipfile.ZipFile(fileobj)
+        except zipfile.BadZipFile:
+            raise DeckImportError("The .apkg file is not a valid Anki package.")
+
+        names = set(package.namelist())
+        collection = next((name for name in ANKI_COLLECTION_NAMES if name in names), None)
+        if collection is None:
+            raise DeckImportError("The Anki package has no readable collection. Export it with 'Support older Anki versions' enabled.")
+
+        limit = settings.IMPORT_MAX_COLLECTION_BYTES
+        too_large = DeckImportError(f"The Anki collection is larger than {limit:,} bytes once unpacked.")
+        if package.getinfo(collection).file_size > limit:
+            raise too_large
+
+        # sqlite3 needs a real file, so stream the collection out of the zip.
+        # The declared size can lie, so the copy is capped as well.
+        with tempfile.NamedTemporaryFile(suffix=".anki2") as db_file:
+            with package.open(collection) as source:
+                copied = 0
+                while chunk := source.read(COPY_CHUNK_SIZE):
+                    copied += len(chunk)
+                    if copied > limit:
+                        raise too_large
+                    db_file.write(chunk)
+            db_file.flush()
+
+            connection = sqlite3.connect(db_file.name)
+            try:
+                cursor = connection.execute("SELECT flds, tags FROM notes ORDER BY id")
+                for fields, tags in cursor:
+                    fields = fields.split(ANKI_FIELD_SEPARATOR)
+                    yield {
+                        "word": clean_field(fields[0]),
+                        "definition": clean_field(fields[1]) if len(fields) > 1 else "",
+                        "tag": tags.split()[0] if tags.split() else "",
+                    }
+            except sqlite3.DatabaseError:
+                raise DeckImportError("The Anki collection could not be read.")
+            finally:
+                connection.close()
+
+    def _record(self, header, row):
+        record = {}
+        for column, value in zip(header, row):
+            if column:
+                record[column] = clean_field(value)
+        return record
+
+    # ----------- WRITES -----------
+
+    def _new_entry(self, record):
+        entry = {
+            "word": Word(
+                user=self.user,
+                word=record["word"],
+                phonetic=record.get("phonetic", "")[:PHONETIC_MAX_LENGTH] or None,
+                note=record.get("note") or None,
+                tag=self._get_tag(record.get("tag", "")),
+            ),
+            "meanings": {},
+        }
+        self._add_definition(entry, record)
+        return entry
+
+    def _add_definition(self, entry, record):
+        definition = record.get("definition")
+        if not definition:
+            return
+        part_of_speech = record.get("part_of_speech", "")[:PART_OF_SPEECH_MAX_LENGTH] or None
+        entry["meanings"].setdefault(part_of_speech, []).append(
+            (definition, record.get("example") or None)
+        )
+
+    def _get_tag(self, name):
+        # Anki tags use underscores for spaces and "::" for hierarchy
+        name = name.split("::")[-1].replace("_", " ").strip()[:TAG_MAX_LENGTH]
+        if not name:
+            return None
+        key = name.lower()
+        if key not in self.tags:
+            self.tags[key] = Tag.objects.create(user=self.user, name=name)
+        return self.tags[key]
+
+    def _flush(self, batch):
+        entries = list(batch.values())
+        with transaction.atomic():
+            words = Word.objects.bulk_create([entry["word"] for entry in entries])
+            # Meanings other users already saved are reused from the lexicon
+            set_meanings([
+                (word, list(entry["meanings"].items()))
+                for word, entry in zip(words, entries)
+            ])
+            StatsService(self.user).words_added(words)
+        self.stats["created"] += len(words)
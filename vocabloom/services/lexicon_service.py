@@ -0,0 +1,191 @@
+import hashlib
+import json
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch, Sum
+from django.db.models.functions import Coalesce, Length
+
+from ..models import Definition, Meaning, WordMeaning
+from .content_service import refresh_content
+
+# Another request may add the same meaning between our lookup and insert
+INTERN_ATTEMPTS = 3
+MERGE_BATCH_SIZE = 1000
+
+
+def meaning_content(data):
+    """(part_of_speech, [(definition, example), ...]) from MeaningSerializer data"""
+    return (
+        data.get("part_of_speech"),
+        [(item["definition"], item.get("example")) for item in data.get("definitions", [])],
+    )
+
+
+def meaning_hash(part_of_speech, definitions):
+    """Lexicon key of a meaning: a SHA-256 of its normalized content"""
+    payload = [part_of_speech or None, [[definition, example or None] for definition, example in definitions]]
+    return hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def intern(contents):
+    """
+    Shared Meaning ids for a list of (part_of_speech, definitions) contents.
+
+    Content already in the lexicon is reused; the rest is inserted with its
+    definitions. Costs one lookup plus two inserts whatever the list size.
+    """
+    wanted = {meaning_hash(*content): content for content in contents}
+    ids = {}
+    for attempt in range(INTERN_ATTEMPTS):
+        missing = [digest for digest in wanted if digest not in ids]
+        if not missing:
+            break
+        ids.update(Meaning.objects.filter(content_hash__in=missing).values_list("content_hash", "id"))
+        missing = [digest for digest in missing if digest not in ids]
+        if not missing:
+            break
+        try:
+            with transaction.atomic():
+                created = Meaning.objects.bulk_create([
+                    Meaning(part_of_speech=wanted[digest][0] or None, content_hash=digest)
+                    for digest in missing
+                ])
+                Definition.objects.bulk_create([
+                    Definition(meaning=meaning, definition=definition, example=example or None)
+                    for meaning in created
+                    for definition, example in wanted[meaning.content_hash][1]
+                ])
+        except IntegrityError:
+            # Lost a race on content_hash; the next lookup finds the winner's rows
+            if attempt == INTERN_ATTEMPTS - 1:
+                raise
+            continue
+        ids.update((meaning.content_hash, meaning.id) for meaning in created)
+    return [ids[meaning_hash(*content)] for content in contents]
+
+
+def set_meanings(words_with_contents, replace=False):
+    """
+    Link words to the shared meanings for their contents, in order, and
+    re-render the words' content to match.
+
+    `words_with_contents` is a list of (word, [content, ...]) pairs. With
+    `replace` the words' current links are dropped first, which is how a
+    user overrides a word's meanings: the shared rows other users read are
+    never modified, the word just points at different ones.
+    """
+    ids = iter(intern([content for _, contents in words_with_contents for content in contents]))
+    links = []
+    for word, contents in words_with_contents:
+        # dict.fromkeys drops a meaning repeated within one word, keeping order
+        meaning_ids = dict.fromkeys(next(ids) for _ in contents)
+        links.extend(
+            WordMeaning(word=word, meaning_id=meaning_id, position=position)
+            for position, meaning_id in enumerate(meaning_ids)
+        )
+    words = [word for word, _ in words_with_contents]
+    with transaction.atomic(savepoint=False):
+        if replace:
+            WordMeaning.objects.filter(word__in=words).delete()
+        WordMeaning.objects.bulk_create(links)
+        contents = refresh_content([word.id for word in words], parts=("meanings",))
+    for word in words:
+        word.content = contents[word.id]
+
+
+# ===================================================
+# MAINTENANCE
+# ===================================================
+
+def merge_unhashed(batch_size=MERGE_BATCH_SIZE):
+    """
+    Bring meanings written around intern() into the lexicon.
+
+    Rows without a content hash (added in the admin or by raw inserts) get
+    one, or are merged into the shared row that already has their content:
+    their words are relinked and the duplicate rows deleted.
+    """
+    result = {"hashed": 0, "merged": 0, "definitions": 0}
+    while True:
+        batch = list(
+            Meaning.objects.filter(content_hash__isnull=True)
+            .order_by("id")
+            .prefetch_related(Prefetch("definitions", queryset=Definition.objects.order_by("id")))[:batch_size]
+        )
+        if not batch:
+            return result
+
+        hashes = {
+            meaning.id: meaning_hash(
+                meaning.part_of_speech,
+                [(item.definition, item.example) for item in meaning.definitions.all()],
+            )
+            for meaning in batch
+        }
+        canonical = dict(
+            Meaning.objects.filter(content_hash__in=set(hashes.values())).values_list("content_hash", "id")
+        )
+        keep, duplicates = [], {}
+        for meaning in batch:
+            digest = hashes[meaning.id]
+            if digest in canonical:
+                duplicates[meaning.id] = canonical[digest]
+                result["definitions"] += len(meaning.definitions.all())
+            else:
+                canonical[digest] = meaning.id
+                meaning.content_hash = digest
+                keep.append(meaning)
+
+        with transaction.atomic():
+            Meaning.objects.bulk_update(keep, ["content_hash"])
+            relinked = _relink(duplicates)
+            Meaning.objects.filter(id__in=duplicates).delete()
+            refresh_content(relinked, parts=("meanings",))
+        result["hashed"] += len(keep)
+        result["merged"] += len(duplicates)
+
+
+def _relink(duplicates):
+    """Point the links of duplicate meaning ids at their canonical ids; returns the words touched"""
+    if not duplicates:
+        return set()
+    links = list(WordMeaning.objects.filter(meaning_id__in=[*duplicates, *duplicates.values()]))
+    taken = {(link.word_id, link.meaning_id) for link in links if link.meaning_id not in duplicates}
+    touched = {link.word_id for link in links if link.meaning_id in duplicates}
+    moved = []
+    for link in links:
+        target = duplicates.get(link.meaning_id)
+        # A word that already has the canonical meaning just loses the
+        # duplicate link, which goes with the duplicate row
+        if target is None or (link.word_id, target) in taken:
+            continue
+        taken.add((link.word_id, target))
+        link.meaning_id = target
+        moved.append(link)
+    WordMeaning.objects.bulk_update(moved, ["meaning"])
+    return touched
+
+
+def prune_orphans():
+    """Delete meanings no word links to any more; returns how many"""
+    _, deleted = Meaning.objects.filter(word_links__isnull=True).delete()
+    return deleted.get(Meaning._meta.label, 0)
+
+
+def storage_report():
+    """Rows and definition text stored, against what per-word copies would need"""
+    text = Length("definition") + Coalesce(Length("example"), 0)
+    linked_text = Length("meaning__definitions__definition") + Coalesce(Length("meaning__definitions__example"), 0)
+    stored = Definition.objects.aggregate(definitions=Count("id"), characters=Coalesce(Sum(text), 0))
+    linked = WordMeaning.objects.aggregate(
+        meanings=Count("id", distinct=True),
+        definitions=Count("meaning__definitions"),
+        characters=Coalesce(Sum(linked_text), 0),
+    )
+    return {
+        "meanings": {"stored": Meaning.objects.count(), "linked": linked["meanings"]},
+        "definitions": {"stored": stored["definitions"], "linked": linked["definitions"]},
+        "characters": {"stored": stored["characters"], "linked": linked["characters"]},
+    }
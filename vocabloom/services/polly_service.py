@@ -1,11 +1,27 @@
-import boto3
 import base64
+from xml.sax.saxutils import escape
 from django.conf import settings
-from botocore.exceptions import BotoCoreError, ClientError
 import logging
 
+from .. import metrics
+from ..timing import timed
+from .lazy import LazyModule
+from .resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded, call_with_deadline
+from .single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+# Imported on first use: boto3 alone adds a noticeable chunk to worker boot
+boto3 = LazyModule("boto3")
+botocore_config = LazyModule("botocore.config")
+botocore_exceptions = LazyModule("botocore.exceptions")
+
+# Identical concurrent requests (a class opening the same word list) share one Polly call
+single_flight = SingleFlight("polly")
+
+# Shared by every PollyService in this worker so failures add up
+breaker = CircuitBreaker("polly")
+
 
 class PollyService:
 
@@ -15,26 +31,55 @@ class PollyService:
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION,
+            endpoint_url=settings.POLLY_ENDPOINT_URL,
+            config=botocore_config.Config(
+                connect_timeout=settings.POLLY_CONNECT_TIMEOUT,
+                read_timeout=settings.POLLY_READ_TIMEOUT,
+                retries={"max_attempts": 2, "mode": "standard"},
+            ),
         )
 
-    def text_to_speech(self, text, voice_id="Joanna", output_format="mp3", speed="90%"):
-        try:
-            # Validate input
-            if not text or not text.strip():
-                return {"error": "Text cannot be empty"}
+    def synthesize(self, text, voice_id="Joanna", output_format="mp3", speed="90%"):
+        """
+        Return the raw audio bytes for `text`; Polly errors propagate.
 
-            logger.info(
-                f"Converting text to speech: '{text[:50]}...' with voice {voice_id}"
-            )
+        Runs behind the Polly circuit breaker and within POLLY_DEADLINE.
+        """
+        with timed("polly"), metrics.upstream_call("polly"):
+            return breaker.call(lambda: call_with_deadline(
+                lambda: self._synthesize(text, voice_id, output_format, speed),
+                settings.POLLY_DEADLINE,
+                hedge_after=settings.POLLY_HEDGE_AFTER,
+            ))
 
-            ssml_text = f'<speak><prosody rate="{speed}">{text}</prosody></speak>'
+    def _synthesize(self, text, voice_id, output_format, speed):
+        logger.info(
+            f"Converting text to speech: '{text[:50]}...' with voice {voice_id}"
+        )
 
-            response = self.polly_client.synthesize_speech(
-                Text=ssml_text, TextType="ssml", OutputFormat=output_format, VoiceId=voice_id
-            )
+        ssml_text = f'<speak><prosody rate="{speed}">{escape(text)}</prosody></speak>'
 
-            # Read audio stream
-            audio_stream = response["AudioStream"].read()
+        response = self.polly_client.synthesize_speech(
+            Text=ssml_text, TextType="ssml", OutputFormat=output_format, VoiceId=voice_id
+        )
+
+        # Read audio stream
+        return response["AudioStream"].read()
+
+    def text_to_speech(self, text, voice_id="Joanna", output_format="mp3", speed="90%"):
+        # Validate input
+        if not text or not text.strip():
+            return {"error": "Text cannot be empty"}
+
+        return single_flight.do(
+            single_flight.key(text, voice_id, output_format, speed),
+            lambda: self._text_to_speech(text, voice_id, output_format, speed),
+            share_if=lambda result: result.get("success"),
+        )
+
+    def _text_to_speech(self, text, voice_id, output_format, speed):
+        try:
+            audio_stream = self.synthesize(text, voice_id, output_format, speed)
 
             # Convert to base64 for easy transmission
             audio_base64 = base64.b64encode(audio_stream).decode("utf-8")
@@ -45,7 +90,10 @@ class PollyService:
                 "content_type": f"audio/{output_format}",
             }
 
-        except (BotoCoreError, ClientError) as error:
+        except (CircuitOpenError, DeadlineExceeded) as error:
+            logger.error(f"Polly unavailable: {error}")
+            return {"error": "Audio service is temporarily unavailable", "unavailable": True}
+        except (botocore_exceptions.BotoCoreError, botocore_exceptions.ClientError) as error:
             logger.error(f"Polly error: {error}")
             return {"error": f"AWS Polly error: {str(error)}"}
         except Exception as error:
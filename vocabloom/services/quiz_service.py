@@ -0,0 +1,139 @@
+import math
+import random
+
+from django.db.models import Count, Max, Min
+
+from ..models import Word
+
+# Candidate id draws before falling back to reading the id list
+MAX_ROUNDS = 3
+# Extra candidates per draw, so one round is usually enough
+OVERSAMPLE = 2
+MAX_DRAWS = 1000
+
+
+def word_definitions(content):
+    """Every definition text in a word's content snapshot"""
+    return [
+        definition["definition"]
+        for meaning in content["meanings"]
+        for definition in meaning["definitions"]
+    ]
+
+
+class IdSampler:
+    """
+    Draw uniformly random rows of a queryset without ORDER BY RANDOM().
+
+    Random points are drawn from the [min, max] id range and looked up
+    exactly with `id IN (...)` on the (user, id) index. A point only counts
+    when it lands on a matching id, so every row is equally likely however
+    the ids are spread (seeking to the next id instead would favour a word
+    by the gap before it, and ids come from one sequence shared by all
+    users). When the ids are too sparse for a few rounds of points to find
+    enough rows, or the rounds come up short, the matching ids are read from
+    the index and sampled in Python, so the number of queries is bounded
+    whatever the vocabulary size.
+    """
+
+    def __init__(self, queryset, rng=None):
+        self.queryset = queryset
+        self.rng = rng or random.Random()
+        bounds = queryset.aggregate(low=Min("id"), high=Max("id"), total=Count("id"))
+        self.low, self.high, self.total = bounds["low"], bounds["high"], bounds["total"]
+
+    def sample(self, k, exclude=()):
+        exclude = set(exclude)
+        wanted = min(k, self.total - len(exclude))
+        if wanted <= 0:
+            return []
+
+        found = []
+        for _ in range(MAX_ROUNDS):
+            needed = wanted - len(found)
+            draws = self._draws(needed)
+            if draws is None:
+                break
+            hits, exhausted = self._draw(draws)
+            hits = [word_id for word_id in hits if word_id not in exclude and word_id not in found]
+            self.rng.shuffle(hits)
+            found.extend(hits[:needed])
+            if len(found) >= wanted or exhausted:
+                return found
+
+        remaining = [
+            word_id for word_id in self.queryset.values_list("id", flat=True)
+            if word_id not in exclude and word_id not in found
+        ]
+        return found + self.rng.sample(remaining, min(wanted - len(found), len(remaining)))
+
+    def _draws(self, needed):
+        """Points for one round, or None when MAX_DRAWS can't be expected to find enough"""
+        span = self.high - self.low + 1
+        draws = math.ceil(needed * span / self.total * OVERSAMPLE) + 10
+        if draws > MAX_DRAWS and span > MAX_DRAWS:
+            return None
+        return min(span, draws)
+
+    def _draw(self, draws):
+        """Ids hit by `draws` distinct random points, and whether every id was tried"""
+        span = self.high - self.low + 1
+        candidates = [self.low + offset for offset in self.rng.sample(range(span), draws)]
+        hits = list(self.queryset.filter(id__in=candidates).values_list("id", flat=True))
+        return hits, draws == span
+
+
+class QuizService:
+    """
+    Multiple-choice quizzes over a user's vocabulary.
+
+    Each question is a word with its correct definition and distractor
+    definitions taken from other randomly sampled words of the same user.
+    """
+
+    def __init__(self, user, rng=None):
+        self.user = user
+        self.rng = rng or random.Random()
+
+    def build(self, count, choices=4, tag_id=None):
+        vocabulary = Word.objects.filter(user=self.user)
+        pool = vocabulary.filter(tag_id=tag_id) if tag_id is not None else vocabulary
+        pool_sampler = IdSampler(pool, self.rng)
+        vocabulary_sampler = pool_sampler if tag_id is None else IdSampler(vocabulary, self.rng)
+
+        # Oversample: words without any definition can't be asked
+        question_ids = pool_sampler.sample(count * 2)
+        words = (
+            Word.objects.filter(id__in=question_ids)
+            .only("id", "word", "phonetic", "audio", "content")
+        )
+        questions = []
+        for word in words:
+            definitions = word_definitions(word.content)
+            if definitions:
+                questions.append((word, self.rng.choice(definitions)))
+        self.rng.shuffle(questions)
+        questions = questions[:count]
+
+        distractors = self._distractors(
+            vocabulary_sampler,
+            len(questions) * (choices - 1),
+            exclude=[word.id for word, _ in questions],
+        )
+
+        result = []
+        for word, correct in questions:
+            # Distractors may repeat across questions, never within one
+            wrong = [text for text in distractors if text != correct]
+            options = [correct, *self.rng.sample(wrong, min(choices - 1, len(wrong)))]
+            self.rng.shuffle(options)
+            result.append({"word": word, "choices": options, "answer": options.index(correct)})
+        return result
+
+    def _distractors(self, sampler, k, exclude):
+        """Distinct definitions, one from each of up to k other random words"""
+        # Oversample again for words without definitions
+        word_ids = sampler.sample(k * 2, exclude=exclude)
+        contents = Word.objects.filter(id__in=word_ids).values_list("content", flat=True)
+        definitions = [word_definitions(content) for content in contents]
+        return list({self.rng.choice(texts) for texts in definitions if texts})
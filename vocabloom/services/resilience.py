@@ -0,0 +1,161 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Every breaker by name, so their state can be reported
+breakers = {}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose breaker is open"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an upstream call does not finish within its deadline"""
+
+
+def is_upstream_failure(error):
+    """
+    Whether an exception says something about the upstream's health.
+
+    Client mistakes (4xx other than throttling) are the caller's problem
+    and must not open the breaker.
+    """
+    status = getattr(error, "code", None)
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", status)
+    if isinstance(status, int) and 400 <= status < 500 and status != 429:
+        return False
+    return True
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an upstream is unhealthy.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    calls raise CircuitOpenError without touching the upstream. Once
+    `reset_timeout` seconds have passed a single trial call is let through
+    (half open); its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, name, failure_threshold=None, reset_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout or settings.CIRCUIT_BREAKER_RESET_TIMEOUT
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        breakers[name] = self
+
+    def call(self, fn):
+        self._before_call()
+        try:
+            result = fn()
+        except Exception as error:
+            if is_upstream_failure(error):
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        self._record_success()
+        return result
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "opened_at": self.opened_at,
+            }
+
+    def _before_call(self):
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                self._set_state(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self.trial_in_flight:
+                    raise CircuitOpenError(f"{self.name} circuit is half open")
+                self.trial_in_flight = True
+
+    def _record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.trial_in_flight = False
+            if self.state != CLOSED:
+                self._set_state(CLOSED)
+                self.opened_at = None
+
+    def _record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._set_state(OPEN)
+                self.opened_at = time.monotonic()
+
+    def _set_state(self, state):
+        if state != self.state:
+            logger.warning(f"Circuit breaker '{self.name}': {self.state} -> {state}")
+            self.state = state
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.UPSTREAM_MAX_WORKERS,
+                thread_name_prefix="upstream",
+            )
+    return _executor
+
+
+def call_with_deadline(fn, timeout, hedge_after=None):
+    """
+    Run `fn()` and give up after `timeout` seconds.
+
+    With `hedge_after`, a second identical attempt starts if the first has
+    not finished by then, and whichever succeeds first wins. Only use it
+    for idempotent calls.
+    """
+    deadline = time.monotonic() + timeout
+    pending = {_get_executor().submit(fn)}
+
+    if hedge_after is not None and hedge_after < timeout:
+        done, _ = wait(pending, timeout=hedge_after)
+        if not done:
+            logger.info("Upstream call is slow, sending a hedged request")
+            pending.add(_get_executor().submit(fn))
+
+    error = None
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+
+    if not pending and error is not None:
+        raise error
+    raise DeadlineExceeded(f"Upstream call exceeded its {timeout}s deadline")
@@ -0,0 +1,146 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import ReviewLog, Word
+
+# Answer ratings, as in Anki
+AGAIN, HARD, GOOD, EASY = 1, 2, 3, 4
+RATINGS = {AGAIN: "again", HARD: "hard", GOOD: "good", EASY: "easy"}
+
+MIN_EASE = 1.3
+EASY_BONUS = 1.3
+HARD_FACTOR = 1.2
+MAX_INTERVAL_DAYS = 36500
+# A forgotten card comes back later in the same session
+RELEARN_DELAY = timedelta(minutes=10)
+
+STATE_FIELDS = ["ease", "interval", "repetitions", "lapses", "due_at", "last_reviewed_at"]
+
+
+def schedule(word, rating, reviewed_at):
+    """
+    Apply one answer to a word's review state (SM-2 with Anki's ratings).
+
+    Good answers grow the interval 1 day, 6 days, then by the word's ease;
+    Hard grows it slowly, Easy adds a bonus, and Again resets the card.
+    The word is updated in place and not saved.
+    """
+    if rating == AGAIN:
+        word.repetitions = 0
+        word.lapses += 1
+        word.interval = 0
+        word.ease = max(MIN_EASE, word.ease - 0.2)
+        word.due_at = reviewed_at + RELEARN_DELAY
+    else:
+        if rating == HARD:
+            interval = max(1, round(word.interval * HARD_FACTOR))
+            word.ease = max(MIN_EASE, word.ease - 0.15)
+        elif word.repetitions == 0:
+            interval = 1
+        elif word.repetitions == 1:
+            interval = 6
+        else:
+            interval = round(word.interval * word.ease)
+
+        if rating == EASY:
+            interval = round(max(interval, 1) * EASY_BONUS)
+            word.ease += 0.15
+
+        word.repetitions += 1
+        word.interval = min(interval, MAX_INTERVAL_DAYS)
+        word.due_at = reviewed_at + timedelta(days=word.interval)
+    word.last_reviewed_at = reviewed_at
+
+
+class ReviewService:
+    """
+    Spaced-repetition queue for one user.
+
+    Review state lives on Word, and the (user, due_at) index makes the due
+    queue a single range scan however many words the user has.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    def due(self, limit, now=None):
+        """The user's most overdue words, oldest due date first"""
+        now = now or timezone.now()
+        return Word.objects.filter(user=self.user, due_at__lte=now).order_by("due_at")[:limit]
+
+    def record(self, reviews):
+        """
+        Log and apply a batch of answers.
+
+        Each answer is {"event_id": uuid, "word": id, "rating": n,
+        "reviewed_at": dt}. Events already logged (retries) are ignored, and
+        answers for words the user doesn't have are skipped. The rest are
+        logged, then applied oldest first; an answer older than the word's
+        last review is logged but doesn't change the schedule.
+
+        Returns {"words": rescheduled words, "logs": new ReviewLog rows,
+        "duplicates": event ids, "skipped": word ids}.
+        """
+        now = timezone.now()
+        unique = {}
+        duplicates = []
+        for review in reviews:
+            if review["event_id"] in unique:
+                duplicates.append(review["event_id"])
+            else:
+                unique[review["event_id"]] = review
+
+        with transaction.atomic():
+            # Lock the words first: a concurrent retry of this batch then
+            # waits here and sees the events this transaction logs.
+            words = (
+                Word.objects.select_for_update()
+                .filter(user=self.user, id__in={review["word"] for review in unique.values()})
+                .only("id", *STATE_FIELDS)
+                .in_bulk()
+            )
+            logged = set(
+                ReviewLog.objects.filter(user=self.user, event_id__in=unique)
+                .values_list("event_id", flat=True)
+            )
+            duplicates.extend(event_id for event_id in unique if event_id in logged)
+
+            pending = sorted(
+                (review for event_id, review in unique.items() if event_id not in logged),
+                key=lambda review: review.get("reviewed_at") or now,
+            )
+            updated = {}
+            logs = []
+            skipped = []
+            for review in pending:
+                word = words.get(review["word"])
+                if word is None:
+                    skipped.append(review["word"])
+                    continue
+                # Client clocks can run ahead; never schedule from the future
+                reviewed_at = min(review.get("reviewed_at") or now, now)
+                if not word.last_reviewed_at or reviewed_at > word.last_reviewed_at:
+                    schedule(word, review["rating"], reviewed_at)
+                    updated[word.id] = word
+                logs.append(ReviewLog(
+                    user=self.user,
+                    word=word,
+                    event_id=review["event_id"],
+                    rating=review["rating"],
+                    reviewed_at=reviewed_at,
+                    interval=word.interval,
+                    ease=word.ease,
+                ))
+
+            ReviewLog.objects.bulk_create(logs)
+            # bulk_update writes the whole batch as one UPDATE ... CASE statement
+            Word.objects.bulk_update(updated.values(), STATE_FIELDS)
+
+        return {
+            "words": list(updated.values()),
+            "logs": logs,
+            "duplicates": duplicates,
+            "skipped": skipped,
+        }
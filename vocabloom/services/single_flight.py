@@ -0,0 +1,129 @@
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+from .. import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into one.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key while it is running wait for it and get the same result. With
+    SINGLE_FLIGHT_ACROSS_WORKERS enabled, a PostgreSQL advisory lock extends
+    this to other worker processes, which pick the leader's result up from
+    the shared cache. Only callers that arrive while the call is running
+    share its result; a call made after it finished runs again.
+    """
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def key(self, *parts):
+        raw = repr((self.namespace,) + parts).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def do(self, key, fn, share_if=None):
+        """
+        Run `fn()` once for every concurrent caller with the same `key`.
+
+        `share_if(result)` decides whether a result may be handed to other
+        workers through the cache; in-process waiters always share it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        # A follower is served from the in-flight call, like a cache hit
+        metrics.count_cache(f"single_flight_{self.namespace}", not leader)
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run_across_workers(key, fn, share_if)
+            return call.result
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _run_across_workers(self, key, fn, share_if):
+        if not settings.SINGLE_FLIGHT_ACROSS_WORKERS or connection.vendor != "postgresql":
+            return fn()
+
+        cache = caches[settings.SINGLE_FLIGHT_CACHE]
+        cache_key = f"single-flight:{self.namespace}:{key}"
+        lock_id = int.from_bytes(bytes.fromhex(key[:16]), "big", signed=True)
+        locked = self._try_lock(lock_id)
+        try:
+            if locked:
+                # No other worker is making this call, so anything under the
+                # key is left from an earlier one and must not be handed out
+                cache.delete(cache_key)
+            else:
+                locked = self._wait_for_lock(lock_id, cache, cache_key)
+                # The call we waited for has finished; its result is ours too
+                result = cache.get(cache_key)
+                metrics.count_cache(f"single_flight_shared_{self.namespace}", result is not None)
+                if result is not None:
+                    return result
+
+            result = fn()
+            if share_if is None or share_if(result):
+                # Kept only long enough for the workers already waiting to
+                # pick it up; later callers make a call of their own
+                cache.set(cache_key, result, settings.SINGLE_FLIGHT_RESULT_TTL)
+            return result
+        finally:
+            if locked:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+    def _try_lock(self, lock_id):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+            return cursor.fetchone()[0]
+
+    def _wait_for_lock(self, lock_id, cache, cache_key):
+        """
+        Wait for the worker making the same call to finish.
+
+        Returns True when this worker got the advisory lock, and False when
+        the other worker's result showed up in the cache or the wait timed
+        out, in which case the caller makes the call itself.
+        """
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_WAIT_SECONDS
+        while True:
+            time.sleep(0.05)
+            if self._try_lock(lock_id):
+                return True
+            if cache.get(cache_key) is not None:
+                return False
+            if time.monotonic() >= deadline:
+                logger.warning(f"Single-flight wait timed out for {self.namespace} call")
+                return False
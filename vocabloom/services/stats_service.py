@@ -0,0 +1,247 @@
+from collections import Counter, defaultdict
+
+from django.contrib.auth.models import User
+from django.db import connections, router, transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from ..models import DailyStats, ReviewLog, Tag, UserExample, UserStats, Word
+from .review_service import AGAIN
+
+DAILY_COUNTERS = ["words_added", "examples_added", "reviews", "reviews_correct"]
+TOTAL_COUNTERS = ["words", "examples", "reviews", "reviews_correct"]
+
+# Advisory lock key: increments hold it shared, reconcile() exclusively
+ROLLUP_LOCK_ID = 0x766F6361_726F6C6C
+
+
+def lock_rollups(shared=True):
+    """
+    Hold the rollup lock until the current transaction ends.
+
+    A writer takes it shared before its first increment, so writers never
+    wait on each other; reconcile() takes it exclusively, so it waits for
+    every transaction with an increment to commit and holds back new ones
+    until its rows are in. SQLite serializes writers on its own.
+    """
+    connection = connections[router.db_for_write(DailyStats)]
+    if connection.vendor != "postgresql":
+        return
+    function = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {function}(%s)", [ROLLUP_LOCK_ID])
+
+
+def increment(model, key_columns, counters, rows):
+    """
+    Add to rollup counters with one INSERT ... ON CONFLICT DO UPDATE.
+
+    `rows` maps a tuple of key column values to {counter: delta}; missing
+    rows are created with the deltas as their values. A single statement
+    keeps concurrent writers from losing each other's increments.
+    """
+    rows = {key: deltas for key, deltas in rows.items() if any(deltas.values())}
+    if not rows:
+        return
+
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    fields = {field.column: field for field in model._meta.concrete_fields}
+    columns = [*key_columns, *counters]
+
+    params = []
+    for key, deltas in rows.items():
+        params.extend(fields[column].get_db_prep_value(value, connection) for column, value in zip(key_columns, key))
+        params.extend(deltas.get(counter, 0) for counter in counters)
+    changed = [counter for counter in counters if any(counter in deltas for deltas in rows.values())]
+
+    row = f"({', '.join(['%s'] * len(columns))})"
+    sql = (
+        f"INSERT INTO {table} ({', '.join(map(quote, columns))}) "
+        f"VALUES {', '.join([row] * len(rows))} "
+        f"ON CONFLICT ({', '.join(map(quote, key_columns))}) DO UPDATE SET "
+        + ", ".join(f"{quote(counter)} = {table}.{quote(counter)} + EXCLUDED.{quote(counter)}" for counter in changed)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+class StatsService:
+    """
+    Keep a user's learning statistics current as they write.
+
+    Every write that changes a statistic calls one of these methods, which
+    adds the change to the DailyStats, UserStats and Tag.word_count
+    rollups. /api/stats/ reads only those rollups. reconcile() rebuilds them
+    from the source tables and corrects any drift.
+
+    Daily "added" counters count what the user still has: a deleted word or
+    example is taken off the day it was created, as reconcile() counts it.
+
+    Call these in the same transaction as the write they count, so that
+    reconcile() sees either both or neither.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    # ----------- WORDS -----------
+
+    def words_added(self, words):
+        lock_rollups()
+        days = Counter(timezone.localdate(word.created_at) for word in words)
+        self._daily({day: {"words_added": count} for day, count in days.items()})
+        self._totals(words=len(words))
+        self._tags(Counter(word.tag_id for word in words))
+
+    def words_deleted(self, words, examples=()):
+        """`examples` holds the creation times of the user examples deleted along with the words"""
+        lock_rollups()
+        days = defaultdict(Counter)
+        for word in words:
+            days[timezone.localdate(word.created_at)]["words_added"] -= 1
+        for created_at in examples:
+            days[timezone.localdate(created_at)]["examples_added"] -= 1
+        self._daily(days)
+        self._totals(words=-len(words), examples=-len(examples))
+        self._tags({tag_id: -count for tag_id, count in Counter(word.tag_id for word in words).items()})
+
+    def word_retagged(self, old_tag_id, new_tag_id):
+        self.words_retagged([(old_tag_id, new_tag_id)])
+
+    def words_retagged(self, moves):
+        """`moves` is a list of (old_tag_id, new_tag_id), one per word"""
+        lock_rollups()
+        deltas = Counter()
+        for old_tag_id, new_tag_id in moves:
+            if old_tag_id != new_tag_id:
+                deltas[old_tag_id] -= 1
+                deltas[new_tag_id] += 1
+        self._tags(deltas)
+
+    # ----------- EXAMPLES AND REVIEWS -----------
+
+    def examples_added(self, count=1):
+        lock_rollups()
+        self._daily({timezone.localdate(): {"examples_added": count}})
+        self._totals(examples=count)
+
+    def examples_deleted(self, examples):
+        """`examples` holds the creation times of the deleted examples"""
+        lock_rollups()
+        days = Counter(timezone.localdate(created_at) for created_at in examples)
+        self._daily({day: {"examples_added": -count} for day, count in days.items()})
+        self._totals(examples=-len(examples))
+
+    def reviews_logged(self, logs):
+        lock_rollups()
+        days = defaultdict(Counter)
+        for log in logs:
+            day = days[timezone.localdate(log.reviewed_at)]
+            day["reviews"] += 1
+            day["reviews_correct"] += log.rating != AGAIN
+        self._daily(days)
+        self._totals(
+            reviews=sum(day["reviews"] for day in days.values()),
+            reviews_correct=sum(day["reviews_correct"] for day in days.values()),
+        )
+
+    # ----------- ROLLUP WRITES -----------
+
+    def _daily(self, deltas_by_day):
+        increment(DailyStats, ["user_id", "date"], DAILY_COUNTERS, {
+            (self.user.id, day): deltas for day, deltas in deltas_by_day.items()
+        })
+
+    def _totals(self, **deltas):
+        increment(UserStats, ["user_id"], TOTAL_COUNTERS, {(self.user.id,): deltas})
+
+    def _tags(self, deltas):
+        deltas = {tag_id: delta for tag_id, delta in deltas.items() if tag_id is not None and delta}
+        if not deltas:
+            return
+        Tag.objects.filter(id__in=deltas).update(word_count=F("word_count") + Case(
+            *(When(id=tag_id, then=Value(delta)) for tag_id, delta in deltas.items()),
+            default=Value(0),
+            output_field=IntegerField(),
+        ))
+
+
+def reconcile(since=None, users=None):
+    """
+    Rebuild the rollups from Word, UserExample and ReviewLog.
+
+    Daily rows from `since` (a date; None for all history) are recomputed,
+    and totals and tag counts are recomputed in full. `users` limits the
+    work to a queryset of users. Returns the number of rows written.
+
+    The rebuild runs in one transaction under the exclusive rollup lock
+    (see lock_rollups()). Writes and their increments commit together, so
+    a write is either already counted in the source tables reconcile()
+    reads, or its increment waits and is added to the rebuilt rows.
+    """
+    users = users if users is not None else User.objects.all()
+
+    def scoped(queryset, date_field):
+        queryset = queryset.filter(user__in=users)
+        if since is not None:
+            queryset = queryset.filter(**{f"{date_field}__date__gte": since})
+        return queryset.values("user_id", day=TruncDate(date_field))
+
+    word_counts = (
+        Word.objects.filter(tag=OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+
+    with transaction.atomic():
+        lock_rollups(shared=False)
+        stale = DailyStats.objects.filter(user__in=users)
+        if since is not None:
+            stale = stale.filter(date__gte=since)
+        stale.delete()
+        UserStats.objects.filter(user__in=users).delete()
+
+        daily = defaultdict(Counter)
+        for row in scoped(Word.objects, "created_at").annotate(count=Count("id")):
+            daily[row["user_id"], row["day"]]["words_added"] = row["count"]
+        # Examples of deleted words are gone for the user even before the purge
+        live_examples = UserExample.objects.filter(word__deleted_at__isnull=True)
+        for row in scoped(live_examples, "created_at").annotate(count=Count("id")):
+            daily[row["user_id"], row["day"]]["examples_added"] = row["count"]
+        for row in scoped(ReviewLog.objects, "reviewed_at").annotate(
+            count=Count("id"), correct=Count("id", filter=~Q(rating=AGAIN))
+        ):
+            daily[row["user_id"], row["day"]]["reviews"] = row["count"]
+            daily[row["user_id"], row["day"]]["reviews_correct"] = row["correct"]
+
+        totals = defaultdict(Counter)
+        for user_id, count in Word.objects.filter(user__in=users).values_list("user_id").annotate(count=Count("id")):
+            totals[user_id]["words"] = count
+        for user_id, count in live_examples.filter(user__in=users).values_list("user_id").annotate(count=Count("id")):
+            totals[user_id]["examples"] = count
+        for user_id, count, correct in (
+            ReviewLog.objects.filter(user__in=users)
+            .values_list("user_id")
+            .annotate(count=Count("id"), correct=Count("id", filter=~Q(rating=AGAIN)))
+        ):
+            totals[user_id]["reviews"] = count
+            totals[user_id]["reviews_correct"] = correct
+
+        DailyStats.objects.bulk_create(
+            [DailyStats(user_id=user_id, date=day, **counters) for (user_id, day), counters in daily.items()],
+            batch_size=1000,
+        )
+        UserStats.objects.bulk_create(
+            [UserStats(user_id=user_id, **counters) for user_id, counters in totals.items()],
+            batch_size=1000,
+        )
+        tags = Tag.objects.filter(user__in=users).update(
+            word_count=Coalesce(Subquery(word_counts, output_field=IntegerField()), 0)
+        )
+
+    return {"daily": len(daily), "totals": len(totals), "tags": tags}
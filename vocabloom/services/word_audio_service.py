@@ -0,0 +1,99 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.db.models import Q
+
+from .. import metrics
+from ..models import Word
+from .polly_service import PollyService
+
+logger = logging.getLogger(__name__)
+
+AUDIO_FORMAT = "mp3"
+
+# Shared by every request in this worker; creating words never waits on Polly
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.WORD_AUDIO_WORKERS,
+            thread_name_prefix="word-audio",
+        )
+    return _executor
+
+
+def words_missing_audio():
+    return Word.objects.filter(Q(audio__isnull=True) | Q(audio=""))
+
+
+class WordAudioService:
+    """
+    Pre-synthesized pronunciations for saved words.
+
+    Audio files are content-addressed: the file name is a hash of the text
+    and voice settings, so every user who saves the same word shares one
+    file and Polly is only called the first time.
+    """
+
+    def __init__(self, polly_service=None):
+        self.polly_service = polly_service or PollyService()
+        self.voice_id = settings.WORD_AUDIO_VOICE_ID
+        self.speed = settings.POLLY_DEFAULT_SPEED
+
+    def audio_path(self, text):
+        key = f"{self.voice_id}|{self.speed}|{AUDIO_FORMAT}|{text}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"{settings.WORD_AUDIO_DIR}/{digest[:2]}/{digest}.{AUDIO_FORMAT}"
+
+    def get_or_create_audio_url(self, text):
+        """Return the stored audio URL for `text`, synthesizing it if needed"""
+        path = self.audio_path(text)
+        exists = default_storage.exists(path)
+        metrics.count_cache("word_audio", exists)
+        if not exists:
+            audio = self.polly_service.synthesize(
+                text, voice_id=self.voice_id, output_format=AUDIO_FORMAT, speed=self.speed
+            )
+            path = default_storage.save(path, ContentFile(audio))
+        return default_storage.url(path)
+
+    def attach_audio(self, word_id):
+        """Fill Word.audio for one word, unless the client already set it"""
+        try:
+            word = words_missing_audio().get(pk=word_id)
+        except Word.DoesNotExist:
+            return None
+
+        try:
+            url = self.get_or_create_audio_url(word.word)
+        except Exception as error:
+            logger.error(f"Failed to pre-synthesize audio for word {word_id}: {error}")
+            return None
+
+        words_missing_audio().filter(pk=word_id).update(audio=url)
+        return url
+
+
+def _attach_audio_in_background(word_id):
+    try:
+        WordAudioService().attach_audio(word_id)
+    finally:
+        # Worker threads get their own DB connections; don't leak them
+        connections.close_all()
+
+
+def schedule_word_audio(word):
+    """Synthesize `word`'s pronunciation after the current transaction commits"""
+    if not settings.WORD_AUDIO_PRECOMPUTE or word.audio:
+        return
+    transaction.on_commit(
+        lambda: _get_executor().submit(_attach_audio_in_background, word.pk)
+    )
@@ -0,0 +1,80 @@
+from django.db import transaction
+
+from ..models import UserExample, Word
+from .deletion_service import delete_words
+
+
+class WordBatchService:
+    """
+    Apply set_tag, update_note and delete operations to a user's words.
+
+    Operations run in order in one transaction, each as a single UPDATE
+    over its words, so the statement count depends on the number of
+    operations, not words. Ids that are not the user's live words (or were
+    deleted by an earlier operation) are reported as missing rather than
+    failing the batch.
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+    def apply(self, operations):
+        """
+        Returns {"results": one {"op", "words", "missing"} per operation,
+        "deleted": Word stubs (id, original tag_id, created_at),
+        "examples": creation times of the examples on the deleted words, "retagged": [(old_tag_id, new_tag_id)]} so
+        the caller can update the statistics rollups.
+        """
+        word_ids = {word_id for operation in operations for word_id in operation["words"]}
+        with transaction.atomic():
+            # Lock the words up front: a concurrent batch touching the same
+            # words waits here, and the missing lists stay exact
+            original = {
+                word_id: (tag_id, created_at)
+                for word_id, tag_id, created_at in Word.objects.select_for_update()
+                .filter(user=self.user, id__in=word_ids)
+                .order_by("id")
+                .values_list("id", "tag_id", "created_at")
+            }
+            tags = {word_id: tag_id for word_id, (tag_id, _) in original.items()}
+
+            results = []
+            for operation in operations:
+                requested = list(dict.fromkeys(operation["words"]))
+                found = [word_id for word_id in requested if word_id in tags]
+                if found:
+                    words = Word.objects.filter(id__in=found)
+                    if operation["op"] == "set_tag":
+                        words.update(tag_id=operation["tag"])
+                        tags.update(dict.fromkeys(found, operation["tag"]))
+                    elif operation["op"] == "update_note":
+                        words.update(note=operation["note"])
+                    else:
+                        delete_words(words)
+                        for word_id in found:
+                            del tags[word_id]
+                results.append({
+                    "op": operation["op"],
+                    "words": found,
+                    "missing": [word_id for word_id in requested if word_id not in found],
+                })
+
+            deleted = [word_id for word_id in original if word_id not in tags]
+            examples = (
+                list(UserExample.objects.filter(word_id__in=deleted).values_list("created_at", flat=True))
+                if deleted else []
+            )
+
+        return {
+            "results": results,
+            "deleted": [
+                Word(id=word_id, tag_id=original[word_id][0], created_at=original[word_id][1])
+                for word_id in deleted
+            ],
+            "examples": examples,
+            "retagged": [
+                (original[word_id][0], tag_id)
+                for word_id, tag_id in tags.items()
+                if tag_id != original[word_id][0]
+            ],
+        }
@@ -0,0 +1,111 @@
+"""
+Query budgets for API tests.
+
+`query_budget(n)` fails a test when the wrapped block runs more than `n`
+SQL queries, printing each query with the project frames that issued it.
+`QueryBudgetMixin.assertConstantQueries` runs the same request against two
+data sizes and fails if the query count grows with the data (an N+1).
+"""
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_THIS_FILE = str(Path(__file__).resolve())
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryRecorder:
+    """Record every query on a connection together with where it came from"""
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.connection = connections[using]
+        self.queries = []
+
+    def __len__(self):
+        return len(self.queries)
+
+    def __enter__(self):
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._wrapper.__exit__(*exc_info)
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, _project_stack()))
+        return execute(sql, params, many, context)
+
+    def report(self, header):
+        lines = [header]
+        for number, (sql, stack) in enumerate(self.queries, start=1):
+            lines.append(f"\n{number}. {sql}")
+            lines.extend(f"     {frame}" for frame in stack)
+        return "\n".join(lines)
+
+
+def _project_stack():
+    """The frames of the call stack that belong to this project"""
+    base_dir = str(settings.BASE_DIR)
+    frames = []
+    for frame in traceback.extract_stack()[:-2]:
+        if not frame.filename.startswith(base_dir) or frame.filename == _THIS_FILE:
+            continue
+        if "site-packages" in frame.filename or frame.filename.endswith("manage.py"):
+            continue
+        path = Path(frame.filename).relative_to(base_dir)
+        frames.append(f"{path}:{frame.lineno} in {frame.name}: {frame.line}")
+    return frames
+
+
+@contextmanager
+def query_budget(max_queries, using=DEFAULT_DB_ALIAS, label="block"):
+    """
+    Fail when the block runs more than `max_queries` queries.
+
+    Works as a context manager or as a test method decorator.
+    """
+    with QueryRecorder(using) as recorder:
+        yield recorder
+    if len(recorder) > max_queries:
+        raise QueryBudgetExceeded(recorder.report(
+            f"{label} ran {len(recorder)} queries, budget is {max_queries}:"
+        ))
+
+
+class QueryBudgetMixin:
+    """TestCase helpers for checking query counts against data size"""
+
+    def assertQueryBudget(self, max_queries, label="block"):
+        return query_budget(max_queries, label=label)
+
+    def assertConstantQueries(self, request, grow, sizes=(2, 20), max_queries=None, label="request"):
+        """
+        Run `request()` after growing the data to each of `sizes`.
+
+        `grow(n)` adds data until there are `n` items. The query count must
+        be the same at every size and, if given, within `max_queries`.
+        """
+        runs = []
+        for size in sizes:
+            grow(size)
+            with QueryRecorder() as recorder:
+                request()
+            runs.append((size, recorder))
+
+        (first_size, first), (last_size, last) = runs[0], runs[-1]
+        if max_queries is not None and len(last) > max_queries:
+            raise QueryBudgetExceeded(last.report(
+                f"{label} ran {len(last)} queries with {last_size} items, budget is {max_queries}:"
+            ))
+        if len(last) != len(first):
+            raise QueryBudgetExceeded(last.report(
+                f"{label} query count grows with data: {len(first)} queries with "
+                f"{first_size} items, {len(last)} with {last_size}:"
+            ))
@@ -0,0 +1,113 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from ..admin import is_unfiltered
+from ..models import Tag, Word, Meaning, Definition, UserExample, UserStats
+from ..services.stats_service import reconcile
+
+
+class AdminChangelistTestCase(TestCase):
+    def setUp(self):
+        """Set up a superuser and some vocabulary"""
+        self.admin = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.client.force_login(self.admin)
+
+        self.user = User.objects.create_user(username='learner', password='testpass123')
+        self.other_user = User.objects.create_user(username='other', password='testpass123')
+        self.tag = Tag.objects.create(user=self.user, name='Movies')
+
+    def _add_words(self, user, count):
+        for i in range(count):
+            word = Word.objects.create(user=user, tag=self.tag, word=f'{user.username}-{i}')
+            meaning = Meaning.objects.create(part_of_speech='noun')
+            word.meanings.add(meaning)
+            Definition.objects.create(meaning=meaning, definition=f'definition {i}')
+            UserExample.objects.create(word=word, user=user, example_text=f'example {i}')
+
+    def _changelist_queries(self, model_name):
+        url = reverse(f'admin:vocabloom_{model_name}_changelist')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        """Every changelist runs the same number of queries for 2 or 20 rows"""
+        # Arrange
+        self._add_words(self.user, 2)
+        small = {
+            name: self._changelist_queries(name)
+            for name in ('tag', 'word', 'meaning', 'definition', 'userexample')
+        }
+        self._add_words(self.other_user, 18)
+
+        # Act - Assert
+        for name, queries in small.items():
+            self.assertEqual(self._changelist_queries(name), queries, name)
+
+    def test_word_changelist_shows_annotated_counts(self):
+        """Meaning and example counts come from the annotation"""
+        # Arrange
+        self._add_words(self.user, 1)
+
+        # Act
+        response = self.client.get(reverse('admin:vocabloom_word_changelist'))
+
+        # Assert
+        word = response.context['cl'].result_list[0]
+        self.assertEqual(word.meanings_count, 1)
+        self.assertEqual(word.examples_count, 1)
+
+    def test_username_filter(self):
+        """The username text filter narrows the list to that user's words"""
+        # Arrange
+        self._add_words(self.user, 2)
+        self._add_words(self.other_user, 3)
+
+        # Act
+        response = self.client.get(
+            reverse('admin:vocabloom_word_changelist'), {'username': 'Other'}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].result_count, 3)
+
+    def test_soft_delete_filter_counts_as_unfiltered(self):
+        """Only filters beyond hiding deleted rows switch off the estimated count"""
+        # Act - Assert
+        self.assertTrue(is_unfiltered(Word.objects.all()))
+        self.assertTrue(is_unfiltered(Word.objects.annotate(examples=Count('user_examples'))))
+        self.assertTrue(is_unfiltered(Meaning.objects.all()))
+        self.assertFalse(is_unfiltered(Word.objects.filter(user=self.user)))
+
+    def test_admin_word_delete_updates_statistics(self):
+        """Deleting words in the admin adjusts their owners' rollups like the API"""
+        # Arrange
+        self._add_words(self.user, 2)
+        self._add_words(self.other_user, 1)
+        reconcile()
+        doomed = Word.objects.filter(word__in=['learner-0', 'other-0'])
+
+        # Act
+        response = self.client.post(reverse('admin:vocabloom_word_changelist'), {
+            'action': 'delete_selected',
+            '_selected_action': [word.pk for word in doomed],
+            'post': 'yes',
+        })
+
+        # Assert
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            {stats.user.username: (stats.words, stats.examples) for stats in UserStats.objects.all()},
+            {'learner': (1, 1), 'other': (0, 0)},
+        )
+        self.tag.refresh_from_db()
+        self.assertEqual(self.tag.word_count, 1)
@@ -0,0 +1,154 @@
+import json
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from unittest.mock import patch
+from ..models import Tag, Word
+from ..serializers import API_BATCH_MAX_REQUESTS
+
+
+class BatchTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with a bearer token, a tagged word with an example, and another user's word"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.tag = Tag.objects.create(user=self.user, name='Tech Words')
+        self.word = self.client.post(reverse('words_list_create'), {'word': 'algorithm', 'tag': self.tag.id}, format='json').data['id']
+        self.examples_path = reverse('user-example-list', kwargs={'word_id': self.word})
+        self.client.post(reverse('user-example-create', kwargs={'word_id': self.word}), {'example_text': 'I wrote an algorithm.'})
+        self.foreign = Word.objects.create(user=User.objects.create_user(username='otheruser'), word='secret')
+        self.batch_url = reverse('batch')
+
+    def _batch(self, *paths):
+        response = self.client.post(self.batch_url, {'requests': [{'path': path} for path in paths]}, format='json')
+        return response, json.loads(response.content) if response.status_code == status.HTTP_200_OK else None
+
+    def test_responses_match_single_requests(self):
+        """Each sub-response carries the status and body of the same GET on its own, in order"""
+        # Arrange
+        paths = [reverse('is_authenticated'), reverse('tags_list_create'), reverse('words_list_create'), self.examples_path]
+
+        # Act
+        response, data = self._batch(*paths)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for path, item in zip(paths, data['responses'], strict=True):
+            single = self.client.get(path)
+            self.assertEqual(item, {'path': path, 'status': single.status_code, 'body': json.loads(single.content)})
+
+    def test_token_is_checked_once(self):
+        """Sub-requests reuse the batch's user instead of authenticating again"""
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            self._batch(reverse('tags_list_create'), reverse('words_list_create'), self.examples_path)
+
+        # Assert
+        user_queries = [query for query in ctx.captured_queries if 'FROM "auth_user"' in query['sql']]
+        self.assertEqual(len(user_queries), 1)
+
+    def test_query_string_is_passed_on(self):
+        """Query parameters in the path reach the sub-request"""
+        # Act
+        _, data = self._batch(f"{reverse('review_next')}?limit=0")
+
+        # Assert
+        self.assertEqual(data['responses'][0]['status'], status.HTTP_400_BAD_REQUEST)
+        self.assertIn('limit', data['responses'][0]['body'])
+
+    def test_errors_stay_per_request(self):
+        """A sub-request that fails doesn't fail the batch"""
+        # Act
+        response, data = self._batch(
+            reverse('word_detail', kwargs={'pk': self.foreign.id}),
+            reverse('word_detail', kwargs={'pk': self.word}),
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['status'] for item in data['responses']], [404, 200])
+
+    def test_only_batchable_reads_are_accepted(self):
+        """Writes, non-JSON routes, the batch itself and unknown paths are a 400"""
+        for sub_request in (
+            {'method': 'POST', 'path': reverse('words_list_create')},
+            {'path': reverse('words_export')},
+            {'path': reverse('batch')},
+            {'path': '/api/nowhere/'},
+        ):
+            with self.subTest(sub_request=sub_request):
+                # Act
+                response = self.client.post(self.batch_url, {'requests': [sub_request]}, format='json')
+
+                # Assert
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_request_count_is_limited(self):
+        """Too many sub-requests are rejected"""
+        # Act
+        response, _ = self._batch(*[reverse('tags_list_create')] * (API_BATCH_MAX_REQUESTS + 1))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_response_size_is_limited(self):
+        """Once the bodies reach the limit the remaining requests answer 413 without running"""
+        # Arrange
+        size = len(self.client.get(reverse('tags_list_create')).content)
+
+        # Act
+        with patch('vocabloom.views.batch_views.API_BATCH_MAX_RESPONSE_BYTES', size + 1), \
+                CaptureQueriesContext(connection) as ctx:
+            _, data = self._batch(reverse('tags_list_create'), reverse('words_list_create'), self.examples_path)
+
+        # Assert
+        # The request that crossed the limit was run, so it is returned whole
+        self.assertEqual([item['status'] for item in data['responses']], [200, 200, 413])
+        self.assertEqual(len(data['responses'][1]['body']), 1)
+        self.assertNotIn('vocabloom_userexample', ' '.join(query['sql'] for query in ctx.captured_queries))
+
+    @override_settings(DATABASE_REPLICAS=['replica'])
+    def test_replica_reads_stay_with_the_view_that_opted_in(self):
+        """A replica-reading sub-request doesn't move later ones onto the replica"""
+        # Arrange
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        def replica_reads(*paths):
+            with patch('vocabloom.db.routers.pick_replica', return_value='default') as pick_replica:
+                self._batch(*paths)
+            return pick_replica.call_count
+
+        # Act
+        tags_only = replica_reads(reverse('tags_list_create'))
+        with_primary_views = replica_reads(
+            reverse('tags_list_create'),
+            reverse('tag_detail', kwargs={'pk': self.tag.id}),
+            reverse('word_detail', kwargs={'pk': self.word}),
+        )
+
+        # Assert
+        self.assertGreater(tags_only, 0)
+        self.assertEqual(with_primary_views, tags_only)
+
+    def test_anonymous_is_rejected(self):
+        """The batch needs authentication like its sub-requests"""
+        # Arrange
+        self.client.credentials()
+
+        # Act
+        response, _ = self._batch(reverse('tags_list_create'))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
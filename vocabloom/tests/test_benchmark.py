@@ -0,0 +1,62 @@
+import json
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TransactionTestCase
+from ..models import Tag, UserStats, Word
+from ..services.content_service import find_drift
+
+
+class BenchmarkCommandsTestCase(TransactionTestCase):
+    def assert_rollups_match_words(self):
+        for user in User.objects.all():
+            self.assertEqual(UserStats.objects.get(user=user).words, Word.objects.filter(user=user).count())
+        for tag in Tag.objects.all():
+            self.assertEqual(tag.word_count, tag.words.count())
+
+    def test_seed_vocab_is_reproducible(self):
+        """The same seed produces the same vocabulary"""
+        # Arrange
+        call_command('seed_vocab', users=3, words=10, seed=7, prefix='first', stdout=StringIO())
+        call_command('seed_vocab', users=3, words=10, seed=7, prefix='second', stdout=StringIO())
+
+        # Act
+        first = list(Word.objects.filter(user__username__startswith='first').order_by('id').values_list('word', flat=True))
+        second = list(Word.objects.filter(user__username__startswith='second').order_by('id').values_list('word', flat=True))
+
+        # Assert
+        self.assertEqual(User.objects.filter(username__startswith='first').count(), 3)
+        self.assertTrue(first)
+        self.assertEqual(first, second)
+        self.assertEqual(find_drift(), [])
+        self.assert_rollups_match_words()
+
+    def test_benchmark_reports_latency_per_scenario(self):
+        """Each scenario reports throughput and percentiles with no errors"""
+        # Arrange
+        call_command('seed_vocab', users=2, words=5, stdout=StringIO())
+        out = StringIO()
+
+        # Act - one client thread: the in-memory test database locks tables on concurrent writes
+        call_command(
+            'benchmark_api', scenarios='list,detail,create,audio,generate', requests=4, concurrency=1,
+            polly_latency_ms=0, gemini_latency_ms=0, jitter_ms=0, stdout=out, stderr=StringIO(),
+        )
+
+        # Assert
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['meta']['users'], 2)
+        self.assertEqual(set(report['scenarios']), {'list', 'detail', 'create', 'audio', 'generate'})
+        for stats in report['scenarios'].values():
+            self.assertEqual(stats['requests'], 4)
+            self.assertEqual(stats['errors'], 0)
+            self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertFalse(Word.objects.filter(word__startswith='bench-').exists())
+        self.assert_rollups_match_words()
+
+    def test_benchmark_requires_seeded_users(self):
+        """Running without seeded data fails with a hint"""
+        # Act - Assert
+        with self.assertRaisesMessage(CommandError, 'seed_vocab'):
+            call_command('benchmark_api', stdout=StringIO(), stderr=StringIO())
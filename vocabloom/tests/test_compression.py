@@ -0,0 +1,162 @@
+import gzip
+import unittest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch
+from .. import compression
+from ..middleware import CompressionMiddleware
+from ..models import Tag, Word
+
+# The middleware tests run gzip-only; the brotli test patches the real module back in
+brotli = compression.brotli
+
+
+class NegotiateTestCase(SimpleTestCase):
+    def test_prefers_brotli_when_available(self):
+        """With both accepted at the same weight brotli wins"""
+        # Act - Assert
+        with patch.object(compression, 'brotli', object()):
+            self.assertEqual(compression.negotiate('gzip, deflate, br'), 'br')
+
+    def test_falls_back_to_gzip_without_brotli(self):
+        """Without the brotli package only gzip is offered"""
+        # Act - Assert
+        with patch.object(compression, 'brotli', None):
+            self.assertEqual(compression.negotiate('gzip, br'), 'gzip')
+
+    def test_client_weights_win(self):
+        """q-values from the client override the server preference"""
+        # Act - Assert
+        with patch.object(compression, 'brotli', object()):
+            self.assertEqual(compression.negotiate('br;q=0.5, gzip'), 'gzip')
+            self.assertIsNone(compression.negotiate('gzip;q=0, br;q=0'))
+            self.assertEqual(compression.negotiate('*'), 'br')
+
+    def test_identity_only(self):
+        """No or unsupported encodings mean an uncompressed response"""
+        # Act - Assert
+        self.assertIsNone(compression.negotiate(''))
+        self.assertIsNone(compression.negotiate('deflate'))
+
+
+@patch.object(compression, 'brotli', None)
+class CompressionMiddlewareTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with enough words for a large list response"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        tag = Tag.objects.create(user=self.user, name='Tech Words')
+        Word.objects.bulk_create(
+            Word(user=self.user, tag=tag, word=f'word{index}', note='a fairly repetitive note')
+            for index in range(40)
+        )
+        self.words_url = reverse('words_list_create')
+
+    def test_large_json_is_gzipped(self):
+        """A list above the threshold is gzipped and still decodes to the same JSON"""
+        # Arrange
+        plain = self.client.get(self.words_url)
+
+        # Act
+        response = self.client.get(self.words_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertLess(int(response['Content-Length']), len(plain.content) // 3)
+
+    def test_small_response_is_not_compressed(self):
+        """Responses below COMPRESSION_MIN_SIZE are sent as they are"""
+        # Act
+        with override_settings(COMPRESSION_MIN_SIZE=10 ** 6):
+            response = self.client.get(self.words_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        # Assert
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_client_without_gzip_gets_identity(self):
+        """Clients that do not send Accept-Encoding get plain JSON"""
+        # Act
+        response = self.client.get(self.words_url)
+
+        # Assert
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(len(response.json()), 40)
+
+    def test_level_is_configurable(self):
+        """A higher gzip level yields a smaller (or equal) body"""
+        # Act
+        with override_settings(COMPRESSION_GZIP_LEVEL=1):
+            fast = self.client.get(self.words_url, HTTP_ACCEPT_ENCODING='gzip')
+        with override_settings(COMPRESSION_GZIP_LEVEL=9):
+            small = self.client.get(self.words_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        # Assert
+        self.assertLessEqual(len(small.content), len(fast.content))
+        self.assertEqual(gzip.decompress(small.content), gzip.decompress(fast.content))
+
+    def test_streamed_export_is_compressed_per_chunk(self):
+        """The streaming CSV and JSONL exports stay streamed and decode to the full file"""
+        export_url = reverse('words_export')
+        for export_format in ('csv', 'jsonl'):
+            with self.subTest(format=export_format):
+                # Arrange
+                plain = b''.join(self.client.get(export_url, {'format': export_format}).streaming_content)
+
+                # Act
+                response = self.client.get(export_url, {'format': export_format}, HTTP_ACCEPT_ENCODING='gzip')
+
+                # Assert
+                self.assertTrue(response.streaming)
+                self.assertEqual(response['Content-Encoding'], 'gzip')
+                self.assertFalse(response.has_header('Content-Length'))
+                self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), plain)
+
+    def test_strong_etag_becomes_weak(self):
+        """Compressed bytes differ from the identity body, so the ETag is weakened"""
+        # Arrange
+        body = HttpResponse(b'{"word": "algorithm"}' * 100, content_type='application/json')
+        body['ETag'] = '"abc"'
+        middleware = CompressionMiddleware(lambda request: body)
+
+        # Act
+        response = middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip'))
+
+        # Assert
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_binary_content_is_not_compressed(self):
+        """Already-compressed media types are passed through"""
+        # Arrange
+        body = HttpResponse(b'ID3' * 1000, content_type='audio/mpeg')
+        middleware = CompressionMiddleware(lambda request: body)
+
+        # Act
+        response = middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip'))
+
+        # Assert
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @unittest.skipIf(brotli is None, 'brotli is not installed')
+    def test_brotli(self):
+        """Clients accepting br get a brotli body when the package is installed"""
+        # Arrange
+        plain = self.client.get(self.words_url)
+
+        # Act
+        with patch.object(compression, 'brotli', brotli):
+            response = self.client.get(self.words_url, HTTP_ACCEPT_ENCODING='gzip, br')
+
+        # Assert
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), plain.content)
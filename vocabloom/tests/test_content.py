@@ -0,0 +1,155 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Word, Definition, UserExample
+from ..services.content_service import find_drift, render_contents
+
+ALGORITHM = [
+    {'part_of_speech': 'noun', 'definitions': [
+        {'definition': 'A step-by-step procedure', 'example': 'The algorithm sorts the list.'},
+        {'definition': 'A set of rules'},
+    ]},
+]
+
+
+class WordContentTestCase(APITestCase):
+    def setUp(self):
+        """Set up an authenticated user with one word saved through the API"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(reverse('words_list_create'), {
+            'word': 'algorithm', 'meanings': ALGORITHM,
+        }, format='json')
+        self.word = Word.objects.get(id=response.data['id'])
+        self.detail_url = reverse('word_detail', kwargs={'pk': self.word.id})
+        self.examples_url = reverse('user-example-create', kwargs={'word_id': self.word.id})
+
+    def _content(self):
+        return Word.objects.values_list('content', flat=True).get(id=self.word.id)
+
+    def _add_example(self, text='I wrote an algorithm.'):
+        response = self.client.post(self.examples_url, {'example_text': text})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def test_list_is_read_from_one_table(self):
+        """Listing words renders nested data without querying the nested tables"""
+        # Arrange
+        self._add_example()
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('words_list_create'))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        word = response.data[0]
+        self.assertEqual(word['meanings'][0]['definitions'][0]['example'], 'The algorithm sorts the list.')
+        self.assertEqual(word['user_examples'][0]['example_text'], 'I wrote an algorithm.')
+        tables = ' '.join(query['sql'] for query in ctx.captured_queries)
+        for table in ('vocabloom_meaning', 'vocabloom_definition', 'vocabloom_userexample'):
+            self.assertNotIn(table, tables)
+
+    def test_snapshot_matches_the_serializer_shape(self):
+        """The stored content is what the nested rows render to"""
+        # Arrange
+        self._add_example()
+
+        # Act
+        content = self._content()
+
+        # Assert
+        self.assertEqual(content, render_contents([self.word.id])[self.word.id])
+        definition = Definition.objects.get(definition='A set of rules')
+        self.assertEqual(content['meanings'][0]['definitions'][1], {
+            'id': definition.id, 'definition': 'A set of rules', 'example': None,
+        })
+
+    def test_example_changes_update_the_snapshot(self):
+        """Adding, editing and deleting an example each rewrite the content"""
+        # Arrange
+        example = self._add_example()
+        url = reverse('user-example-detail', kwargs={'word_id': self.word.id, 'example_id': example['id']})
+
+        # Act
+        self.client.put(url, {'example_text': 'An edited sentence.'})
+        edited = self._content()['user_examples']
+        self.client.delete(url)
+
+        # Assert
+        self.assertEqual([item['example_text'] for item in edited], ['An edited sentence.'])
+        self.assertEqual(self._content()['user_examples'], [])
+
+    def test_meaning_override_updates_the_snapshot(self):
+        """Replacing meanings rewrites them and keeps the examples"""
+        # Arrange
+        self._add_example()
+
+        # Act
+        response = self.client.put(self.detail_url, {
+            'word': 'algorithm',
+            'meanings': [{'part_of_speech': 'noun', 'definitions': [{'definition': 'My own wording'}]}],
+        }, format='json')
+
+        # Assert
+        content = self._content()
+        self.assertEqual(response.data['meanings'], content['meanings'])
+        self.assertEqual(content['meanings'][0]['definitions'][0]['definition'], 'My own wording')
+        self.assertEqual(len(content['user_examples']), 1)
+
+    def test_note_update_keeps_a_newer_snapshot(self):
+        """Saving other fields never writes back the content read with the word"""
+        # Arrange
+        stale = Word.objects.get(id=self.word.id)
+        self._add_example()
+
+        # Act
+        stale.note = 'Edited'
+        stale.save(update_fields=['note'])
+        response = self.client.patch(self.detail_url, {'note': 'Edited again'}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._content()['user_examples']), 1)
+        self.assertEqual(find_drift(), [])
+
+    def test_check_command_reports_and_repairs_drift(self):
+        """check_word_content fails on rows written around the service, --repair fixes them"""
+        # Arrange
+        UserExample.objects.create(word=self.word, user=self.user, example_text='Written directly.')
+        out = StringIO()
+
+        # Act
+        with self.assertRaises(CommandError):
+            call_command('check_word_content', stdout=out)
+        call_command('check_word_content', repair=True, stdout=out)
+
+        # Assert
+        self.assertIn(f'1 words drifted: {self.word.id}', out.getvalue())
+        self.assertIn('Repaired the content of 1 words', out.getvalue())
+        self.assertEqual(find_drift(), [])
+
+    def test_rebuild_command_renders_every_word(self):
+        """rebuild_word_content re-renders all words in batches"""
+        # Arrange
+        Word.objects.create(user=self.user, word='serendipity')
+        Word.objects.update(content={'meanings': [], 'user_examples': []})
+        out = StringIO()
+
+        # Act
+        call_command('rebuild_word_content', batch_size=1, stdout=out)
+
+        # Assert
+        self.assertIn('Rebuilt the content of 2 words', out.getvalue())
+        self.assertEqual(len(self._content()['meanings']), 1)
+        self.assertEqual(find_drift(), [])
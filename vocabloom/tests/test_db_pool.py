@@ -0,0 +1,106 @@
+import threading
+from django.test import SimpleTestCase
+from ..db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def setUp(self):
+        """Count the connections the pool opens"""
+        self.opened = []
+
+    def connect(self):
+        connection = FakeConnection()
+        self.opened.append(connection)
+        return connection
+
+    def test_released_connection_is_reused(self):
+        """A released connection serves the next request without reconnecting"""
+        # Arrange
+        pool = ConnectionPool(check=lambda connection: True, max_size=2)
+        first = pool.acquire(self.connect)
+        pool.release(first)
+
+        # Act
+        second = pool.acquire(self.connect)
+
+        # Assert
+        self.assertIs(second, first)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_full_pool_waits_then_times_out(self):
+        """With every connection in use, acquire gives up after the timeout"""
+        # Arrange
+        pool = ConnectionPool(check=lambda connection: True, max_size=1, timeout=0.05)
+        pool.acquire(self.connect)
+
+        # Act - Assert
+        with self.assertRaises(PoolTimeout):
+            pool.acquire(self.connect)
+
+    def test_waiter_gets_released_connection(self):
+        """A thread waiting on a full pool gets the next released connection"""
+        # Arrange
+        pool = ConnectionPool(check=lambda connection: True, max_size=1, timeout=5)
+        held = pool.acquire(self.connect)
+        received = []
+        waiter = threading.Thread(target=lambda: received.append(pool.acquire(self.connect)))
+        waiter.start()
+
+        # Act
+        pool.release(held)
+        waiter.join(timeout=5)
+
+        # Assert
+        self.assertEqual(received, [held])
+        self.assertEqual(len(self.opened), 1)
+
+    def test_unreusable_connection_is_closed(self):
+        """Connections released as unreusable are closed, freeing their slot"""
+        # Arrange
+        pool = ConnectionPool(check=lambda connection: True, max_size=1)
+        broken = pool.acquire(self.connect)
+
+        # Act
+        pool.release(broken, reusable=False)
+        replacement = pool.acquire(self.connect)
+
+        # Assert
+        self.assertTrue(broken.closed)
+        self.assertIsNot(replacement, broken)
+        self.assertEqual(pool.size, 1)
+
+    def test_idle_connection_failing_check_is_replaced(self):
+        """A connection idle past check_after is checked and replaced if dead"""
+        # Arrange
+        pool = ConnectionPool(check=lambda connection: False, max_size=1, check_after=0)
+        stale = pool.acquire(self.connect)
+        pool.release(stale)
+
+        # Act
+        fresh = pool.acquire(self.connect)
+
+        # Assert
+        self.assertTrue(stale.closed)
+        self.assertIsNot(fresh, stale)
+
+    def test_old_connections_are_recycled(self):
+        """Connections older than max_lifetime are not handed out again"""
+        # Arrange
+        pool = ConnectionPool(check=lambda connection: True, max_size=1, max_lifetime=0)
+        old = pool.acquire(self.connect)
+        pool.release(old)
+
+        # Act
+        new = pool.acquire(self.connect)
+
+        # Assert
+        self.assertTrue(old.closed)
+        self.assertIsNot(new, old)
@@ -0,0 +1,189 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Tag, Word, Meaning, UserExample, WordMeaning, ReviewLog, UserStats, AccountDeletion
+from ..services.lexicon_service import set_meanings
+
+
+class SoftDeleteTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with a tagged word that has meanings, an example and a review"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(user=self.user, name='Tech Words')
+        self.word = Word.objects.create(user=self.user, tag=self.tag, word='algorithm')
+        set_meanings([(self.word, [('noun', [('A step-by-step procedure', None)])])])
+        UserExample.objects.create(word=self.word, user=self.user, example_text='I wrote an algorithm.')
+        ReviewLog.objects.create(
+            user=self.user, word=self.word, event_id=uuid.uuid4(), rating=3,
+            reviewed_at=timezone.now(), interval=1, ease=2.5,
+        )
+
+    def _purge(self, **options):
+        out = StringIO()
+        call_command('purge_deleted', stdout=out, **options)
+        return out.getvalue()
+
+    def test_deleted_word_is_hidden_at_once(self):
+        """A deleted word disappears from every endpoint but its rows stay until the purge"""
+        # Act
+        response = self.client.delete(reverse('word_detail', kwargs={'pk': self.word.id}))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(reverse('words_list_create')).data, [])
+        self.assertEqual(
+            self.client.get(reverse('word_detail', kwargs={'pk': self.word.id})).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(
+            self.client.get(reverse('user-example-list', kwargs={'word_id': self.word.id})).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(self.client.get(reverse('review_next')).data, [])
+        self.assertTrue(UserExample.objects.filter(word_id=self.word.id).exists())
+        self.assertIsNotNone(Word.all_objects.get(id=self.word.id).deleted_at)
+
+    def test_deleted_word_can_be_saved_again(self):
+        """The duplicate check ignores deleted words"""
+        # Arrange
+        self.client.delete(reverse('word_detail', kwargs={'pk': self.word.id}))
+
+        # Act
+        response = self.client.post(reverse('words_list_create'), {'word': 'Algorithm'}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_deleted_tag_untags_its_words(self):
+        """A deleted tag is hidden and its words show as untagged"""
+        # Act
+        response = self.client.delete(reverse('tag_detail', kwargs={'pk': self.tag.id}))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(reverse('tags_list_create')).data, [])
+        self.assertEqual(
+            self.client.get(reverse('words_by_tag', kwargs={'pk': self.tag.id})).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertIsNone(self.client.get(reverse('word_detail', kwargs={'pk': self.word.id})).data['tag'])
+        self.assertTrue(Tag.all_objects.filter(id=self.tag.id).exists())
+
+    def test_reconcile_ignores_deleted_words(self):
+        """Rebuilt statistics leave out deleted words and their examples"""
+        # Arrange
+        self.client.delete(reverse('word_detail', kwargs={'pk': self.word.id}))
+
+        # Act
+        call_command('reconcile_stats', stdout=StringIO())
+
+        # Assert
+        stats = UserStats.objects.get(user=self.user)
+        self.assertEqual((stats.words, stats.examples), (0, 0))
+
+    def test_purge_removes_deleted_rows(self):
+        """The purge deletes words with their examples and links, keeping review history"""
+        # Arrange
+        self.client.delete(reverse('word_detail', kwargs={'pk': self.word.id}))
+        self.client.delete(reverse('tag_detail', kwargs={'pk': self.tag.id}))
+        kept = Word.objects.create(user=self.user, word='serendipity')
+
+        # Act
+        output = self._purge(batch_size=1)
+
+        # Assert
+        self.assertIn('Purged 1 words, 1 tags and 0 accounts', output)
+        self.assertEqual(list(Word.all_objects.values_list('id', flat=True)), [kept.id])
+        self.assertFalse(Tag.all_objects.exists())
+        self.assertFalse(UserExample.objects.exists())
+        self.assertFalse(WordMeaning.objects.exists())
+        self.assertIsNone(ReviewLog.objects.get().word_id)
+        # Shared meanings stay for dedupe_lexicon to prune
+        self.assertTrue(Meaning.objects.exists())
+
+    def test_purge_waits_for_the_grace_period(self):
+        """--older-than-days keeps recent deletions"""
+        # Arrange
+        self.client.delete(reverse('word_detail', kwargs={'pk': self.word.id}))
+
+        # Act
+        output = self._purge(older_than_days=1)
+
+        # Assert
+        self.assertIn('Purged 0 words', output)
+        Word.all_objects.filter(id=self.word.id).update(deleted_at=timezone.now() - timedelta(days=2))
+        self.assertIn('Purged 1 words', self._purge(older_than_days=1))
+
+
+class AccountDeletionTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with some vocabulary and another user"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(username='otheruser', password='otherpass123')
+        tag = Tag.objects.create(user=self.user, name='Tech Words')
+        word = Word.objects.create(user=self.user, tag=tag, word='algorithm')
+        UserExample.objects.create(word=word, user=self.user, example_text='I wrote an algorithm.')
+        Word.objects.create(user=self.other_user, word='algorithm')
+        self.account_url = reverse('delete_account')
+
+    def _login(self, username='testuser', password='testpass123'):
+        return self.client.post(reverse('token_obtain_pair'), {'username': username, 'password': password})
+
+    def test_wrong_password_keeps_the_account(self):
+        """Closing an account needs the current password"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+
+        # Act
+        response = self.client.delete(self.account_url, {'password': 'wrong'}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(AccountDeletion.objects.exists())
+
+    def test_closed_account_is_locked_out(self):
+        """After closing, the account's tokens and password stop working"""
+        # Arrange
+        access = self._login().data['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        # Act
+        response = self.client.delete(self.account_url, {'password': 'testpass123'}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.get(reverse('words_list_create')).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials()
+        self.assertEqual(self._login().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_purge_removes_the_account(self):
+        """The purge deletes the user and everything they own, and nobody else's data"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+        self.client.delete(self.account_url, {'password': 'testpass123'}, format='json')
+
+        # Act
+        out = StringIO()
+        call_command('purge_deleted', batch_size=1, stdout=out)
+
+        # Assert
+        self.assertIn('0 tags and 1 accounts', out.getvalue())
+        self.assertFalse(User.objects.filter(username='testuser').exists())
+        self.assertFalse(Tag.all_objects.exists())
+        self.assertFalse(UserExample.objects.exists())
+        self.assertEqual(list(Word.all_objects.values_list('user__username', flat=True)), ['otheruser'])
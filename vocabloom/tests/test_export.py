@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Tag, Word
+from ..services.lexicon_service import set_meanings
+
+
+class WordExportTestCase(APITestCase):
+    def setUp(self):
+        """Set up test data and authenticate user"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+
+        tag = Tag.objects.create(user=self.user, name='Tech Words')
+        word = Word.objects.create(
+            user=self.user, tag=tag, word='algorithm', phonetic='/ˈælɡərɪðəm/'
+        )
+        set_meanings([(word, [('noun', [
+            ('A step-by-step procedure', 'The algorithm sorts the list.'),
+            ('A set of rules', None),
+        ])])])
+        Word.objects.create(user=self.user, word='serendipity', note='lucky find')
+        Word.objects.create(user=self.other_user, word='secret')
+
+        self.export_url = reverse('words_export')
+
+    def _content(self, response):
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_export_csv_success(self):
+        """CSV export has one row per definition and one per bare word"""
+        # Act
+        response = self.client.get(self.export_url, {'format': 'csv'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn('text/csv', response['Content-Type'])
+        self.assertIn('attachment', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(self._content(response))))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['word'], 'algorithm')
+        self.assertEqual(rows[0]['tag'], 'Tech Words')
+        self.assertEqual(rows[0]['example'], 'The algorithm sorts the list.')
+        self.assertEqual(rows[2]['word'], 'serendipity')
+        self.assertNotIn('secret', [row['word'] for row in rows])
+
+    def test_export_jsonl_success(self):
+        """JSON Lines export has one nested word object per line"""
+        # Act
+        response = self.client.get(self.export_url, {'format': 'jsonl'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = [json.loads(line) for line in self._content(response).splitlines()]
+        self.assertEqual([line['word'] for line in lines], ['algorithm', 'serendipity'])
+        self.assertEqual(len(lines[0]['meanings'][0]['definitions']), 2)
+        self.assertEqual(lines[0]['tag_name'], 'Tech Words')
+
+    def test_export_anki_success(self):
+        """Anki export is tab separated with tags in the third column"""
+        # Act
+        response = self.client.get(self.export_url, {'format': 'anki'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = self._content(response).splitlines()
+        self.assertEqual(lines[0], '#separator:tab')
+        cards = [line.split('\t') for line in lines if not line.startswith('#')]
+        self.assertEqual(len(cards), 2)
+        self.assertIn('algorithm', cards[0][0])
+        self.assertIn('<li>A set of rules</li>', cards[0][1])
+        self.assertEqual(cards[0][2], 'Tech_Words')
+
+    def test_export_unknown_format_returns_not_found(self):
+        """Unsupported formats are rejected"""
+        # Act
+        response = self.client.get(self.export_url, {'format': 'xml'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_unauthenticated_returns_unauthorized(self):
+        """Export requires authentication"""
+        # Arrange
+        self.client.force_authenticate(user=None)
+
+        # Act
+        response = self.client.get(self.export_url, {'format': 'csv'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('detail', response.json())
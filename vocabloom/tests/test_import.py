@@ -0,0 +1,180 @@
+import io
+import os
+import sqlite3
+import tempfile
+import zipfile
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Tag, Word, Definition
+
+
+def build_apkg(notes):
+    """Build a minimal Anki package holding the given (fields, tags) notes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'collection.anki2')
+        connection = sqlite3.connect(db_path)
+        connection.execute('CREATE TABLE notes (id INTEGER PRIMARY KEY, flds TEXT, tags TEXT)')
+        connection.executemany(
+            'INSERT INTO notes (flds, tags) VALUES (?, ?)',
+            [('\x1f'.join(fields), tags) for fields, tags in notes],
+        )
+        connection.commit()
+        connection.close()
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as package:
+            package.write(db_path, 'collection.anki2')
+            package.writestr('media', '{}')
+        return buffer.getvalue()
+
+
+class DeckImportTestCase(APITestCase):
+    def setUp(self):
+        """Set up test data and authenticate user"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        Word.objects.create(user=self.user, word='Algorithm')
+        self.import_url = reverse('words_import')
+
+    def test_import_csv_with_header_success(self):
+        """CSV rows become words; repeated rows add definitions"""
+        # Arrange
+        content = (
+            'word,part_of_speech,definition,example,tag\n'
+            'serendipity,noun,A happy accident,Finding it was serendipity.,Feelings\n'
+            'serendipity,noun,Luck in finding things,,Feelings\n'
+            'algorithm,noun,A procedure,,Tech\n'
+            'ephemeral,adjective,Lasting a short time,,\n'
+        ).encode('utf-8')
+        upload = SimpleUploadedFile('deck.csv', content, content_type='text/csv')
+
+        # Act
+        response = self.client.post(self.import_url, {'file': upload}, format='multipart')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['rows'], 4)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['merged'], 1)
+        self.assertEqual(response.data['duplicates'], 1)
+        self.assertIn('rows_per_second', response.data)
+
+        word = Word.objects.get(user=self.user, word='serendipity')
+        self.assertEqual(word.tag.name, 'Feelings')
+        meaning = word.meanings.get()
+        self.assertEqual(meaning.part_of_speech, 'noun')
+        self.assertEqual(meaning.definitions.count(), 2)
+        self.assertEqual(Word.objects.filter(user=self.user, word__iexact='algorithm').count(), 1)
+
+    def test_import_apkg_success(self):
+        """Anki notes map front to word, back to definition and tags to a tag"""
+        # Arrange
+        content = build_apkg([
+            (['<b>ubiquitous</b>', 'Found everywhere&nbsp;[sound:u.mp3]'], ' GRE_Words '),
+            (['ALGORITHM', 'Duplicate of an existing word'], ''),
+            (['laconic', 'Using few words<br>Brief'], 'GRE_Words vocab'),
+        ])
+        upload = SimpleUploadedFile('deck.apkg', content, content_type='application/zip')
+
+        # Act
+        response = self.client.post(self.import_url, {'file': upload}, format='multipart')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['duplicates'], 1)
+        self.assertEqual(Tag.objects.filter(user=self.user, name='GRE Words').count(), 1)
+        definition = Definition.objects.get(meaning__words__word='ubiquitous')
+        self.assertEqual(definition.definition, 'Found everywhere')
+        self.assertEqual(
+            Definition.objects.get(meaning__words__word='laconic').definition,
+            'Using few words\nBrief'
+        )
+
+    def test_import_invalid_apkg_returns_bad_request(self):
+        """A file that is not a zip is rejected"""
+        # Arrange
+        upload = SimpleUploadedFile('deck.apkg', b'not a zip')
+
+        # Act
+        response = self.client.post(self.import_url, {'file': upload}, format='multipart')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+    def test_import_unreadable_csv_returns_bad_request(self):
+        """Text that isn't UTF-8 or can't be parsed as CSV is a 400, not a server error"""
+        for content in (b'word\n\xff\xfe\n', b'word,definition\nlong,"' + b'x' * 200000 + b'"\n'):
+            with self.subTest(content=content[:20]):
+                # Arrange
+                upload = SimpleUploadedFile('deck.csv', content, content_type='text/csv')
+
+                # Act
+                response = self.client.post(self.import_url, {'file': upload}, format='multipart')
+
+                # Assert
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('error', response.data)
+
+    def test_import_strips_nul_bytes(self):
+        """NUL characters are dropped from imported fields"""
+        # Arrange
+        upload = SimpleUploadedFile('deck.csv', b'word,definition\nhel\x00lo,A gr\x00eeting\n', content_type='text/csv')
+
+        # Act
+        response = self.client.post(self.import_url, {'file': upload}, format='multipart')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Word.objects.filter(user=self.user, word='hello').exists())
+        self.assertEqual(Definition.objects.get(meaning__words__word='hello').definition, 'A greeting')
+
+    def test_import_apkg_size_is_limited(self):
+        """A collection that unpacks past IMPORT_MAX_COLLECTION_BYTES is refused before extraction"""
+        # Arrange
+        content = build_apkg([(['ubiquitous', 'Found everywhere'], '')])
+        upload = SimpleUploadedFile('deck.apkg', content, content_type='application/zip')
+
+        # Act
+        with self.settings(IMPORT_MAX_COLLECTION_BYTES=1024):
+            response = self.client.post(self.import_url, {'file': upload}, format='multipart')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('larger than', response.data['error'])
+        self.assertFalse(Word.objects.filter(word='ubiquitous').exists())
+
+    def test_import_missing_file_returns_bad_request(self):
+        """A request without a file is rejected"""
+        # Act
+        response = self.client.post(self.import_url, {}, format='multipart')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('File is required', response.data['error'])
+
+    def test_import_deck_command_batches(self):
+        """The management command imports headerless TSV decks in batches"""
+        # Arrange
+        lines = ['#separator:tab'] + [f'word{i}\tdefinition {i}\tbulk' for i in range(7)]
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as deck:
+            deck.write('\n'.join(lines))
+        self.addCleanup(os.remove, deck.name)
+        out = io.StringIO()
+
+        # Act
+        call_command('import_deck', 'testuser', deck.name, '--batch-size', '3', stdout=out)
+
+        # Assert
+        self.assertIn('Imported 7 words', out.getvalue())
+        self.assertEqual(Word.objects.filter(user=self.user, tag__name='bulk').count(), 7)
+        self.assertEqual(Definition.objects.filter(meaning__words__user=self.user).count(), 7)
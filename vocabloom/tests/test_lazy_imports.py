@@ -0,0 +1,52 @@
+import json
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from ..management.commands.profile_imports import parse_importtime
+from ..services.lazy import LazyModule
+
+
+class LazyImportTestCase(SimpleTestCase):
+    def test_module_loads_on_first_attribute_access(self):
+        """Nothing is imported until an attribute is used"""
+        # Arrange
+        lazy_json = LazyModule('json')
+        self.assertIn('not loaded', repr(lazy_json))
+
+        # Act
+        result = lazy_json.dumps({'a': 1})
+
+        # Assert
+        self.assertEqual(result, '{"a": 1}')
+        self.assertIn('(loaded)', repr(lazy_json))
+
+    def test_parse_importtime_counts_top_level_imports_once(self):
+        """Nested imports are included in their parent's cumulative time only"""
+        # Arrange
+        stderr = (
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       100 |        100 |     rest_framework.fields\n'
+            'import time:       200 |        300 |   rest_framework.serializers\n'
+            'import time:        50 |        350 | rest_framework\n'
+            'import time:       400 |        400 | django.db\n'
+        )
+
+        # Act
+        total_us, packages = parse_importtime(stderr)
+
+        # Assert
+        self.assertEqual(total_us, 750)
+        self.assertEqual(packages, {'rest_framework': 350, 'django': 400})
+
+    def test_worker_boot_does_not_import_sdks(self):
+        """Loading the URLconf leaves boto3 and the Gemini SDK unimported"""
+        # Arrange
+        out = StringIO()
+
+        # Act
+        call_command('profile_imports', json=True, stdout=out)
+
+        # Assert
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['eager_sdks'], [])
+        self.assertIn('django', report['packages_ms'])
@@ -0,0 +1,140 @@
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Word, Meaning, Definition
+from ..services.lexicon_service import set_meanings
+
+SERENDIPITY = [
+    {'part_of_speech': 'noun', 'definitions': [
+        {'definition': 'Finding something good without looking for it', 'example': 'Pure serendipity.'},
+    ]},
+    {'part_of_speech': 'adjective', 'definitions': [{'definition': 'Happening by chance'}]},
+]
+
+
+class LexiconTestCase(APITestCase):
+    def setUp(self):
+        """Set up two users who both save the same dictionary entry"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.words_url = reverse('words_list_create')
+
+    def _save(self, user, word='serendipity', meanings=SERENDIPITY):
+        self.client.force_authenticate(user=user)
+        response = self.client.post(self.words_url, {'word': word, 'meanings': meanings}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response
+
+    def _meanings(self, response):
+        return [
+            (meaning['part_of_speech'], [item['definition'] for item in meaning['definitions']])
+            for meaning in response.data['meanings']
+        ]
+
+    def test_same_entry_is_stored_once(self):
+        """Users saving the same entry share its meaning and definition rows"""
+        # Arrange
+        first = self._save(self.user)
+
+        # Act
+        second = self._save(self.other_user)
+
+        # Assert
+        self.assertEqual(Meaning.objects.count(), 2)
+        self.assertEqual(Definition.objects.count(), 2)
+        self.assertEqual(self._meanings(second), self._meanings(first))
+        self.assertEqual(second.data['meanings'][0]['definitions'][0]['example'], 'Pure serendipity.')
+
+    def test_meanings_keep_their_order(self):
+        """A shared meaning created by another word keeps this word's order"""
+        # Arrange
+        self._save(self.other_user, word='luck', meanings=SERENDIPITY[1:])
+
+        # Act
+        self._save(self.user)
+        response = self.client.get(reverse('word_detail', kwargs={'pk': Word.objects.get(user=self.user).id}))
+
+        # Assert
+        self.assertEqual([meaning for meaning, _ in self._meanings(response)], ['noun', 'adjective'])
+
+    def test_override_is_copy_on_write(self):
+        """Changing one user's meanings leaves the other user's untouched"""
+        # Arrange
+        self._save(self.other_user)
+        word_id = self._save(self.user).data['id']
+
+        # Act
+        response = self.client.put(reverse('word_detail', kwargs={'pk': word_id}), {
+            'word': 'serendipity',
+            'meanings': [{'part_of_speech': 'noun', 'definitions': [{'definition': 'My own wording'}]}],
+        }, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._meanings(response), [('noun', ['My own wording'])])
+        other = Word.objects.get(user=self.other_user)
+        self.assertEqual(
+            [meaning.definitions.get().definition for meaning in other.meanings.order_by('word_links__position')],
+            ['Finding something good without looking for it', 'Happening by chance'],
+        )
+
+    def test_update_without_meanings_keeps_them(self):
+        """A PUT that leaves out meanings does not unlink them"""
+        # Arrange
+        word_id = self._save(self.user).data['id']
+
+        # Act
+        self.client.put(reverse('word_detail', kwargs={'pk': word_id}), {'word': 'serendipity', 'note': 'Nice'}, format='json')
+
+        # Assert
+        self.assertEqual(Word.objects.get(id=word_id).meanings.count(), 2)
+
+    def test_dedupe_command_merges_and_prunes(self):
+        """dedupe_lexicon merges rows written around the lexicon and drops unused ones"""
+        # Arrange
+        word = Word.objects.get(id=self._save(self.user).data['id'])
+        other = Word.objects.create(user=self.other_user, word='serendipity')
+        copy = Meaning.objects.create(part_of_speech='adjective')
+        Definition.objects.create(meaning=copy, definition='Happening by chance')
+        other.meanings.add(copy)
+        set_meanings([(word, [('noun', [('Replaced', None)])])], replace=True)
+        out = StringIO()
+
+        # Act
+        call_command('dedupe_lexicon', stdout=out)
+
+        # Assert
+        self.assertIn('merged 1 duplicates', out.getvalue())
+        self.assertIn('deleted 1 unused meanings', out.getvalue())
+        self.assertEqual(
+            sorted(Meaning.objects.values_list('part_of_speech', flat=True)), ['adjective', 'noun']
+        )
+        self.assertFalse(Meaning.objects.filter(content_hash__isnull=True).exists())
+        self.assertEqual(other.meanings.get().definitions.get().definition, 'Happening by chance')
+        other.refresh_from_db()
+        self.assertEqual(other.content['meanings'][0]['id'], other.meanings.get().id)
+
+    def test_report_counts_saved_rows(self):
+        """The report compares stored rows with per-word copies"""
+        # Arrange
+        self._save(self.user)
+        self._save(self.other_user)
+        out = StringIO()
+
+        # Act
+        call_command('dedupe_lexicon', report_only=True, stdout=out)
+
+        # Assert
+        self.assertIn('meanings: 2 stored for 4 per-word copies, 2 saved (50%)', out.getvalue())
+        self.assertIn('definitions: 2 stored for 4 per-word copies, 2 saved (50%)', out.getvalue())
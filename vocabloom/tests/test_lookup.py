@@ -0,0 +1,127 @@
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch
+from ..models import DictionaryEntry
+from ..services.dictionary_service import FixtureDictionaryClient
+
+
+class DictionaryLookupTestCase(APITestCase):
+    def setUp(self):
+        """Set up an authenticated user; lookups use the fixture dictionary"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        fetch = patch.object(FixtureDictionaryClient, 'fetch', autospec=True, side_effect=FixtureDictionaryClient.fetch)
+        self.fetch = fetch.start()
+        self.addCleanup(fetch.stop)
+
+    def _lookup(self, term):
+        return self.client.get(reverse('dictionary_lookup', kwargs={'term': term}))
+
+    def test_lookup_returns_a_word_payload(self):
+        """A found word comes back in the shape POST /api/words/ accepts"""
+        # Act
+        response = self._lookup('serendipity')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['word'], 'serendipity')
+        self.assertEqual(response.data['phonetic'], '/ˌsɛɹənˈdɪpɪti/')
+        self.assertTrue(response.data['audio'].endswith('serendipity-us.mp3'))
+        definitions = response.data['meanings'][0]['definitions']
+        self.assertEqual(len(definitions), 2)
+        self.assertIsNone(definitions[0]['example'])
+        created = self.client.post(reverse('words_list_create'), response.data, format='json')
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(created.data['meanings'][0]['definitions']), 2)
+
+    def test_entries_are_merged(self):
+        """Meanings from every upstream entry for the word are returned"""
+        # Act
+        response = self._lookup('run')
+
+        # Assert
+        self.assertEqual([meaning['part_of_speech'] for meaning in response.data['meanings']], ['verb', 'noun'])
+
+    def test_repeat_lookups_are_served_from_the_cache(self):
+        """Any user's later lookup of the same term skips the upstream"""
+        # Arrange
+        self._lookup('algorithm')
+        other = User.objects.create_user(username='otheruser', password='otherpass123')
+        self.client.force_authenticate(user=other)
+
+        # Act
+        response = self._lookup('  Algorithm ')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.fetch.call_count, 1)
+
+    def test_unknown_words_are_cached_too(self):
+        """An unknown word is a 404 and is not asked for again until it expires"""
+        # Act
+        first = self._lookup('qwzxv')
+        second = self._lookup('qwzxv')
+
+        # Assert
+        self.assertEqual((first.status_code, second.status_code), (status.HTTP_404_NOT_FOUND,) * 2)
+        self.assertEqual(self.fetch.call_count, 1)
+        entry = DictionaryEntry.objects.get(term='qwzxv')
+        self.assertFalse(entry.found)
+        self.assertLess(entry.expires_at, timezone.now() + timedelta(days=2))
+
+    def test_expired_entries_are_refreshed(self):
+        """An expired entry is fetched again"""
+        # Arrange
+        self._lookup('serendipity')
+        DictionaryEntry.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        # Act
+        response = self._lookup('serendipity')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.fetch.call_count, 2)
+        self.assertGreater(DictionaryEntry.objects.get().expires_at, timezone.now())
+
+    def test_stale_entry_is_served_while_the_upstream_fails(self):
+        """A failing upstream falls back to the expired entry"""
+        # Arrange
+        self._lookup('serendipity')
+        DictionaryEntry.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        self.fetch.side_effect = ConnectionError('upstream down')
+
+        # Act
+        response = self._lookup('serendipity')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['word'], 'serendipity')
+
+    def test_upstream_failure_without_cache_is_503(self):
+        """Nothing cached and a failing upstream gives 503, and nothing is stored"""
+        # Arrange
+        self.fetch.side_effect = ConnectionError('upstream down')
+
+        # Act
+        response = self._lookup('algorithm')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(DictionaryEntry.objects.exists())
+
+    def test_overlong_term_is_rejected(self):
+        """Terms longer than a word can be are a 400"""
+        # Act
+        response = self._lookup('a' * 101)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.fetch.assert_not_called()
@@ -0,0 +1,165 @@
+import json
+import os
+import random
+import shutil
+import tempfile
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch
+from .. import metrics
+from ..metrics import Histogram, bucket_bounds, bucket_index
+
+
+class HistogramTestCase(SimpleTestCase):
+    def test_buckets_cover_values_exactly(self):
+        """Every value lands in a bucket whose bounds contain it"""
+        for value in list(range(200)) + [1_000, 65_535, 1_234_567, 60_000_000]:
+            low, high = bucket_bounds(bucket_index(value))
+            self.assertLessEqual(low, value)
+            self.assertGreaterEqual(high, value)
+
+    def test_quantiles_are_within_bucket_precision(self):
+        """p50/p99 stay within the ~6% relative error of the buckets"""
+        # Arrange
+        rng = random.Random(42)
+        values = sorted(rng.randint(1_000, 500_000) for _ in range(10_000))
+        histogram = Histogram()
+        for value in values:
+            histogram.record(value)
+
+        # Act - Assert
+        for q in (0.5, 0.99):
+            exact = values[int(q * len(values)) - 1]
+            self.assertAlmostEqual(histogram.quantile(q), exact, delta=exact * 0.07)
+
+    def test_merge_equals_recording_everything_once(self):
+        """Merged worker histograms give the same quantiles as one histogram"""
+        # Arrange
+        first, second, combined = Histogram(), Histogram(), Histogram()
+        for value in range(1, 1000):
+            (first if value % 2 else second).record(value)
+            combined.record(value)
+
+        # Act
+        first.merge(second.buckets, second.count, second.total)
+
+        # Assert
+        self.assertEqual(first.count, combined.count)
+        self.assertEqual(first.quantile(0.95), combined.quantile(0.95))
+
+
+class MetricsEndpointTestCase(APITestCase):
+    def setUp(self):
+        """Set up a regular and a staff user"""
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.staff = User.objects.create_user(username='staff', password='staffpass123', is_staff=True)
+        self.metrics_url = reverse('metrics')
+
+    def test_metrics_report_route_latency(self):
+        """Requests show up as per-route latency quantiles and counters"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+        self.client.get(reverse('tags_list_create'))
+
+        # Act
+        response = self.client.get(self.metrics_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn('vocabloom_http_request_duration_seconds{method="GET",route="tags_list_create",quantile="0.99"}', body)
+        self.assertIn('vocabloom_http_requests_total{method="GET",route="tags_list_create",status="200"}', body)
+        self.assertIn('vocabloom_db_queries_per_request_count{route="tags_list_create"}', body)
+        self.assertIn('vocabloom_circuit_breaker_state', body)
+
+    @override_settings(METRICS_ALLOWED_IPS=[])
+    def test_non_staff_outside_allowed_ips_is_forbidden(self):
+        """Regular users from other addresses cannot read metrics"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+
+        # Act
+        response = self.client.get(self.metrics_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(METRICS_ALLOWED_IPS=[])
+    def test_staff_can_read_metrics_from_anywhere(self):
+        """Staff users can read metrics from any address"""
+        # Arrange
+        self.client.force_authenticate(user=self.staff)
+
+        # Act
+        response = self.client.get(self.metrics_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.0/8'])
+    def test_scraper_in_allowed_network_needs_no_login(self):
+        """A scraper inside an allowed network reads metrics without a token"""
+        # Act
+        response = self.client.get(self.metrics_url, REMOTE_ADDR='10.1.2.3')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_worker_snapshots_are_merged(self):
+        """With a multiprocess directory, other workers' totals are added in"""
+        # Arrange
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        other_worker = Histogram()
+        other_worker.record(250_000)
+        # The test runner's parent stands in for another live worker
+        other_pid = os.getppid()
+        with open(os.path.join(directory, f'metrics-{other_pid}-a1b2c3d4.json'), 'w') as snapshot:
+            json.dump({
+                'pid': other_pid,
+                'histograms': [['upstream_call_duration', [['service', 'polly']],
+                                other_worker.buckets, other_worker.count, other_worker.total]],
+                'counters': [['upstream_calls_total', [['outcome', 'error'], ['service', 'polly']], 3]],
+                'breakers': {'polly': 'open'},
+            }, snapshot)
+
+        # Act
+        with override_settings(METRICS_MULTIPROC_DIR=directory):
+            body = metrics.render_prometheus()
+
+        # Assert
+        self.assertIn('vocabloom_upstream_calls_total{outcome="error",service="polly"} 3', body)
+        self.assertIn(f'vocabloom_circuit_breaker_state{{service="polly",pid="{other_pid}"}} 2', body)
+        self.assertTrue(any(name.startswith(f'metrics-{os.getpid()}-') for name in os.listdir(directory)))
+
+    def test_exited_workers_are_dropped(self):
+        """Snapshots of workers that are gone, or of an earlier process with our pid, are removed"""
+        # Arrange
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        payload = {
+            'histograms': [],
+            'counters': [['upstream_calls_total', [['outcome', 'error'], ['service', 'gemini']], 7]],
+            'breakers': {'gemini': 'open'},
+        }
+        dead_pid = 999999
+        for name, pid in ((f'metrics-{dead_pid}-a1b2c3d4.json', dead_pid), (f'metrics-{os.getpid()}-e5f6a7b8.json', os.getpid())):
+            with open(os.path.join(directory, name), 'w') as snapshot:
+                json.dump({'pid': pid, **payload}, snapshot)
+        self.addCleanup(setattr, metrics, '_snapshot_owner', metrics._snapshot_owner)
+        metrics._snapshot_owner = None
+
+        # Act
+        with patch('vocabloom.metrics._pid_alive', side_effect=lambda pid: pid != dead_pid), \
+                override_settings(METRICS_MULTIPROC_DIR=directory):
+            body = metrics.render_prometheus()
+
+        # Assert
+        self.assertNotIn('outcome="error",service="gemini"', body)
+        self.assertNotIn(f'pid="{dead_pid}"', body)
+        self.assertEqual([name for name in os.listdir(directory) if name.startswith(f'metrics-{dead_pid}-')], [])
+        self.assertEqual(len([name for name in os.listdir(directory) if name.startswith(f'metrics-{os.getpid()}-')]), 1)
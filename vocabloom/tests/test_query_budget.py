@@ -0,0 +1,356 @@
+import io
+import itertools
+import uuid
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import URLPattern, reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from unittest.mock import patch
+from .. import urls
+from ..models import Tag, Word, UserExample
+from ..services.content_service import refresh_content
+from ..services.lexicon_service import set_meanings
+from .query_budget import QueryBudgetExceeded, QueryBudgetMixin, query_budget
+
+# Maximum queries per route and method, counting the JWT user lookup and
+# savepoints. They must hold at every data size; raise one only with a reason.
+# Writes include one upsert per statistics rollup they change (see
+# StatsService), made in the same transaction as the write, so a service's
+# own transaction inside it costs a savepoint. Word writes are measured with
+# meanings new to the shared lexicon, the costlier case (see
+# lexicon_service.intern). Writes to meanings or examples also lock the
+# word and re-render its content snapshot, which is what lets word reads be
+# a single scan of one table.
+BUDGETS = {
+    'token_obtain_pair': {'POST': 1},
+    'token_refresh': {'POST': 1},
+    'logout': {'POST': 1},
+    'is_authenticated': {'GET': 1},
+    'register_user': {'POST': 4},
+    'delete_account': {'DELETE': 5},
+    'tags_list_create': {'GET': 2},
+    'tag_detail': {'GET': 2, 'DELETE': 6},
+    'words_list_create': {'GET': 2, 'POST': 19},
+    'word_detail': {'GET': 2, 'DELETE': 8},
+    'words_batch': {'POST': 14},
+    'words_export': {'GET': 2},
+    'words_import': {'POST': 18},
+    'words_by_tag': {'GET': 3},
+    'dictionary_lookup': {'GET': 4},
+    'text_to_speech': {'POST': 1},
+    'user-example-list': {'GET': 3},
+    'user-example-create': {'POST': 10},
+    'user-example-detail': {'GET': 3},
+    'generate-word-example': {'POST': 2},
+    'review': {'POST': 11},
+    'review_next': {'GET': 2},
+    'quiz': {'GET': 6},
+    'stats': {'GET': 4},
+    'batch': {'POST': 5},
+    'metrics': {'GET': 1},
+}
+
+SIZES = (2, 20)
+
+
+class QueryBudgetTestCase(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        """Set up a user with a tagged word and a bearer token"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.refresh.access_token}')
+        self.tag = Tag.objects.create(user=self.user, name='Tech Words')
+        self.word = self._add_word('algorithm')
+        self.example = UserExample.objects.create(word=self.word, user=self.user, example_text='An example.')
+        self.counter = itertools.count()
+
+    def _add_word(self, text):
+        word = Word.objects.create(user=self.user, tag=self.tag, word=text)
+        senses = [('First sense', 'Used here.'), ('Second sense', None)]
+        set_meanings([(word, [('noun', senses), ('verb', senses)])])
+        UserExample.objects.create(word=word, user=self.user, example_text='My own sentence.')
+        refresh_content([word.id], parts=('user_examples',))
+        return word
+
+    def grow_vocabulary(self, size):
+        """Grow the user's vocabulary (and tags) to `size` words"""
+        for number in range(Word.objects.filter(user=self.user).count(), size):
+            self._add_word(f'word{number}')
+        for number in range(Tag.objects.filter(user=self.user).count(), size):
+            Tag.objects.create(user=self.user, name=f'tag{number}')
+
+    def grow_examples(self, size):
+        """Grow the examples on the fixed word to `size`"""
+        for number in range(self.word.user_examples.count(), size):
+            UserExample.objects.create(word=self.word, user=self.user, example_text=f'Example {number}.')
+
+    def check(self, name, method, request, expected_status, grow=None):
+        def send():
+            response = request()
+            if hasattr(response, 'streaming_content'):
+                b''.join(response.streaming_content)
+            self.assertEqual(response.status_code, expected_status)
+
+        self.assertConstantQueries(
+            send, grow or self.grow_vocabulary, sizes=SIZES,
+            max_queries=BUDGETS[name][method], label=f'{method} {name}',
+        )
+
+    def test_every_endpoint_has_a_budget(self):
+        """Each route in vocabloom/urls.py is covered by a budget"""
+        # Arrange
+        names = {pattern.name for pattern in urls.urlpatterns if isinstance(pattern, URLPattern)}
+
+        # Assert
+        self.assertEqual(names, set(BUDGETS))
+
+    def test_budget_failure_lists_sql_with_stack(self):
+        """Going over budget reports each query and the code that ran it"""
+        # Act
+        with self.assertRaises(QueryBudgetExceeded) as failure:
+            with query_budget(1, label='loop'):
+                for word in Word.objects.filter(user=self.user):
+                    list(word.meanings.all())
+
+        # Assert
+        message = str(failure.exception)
+        self.assertIn('loop ran 2 queries, budget is 1', message)
+        self.assertIn('vocabloom_meaning', message)
+        self.assertIn('test_query_budget.py', message)
+
+    def test_n_plus_one_is_detected(self):
+        """A query count that grows with the data fails even within budget"""
+        # Act - Assert
+        with self.assertRaisesMessage(QueryBudgetExceeded, 'query count grows with data'):
+            self.assertConstantQueries(
+                lambda: [list(word.meanings.all()) for word in Word.objects.filter(user=self.user)],
+                self.grow_vocabulary,
+                max_queries=100,
+            )
+
+    # ===================================================
+    # AUTHENTICATION
+    # ===================================================
+
+    def test_token_obtain_pair(self):
+        """Login stays within budget"""
+        self.client.credentials()
+        self.check('token_obtain_pair', 'POST', lambda: self.client.post(
+            reverse('token_obtain_pair'), {'username': 'testuser', 'password': 'testpass123'}
+        ), status.HTTP_200_OK)
+
+    def test_token_refresh(self):
+        """Token refresh stays within budget"""
+        self.check('token_refresh', 'POST', lambda: self.client.post(
+            reverse('token_refresh'), {'refresh': str(self.refresh)}
+        ), status.HTTP_200_OK)
+
+    def test_logout(self):
+        """Logout stays within budget"""
+        self.check('logout', 'POST', lambda: self.client.post(reverse('logout')), status.HTTP_200_OK)
+
+    def test_is_authenticated(self):
+        """Auth check stays within budget"""
+        self.check('is_authenticated', 'GET', lambda: self.client.get(reverse('is_authenticated')), status.HTTP_200_OK)
+
+    def test_register_user(self):
+        """Registration stays within budget"""
+        self.client.credentials()
+
+        def register():
+            number = next(self.counter)
+            return self.client.post(reverse('register_user'), {
+                'username': f'newuser{number}',
+                'email': f'new{number}@example.com',
+                'password': 'newpass123',
+                'first_name': 'New',
+                'last_name': 'User',
+            })
+
+        self.check('register_user', 'POST', register, status.HTTP_201_CREATED)
+
+    def test_delete_account(self):
+        """Closing an account costs the same however much the user owns"""
+        def grow(size):
+            self.user = User.objects.create_user(username=f'closing{size}', password='testpass123')
+            self.grow_vocabulary(size)
+            self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+        self.check('delete_account', 'DELETE', lambda: self.client.delete(
+            reverse('delete_account'), {'password': 'testpass123'}, format='json'
+        ), status.HTTP_204_NO_CONTENT, grow=grow)
+
+    # ===================================================
+    # TAGS AND WORDS
+    # ===================================================
+
+    def test_tags_list(self):
+        """Tag list query count does not grow with tags"""
+        self.check('tags_list_create', 'GET', lambda: self.client.get(reverse('tags_list_create')), status.HTTP_200_OK)
+
+    def test_tag_detail(self):
+        """Tag detail stays within budget"""
+        url = reverse('tag_detail', kwargs={'pk': self.tag.id})
+        self.check('tag_detail', 'GET', lambda: self.client.get(url), status.HTTP_200_OK)
+
+    def test_tag_delete(self):
+        """Deleting a tag does not touch its words one by one"""
+        def grow(size):
+            self.tag = Tag.objects.create(user=self.user, name=f'doomed{size}')
+            self.grow_vocabulary(size)
+
+        self.check('tag_detail', 'DELETE', lambda: self.client.delete(
+            reverse('tag_detail', kwargs={'pk': self.tag.id})
+        ), status.HTTP_204_NO_CONTENT, grow=grow)
+
+    def test_words_list(self):
+        """Word list query count does not grow with vocabulary"""
+        self.check('words_list_create', 'GET', lambda: self.client.get(reverse('words_list_create')), status.HTTP_200_OK)
+
+    def test_words_create(self):
+        """Creating a word stays within budget"""
+        self.check('words_list_create', 'POST', lambda: self.client.post(reverse('words_list_create'), {
+            'word': f'new{next(self.counter)}',
+            'tag': self.tag.id,
+            'meanings': [{'part_of_speech': 'noun', 'definitions': [{'definition': f'Something new {next(self.counter)}'}]}],
+        }, format='json'), status.HTTP_201_CREATED)
+
+    def test_word_detail(self):
+        """Word detail stays within budget"""
+        url = reverse('word_detail', kwargs={'pk': self.word.id})
+        self.check('word_detail', 'GET', lambda: self.client.get(url), status.HTTP_200_OK)
+
+    def test_word_delete(self):
+        """Deleting a word does not load its meanings or examples"""
+        def grow(size):
+            self.grow_vocabulary(size)
+            self.grow_examples(size)
+            self.word = self._add_word(f'doomed{size}')
+
+        self.check('word_detail', 'DELETE', lambda: self.client.delete(
+            reverse('word_detail', kwargs={'pk': self.word.id})
+        ), status.HTTP_204_NO_CONTENT, grow=grow)
+
+    def test_words_batch(self):
+        """A batch runs one statement per operation whatever the number of words"""
+        operations = []
+
+        def grow(size):
+            self.grow_vocabulary(size)
+            ids = list(Word.objects.filter(user=self.user).values_list('id', flat=True))
+            operations[:] = [
+                {'op': 'set_tag', 'words': ids, 'tag': self.tag.id},
+                {'op': 'update_note', 'words': ids, 'note': f'Size {size}'},
+                {'op': 'delete', 'words': ids[-1:]},
+            ]
+
+        self.check('words_batch', 'POST', lambda: self.client.post(
+            reverse('words_batch'), {'operations': operations}, format='json'
+        ), status.HTTP_200_OK, grow=grow)
+
+    def test_words_export(self):
+        """Export query count does not grow with vocabulary"""
+        self.check('words_export', 'GET', lambda: self.client.get(reverse('words_export'), {'format': 'jsonl'}), status.HTTP_200_OK)
+
+    def test_words_import(self):
+        """Importing a deck does not query per existing word"""
+        def upload():
+            number = next(self.counter)
+            deck = io.BytesIO(f'word,definition\nfresh{number},Brand new {number}\nalgorithm,Dup\n'.encode())
+            return self.client.post(reverse('words_import'), {
+                'file': SimpleUploadedFile('deck.csv', deck.getvalue(), content_type='text/csv'),
+            }, format='multipart')
+
+        self.check('words_import', 'POST', upload, status.HTTP_201_CREATED)
+
+    def test_words_by_tag(self):
+        """Words-by-tag query count does not grow with vocabulary"""
+        url = reverse('words_by_tag', kwargs={'pk': self.tag.id})
+        self.check('words_by_tag', 'GET', lambda: self.client.get(url), status.HTTP_200_OK)
+
+    # ===================================================
+    # EXAMPLES, AUDIO AND METRICS
+    # ===================================================
+
+    def test_user_example_list(self):
+        """Example list query count does not grow with examples"""
+        url = reverse('user-example-list', kwargs={'word_id': self.word.id})
+        self.check('user-example-list', 'GET', lambda: self.client.get(url), status.HTTP_200_OK, grow=self.grow_examples)
+
+    def test_user_example_create(self):
+        """Creating an example stays within budget"""
+        url = reverse('user-example-create', kwargs={'word_id': self.word.id})
+        self.check('user-example-create', 'POST', lambda: self.client.post(url, {'example_text': 'Another example.'}), status.HTTP_201_CREATED, grow=self.grow_examples)
+
+    def test_user_example_detail(self):
+        """Example detail stays within budget"""
+        url = reverse('user-example-detail', kwargs={'word_id': self.word.id, 'example_id': self.example.id})
+        self.check('user-example-detail', 'GET', lambda: self.client.get(url), status.HTTP_200_OK, grow=self.grow_examples)
+
+    @patch('vocabloom.views.audio_views.PollyService')
+    def test_text_to_speech(self, mock_service):
+        """Audio synthesis does no per-word queries"""
+        mock_service.return_value.text_to_speech.return_value = {'success': True, 'audio_data': ''}
+        self.check('text_to_speech', 'POST', lambda: self.client.post(reverse('text_to_speech'), {'text': 'Hello'}), status.HTTP_200_OK)
+
+    @patch('vocabloom.views.user_example_views.GeminiService')
+    def test_generate_word_example(self, mock_service):
+        """Example generation stays within budget"""
+        mock_service.return_value.generate_user_example.return_value = {'success': True, 'example': 'Hi.'}
+        url = reverse('generate-word-example', kwargs={'word_id': self.word.id})
+        self.check('generate-word-example', 'POST', lambda: self.client.post(url, {}), status.HTTP_200_OK)
+
+    def test_review_next(self):
+        """The review queue query count does not grow with vocabulary"""
+        self.check('review_next', 'GET', lambda: self.client.get(reverse('review_next')), status.HTTP_200_OK)
+
+    def test_dictionary_lookup(self):
+        """A cache miss reads, re-reads inside the single flight and upserts one entry"""
+        self.check('dictionary_lookup', 'GET', lambda: self.client.get(
+            reverse('dictionary_lookup', kwargs={'term': f'unknown{next(self.counter)}'})
+        ), status.HTTP_404_NOT_FOUND)
+
+    def test_review(self):
+        """Logging answers does not query per reviewed word"""
+        reviews = []
+
+        def grow(size):
+            self.grow_vocabulary(size)
+            reviews[:] = [
+                {'event_id': str(uuid.uuid4()), 'word': word_id, 'rating': 3}
+                for word_id in Word.objects.filter(user=self.user).values_list('id', flat=True)
+            ]
+
+        self.check('review', 'POST', lambda: self.client.post(
+            reverse('review'), {'reviews': reviews}, format='json'
+        ), status.HTTP_200_OK, grow=grow)
+
+    def test_quiz(self):
+        """Quiz sampling runs a fixed number of queries at any vocabulary size"""
+        self.check('quiz', 'GET', lambda: self.client.get(reverse('quiz'), {'count': 1}), status.HTTP_200_OK)
+
+    def test_stats(self):
+        """The dashboard reads a fixed number of rollup queries"""
+        self.check('stats', 'GET', lambda: self.client.get(reverse('stats')), status.HTTP_200_OK)
+
+    def test_batch(self):
+        """A batch costs its sub-requests' queries and a single token check"""
+        paths = [
+            reverse('is_authenticated'),
+            reverse('tags_list_create'),
+            reverse('words_list_create'),
+            reverse('user-example-list', kwargs={'word_id': self.word.id}),
+        ]
+        self.check('batch', 'POST', lambda: self.client.post(
+            reverse('batch'), {'requests': [{'path': path} for path in paths]}, format='json'
+        ), status.HTTP_200_OK)
+
+    def test_metrics(self):
+        """Metrics scraping stays within budget"""
+        self.check('metrics', 'GET', lambda: self.client.get(reverse('metrics')), status.HTTP_200_OK)
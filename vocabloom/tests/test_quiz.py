@@ -0,0 +1,131 @@
+import random
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Tag, Word
+from ..services.lexicon_service import set_meanings
+from ..services.quiz_service import IdSampler
+
+
+class QuizTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with defined words, one tagged, and a foreign word"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.tag = Tag.objects.create(user=self.user, name='Tech Words')
+        for number in range(12):
+            self._add_word(self.user, f'word{number}', tag=self.tag if number < 3 else None)
+        self.undefined = Word.objects.create(user=self.user, word='undefined')
+        self._add_word(self.other_user, 'secret')
+        self.quiz_url = reverse('quiz')
+
+    def _add_word(self, user, text, tag=None):
+        word = Word.objects.create(user=user, tag=tag, word=text)
+        set_meanings([(word, [('noun', [(f'Meaning of {text}', None)])])])
+        return word
+
+    def test_questions_have_the_right_answer(self):
+        """Each question offers its own definition at the answer index"""
+        # Act
+        response = self.client.get(self.quiz_url, {'count': 5, 'choices': 4})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len({question['word']['id'] for question in response.data}), 5)
+        for question in response.data:
+            self.assertEqual(len(question['choices']), 4)
+            self.assertEqual(len(set(question['choices'])), 4)
+            self.assertEqual(question['choices'][question['answer']], f"Meaning of {question['word']['word']}")
+
+    def test_only_own_defined_words_are_used(self):
+        """Other users' words and words without definitions never appear"""
+        # Act
+        response = self.client.get(self.quiz_url, {'count': 50, 'choices': 6})
+
+        # Assert
+        words = {question['word']['word'] for question in response.data}
+        choices = {choice for question in response.data for choice in question['choices']}
+        self.assertEqual(len(words), 12)
+        self.assertNotIn('undefined', words)
+        self.assertNotIn('Meaning of secret', choices)
+
+    def test_tag_filter(self):
+        """With a tag only its words are asked; distractors may come from any word"""
+        # Act
+        response = self.client.get(self.quiz_url, {'count': 10, 'tag': self.tag.id})
+
+        # Assert
+        self.assertEqual({question['word']['word'] for question in response.data}, {'word0', 'word1', 'word2'})
+        self.assertTrue(all(len(question['choices']) == 4 for question in response.data))
+
+    def test_small_vocabulary_gets_fewer_choices(self):
+        """Without enough other words a question has fewer choices"""
+        # Arrange
+        Word.objects.filter(user=self.user).exclude(word__in=['word0', 'word1']).delete()
+
+        # Act
+        response = self.client.get(self.quiz_url, {'count': 1, 'choices': 4})
+
+        # Assert
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data[0]['choices']), 2)
+
+    def test_invalid_parameters(self):
+        """count and choices are bounded"""
+        # Act
+        too_many = self.client.get(self.quiz_url, {'count': 500})
+        one_choice = self.client.get(self.quiz_url, {'choices': 1})
+
+        # Assert
+        self.assertEqual(too_many.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(one_choice.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sparse_ids_still_sample_distinct_rows(self):
+        """Sampling over a sparse id range still returns distinct matching ids"""
+        # Arrange
+        for number in range(200):
+            Word.objects.create(user=self.other_user, word=f'filler{number}')
+        last = self._add_word(self.user, 'last')
+        queryset = Word.objects.filter(user=self.user)
+        sampler = IdSampler(queryset, random.Random(7))
+
+        # Act
+        sample = sampler.sample(10, exclude=[last.id])
+
+        # Assert
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(len(set(sample)), 10)
+        self.assertNotIn(last.id, sample)
+        self.assertTrue(set(sample) <= set(queryset.values_list('id', flat=True)))
+
+    def test_gapped_ids_are_sampled_uniformly(self):
+        """A word saved after a long gap in the ids comes up no more often than the rest"""
+        # Arrange
+        Word.objects.all().delete()
+        ids = [*range(1000, 1010), 5000]
+        for word_id in ids:
+            Word.objects.create(id=word_id, user=self.user, word=f'word{word_id}')
+        sampler = IdSampler(Word.objects.filter(user=self.user), random.Random(11))
+        counts = dict.fromkeys(ids, 0)
+
+        # Act
+        for _ in range(1100):
+            for word_id in sampler.sample(2):
+                counts[word_id] += 1
+
+        # Assert
+        # Each word is expected 200 times; seeking to the next id from a
+        # random point would return the last one in nearly every sample
+        for word_id, count in counts.items():
+            self.assertTrue(150 < count < 250, f'word {word_id} sampled {count} times')
@@ -0,0 +1,121 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from unittest.mock import patch
+from ..db import routers
+from ..models import Tag
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTestCase(SimpleTestCase):
+    def setUp(self):
+        """Route with a single replica configured"""
+        self.router = routers.ReplicaRouter()
+
+    def test_reads_outside_requests_use_primary(self):
+        """Management commands and shells never read from a replica"""
+        # Act - Assert
+        self.assertEqual(self.router.db_for_read(Tag), 'default')
+
+    def test_reads_use_primary_until_allowed(self):
+        """A request reads from the primary unless its view opted in"""
+        # Act
+        with routers.request_routing():
+            before = self.router.db_for_read(Tag)
+            routers.allow_replica_reads()
+            after = self.router.db_for_read(Tag)
+
+        # Assert
+        self.assertEqual(before, 'default')
+        self.assertEqual(after, 'replica')
+
+    def test_reads_after_a_write_use_primary(self):
+        """Once a request has written, the rest of it reads from the primary"""
+        # Act
+        with routers.request_routing() as state:
+            routers.allow_replica_reads()
+            self.router.db_for_write(Tag)
+            read = self.router.db_for_read(Tag)
+
+        # Assert
+        self.assertTrue(state.wrote)
+        self.assertEqual(read, 'default')
+
+    def test_migrations_only_run_on_primary(self):
+        """Replicas get their schema through replication"""
+        # Act - Assert
+        self.assertTrue(self.router.allow_migrate('default', 'vocabloom'))
+        self.assertFalse(self.router.allow_migrate('replica', 'vocabloom'))
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTestCase(APITestCase):
+    def setUp(self):
+        """Authenticate a user and stand the primary in for the replica"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.tags_url = reverse('tags_list_create')
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch('vocabloom.db.routers.pick_replica', return_value='default')
+        self.pick_replica = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_list_reads_from_replica(self):
+        """An opted-in list endpoint reads through the replica"""
+        # Act
+        response = self.client.get(self.tags_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.pick_replica.assert_called()
+
+    def test_user_reads_own_writes_from_primary(self):
+        """After creating a tag the user's next list read skips the replica"""
+        # Arrange
+        created = self.client.post(self.tags_url, {'name': 'Fresh'}, format='json')
+        self.pick_replica.reset_mock()
+
+        # Act
+        response = self.client.get(self.tags_url)
+
+        # Assert
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(routers.wrote_recently(self.user.id))
+        self.pick_replica.assert_not_called()
+        self.assertEqual([tag['name'] for tag in response.data], ['Fresh'])
+
+    def test_other_users_keep_reading_from_replica(self):
+        """Stickiness is per user"""
+        # Arrange
+        self.client.post(self.tags_url, {'name': 'Fresh'}, format='json')
+        other = User.objects.create_user(username='other', password='testpass123')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(other).access_token}')
+        self.pick_replica.reset_mock()
+
+        # Act
+        self.client.get(self.tags_url)
+
+        # Assert
+        self.pick_replica.assert_called()
+
+    def test_detail_endpoints_stay_on_primary(self):
+        """Views that did not opt in never read from a replica"""
+        # Arrange
+        tag = Tag.objects.create(user=self.user, name='Tech Words')
+
+        # Act
+        response = self.client.get(reverse('tag_detail', args=[tag.id]))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.pick_replica.assert_not_called()
@@ -0,0 +1,152 @@
+import threading
+import time
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch, MagicMock
+from ..services import polly_service
+from ..services.resilience import (
+    CLOSED,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    call_with_deadline,
+)
+
+
+class ClientMistake(Exception):
+    code = 400
+
+
+class CircuitBreakerTestCase(SimpleTestCase):
+    def _fail(self, breaker, error=RuntimeError('upstream down')):
+        def failing():
+            raise error
+        with self.assertRaises(type(error)):
+            breaker.call(failing)
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        """Consecutive failures open the breaker; later calls never run"""
+        # Arrange
+        breaker = CircuitBreaker('test-open', failure_threshold=3, reset_timeout=60)
+        upstream = MagicMock()
+
+        # Act
+        for _ in range(3):
+            self._fail(breaker)
+
+        # Assert
+        self.assertEqual(breaker.snapshot()['state'], OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.call(upstream)
+        upstream.assert_not_called()
+
+    def test_half_open_trial_closes_breaker(self):
+        """After the reset timeout one successful trial closes the breaker"""
+        # Arrange
+        breaker = CircuitBreaker('test-half-open', failure_threshold=1, reset_timeout=0.01)
+        self._fail(breaker)
+        time.sleep(0.02)
+
+        # Act
+        result = breaker.call(lambda: 'ok')
+
+        # Assert
+        self.assertEqual(result, 'ok')
+        self.assertEqual(breaker.snapshot()['state'], CLOSED)
+
+    def test_failed_trial_reopens_breaker(self):
+        """A failing half-open trial re-opens the breaker"""
+        # Arrange
+        breaker = CircuitBreaker('test-reopen', failure_threshold=1, reset_timeout=0.01)
+        self._fail(breaker)
+        time.sleep(0.02)
+
+        # Act
+        self._fail(breaker)
+
+        # Assert
+        self.assertEqual(breaker.snapshot()['state'], OPEN)
+
+    def test_client_errors_do_not_open_breaker(self):
+        """4xx errors are the caller's fault and keep the breaker closed"""
+        # Arrange
+        breaker = CircuitBreaker('test-client-error', failure_threshold=1, reset_timeout=60)
+
+        # Act
+        self._fail(breaker, ClientMistake('bad voice'))
+
+        # Assert
+        self.assertEqual(breaker.snapshot()['state'], CLOSED)
+
+
+class DeadlineTestCase(SimpleTestCase):
+    def test_slow_call_exceeds_deadline(self):
+        """A call slower than its deadline raises DeadlineExceeded"""
+        # Arrange
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        # Act - Assert
+        with self.assertRaises(DeadlineExceeded):
+            call_with_deadline(lambda: release.wait(5), timeout=0.05)
+
+    def test_errors_propagate(self):
+        """Upstream exceptions are raised as-is"""
+        def failing():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            call_with_deadline(failing, timeout=1)
+
+    def test_hedged_request_wins_over_slow_attempt(self):
+        """A hedged second attempt answers when the first one stalls"""
+        # Arrange
+        release = threading.Event()
+        self.addCleanup(release.set)
+        attempts = []
+
+        def upstream():
+            attempts.append(1)
+            if len(attempts) == 1:
+                release.wait(5)
+                return 'slow'
+            return 'fast'
+
+        # Act
+        result = call_with_deadline(upstream, timeout=1, hedge_after=0.05)
+
+        # Assert
+        self.assertEqual(result, 'fast')
+        self.assertEqual(len(attempts), 2)
+
+
+class UpstreamUnavailableTestCase(APITestCase):
+    def setUp(self):
+        """Set up an authenticated user"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+    @patch('vocabloom.services.polly_service.boto3')
+    def test_open_polly_breaker_returns_service_unavailable(self, mock_boto3):
+        """With the Polly breaker open the audio endpoint answers 503 right away"""
+        # Arrange
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        breaker = CircuitBreaker('polly-test', failure_threshold=1, reset_timeout=60)
+        breaker.state, breaker.opened_at = OPEN, time.monotonic()
+
+        # Act
+        with patch.object(polly_service, 'breaker', breaker):
+            response = self.client.post(reverse('text_to_speech'), {'text': 'Hello'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        mock_client.synthesize_speech.assert_not_called()
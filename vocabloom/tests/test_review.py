@@ -0,0 +1,284 @@
+import uuid
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Tag, Word, ReviewLog
+from ..serializers import REVIEW_BATCH_MAX
+from ..services.lexicon_service import set_meanings
+from ..services.review_service import AGAIN, HARD, GOOD, EASY, MIN_EASE, ReviewService, schedule
+
+
+class ScheduleTestCase(SimpleTestCase):
+    def setUp(self):
+        """A fresh card and a fixed review time"""
+        self.word = Word(word='algorithm')
+        self.now = timezone.now()
+
+    def test_good_answers_follow_sm2_intervals(self):
+        """Good answers schedule 1 day, 6 days, then interval times ease"""
+        # Act
+        intervals = []
+        for _ in range(3):
+            schedule(self.word, GOOD, self.now)
+            intervals.append(self.word.interval)
+
+        # Assert
+        self.assertEqual(intervals, [1, 6, 15])
+        self.assertEqual(self.word.due_at, self.now + timedelta(days=15))
+        self.assertEqual(self.word.last_reviewed_at, self.now)
+
+    def test_again_resets_card(self):
+        """A lapse restarts the card, lowers its ease and brings it back soon"""
+        # Arrange
+        self.word.repetitions, self.word.interval = 4, 30
+
+        # Act
+        schedule(self.word, AGAIN, self.now)
+
+        # Assert
+        self.assertEqual((self.word.repetitions, self.word.interval, self.word.lapses), (0, 0, 1))
+        self.assertAlmostEqual(self.word.ease, 2.3)
+        self.assertEqual(self.word.due_at, self.now + timedelta(minutes=10))
+
+    def test_ease_has_a_floor(self):
+        """Repeated lapses never push the ease below the minimum"""
+        # Act
+        for _ in range(20):
+            schedule(self.word, AGAIN, self.now)
+
+        # Assert
+        self.assertEqual(self.word.ease, MIN_EASE)
+
+    def test_hard_and_easy(self):
+        """Hard grows the interval slowly, Easy adds a bonus and ease"""
+        # Arrange
+        hard = Word(word='hard', repetitions=3, interval=10)
+        easy = Word(word='easy', repetitions=3, interval=10)
+
+        # Act
+        schedule(hard, HARD, self.now)
+        schedule(easy, EASY, self.now)
+
+        # Assert
+        self.assertEqual(hard.interval, 12)
+        self.assertEqual(easy.interval, 32)
+        self.assertAlmostEqual(easy.ease, 2.65)
+
+
+class ReviewAPITestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with due, future and foreign words"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+
+        now = timezone.now()
+        tag = Tag.objects.create(user=self.user, name='Tech Words')
+        self.overdue = Word.objects.create(user=self.user, tag=tag, word='algorithm', due_at=now - timedelta(days=3))
+        set_meanings([(self.overdue, [('noun', [('A step-by-step procedure', None)])])])
+        self.due = Word.objects.create(user=self.user, word='serendipity', due_at=now - timedelta(hours=1))
+        self.future = Word.objects.create(user=self.user, word='ephemeral', due_at=now + timedelta(days=2))
+        self.foreign = Word.objects.create(user=self.other_user, word='secret', due_at=now - timedelta(days=9))
+
+        self.next_url = reverse('review_next')
+        self.review_url = reverse('review')
+
+    def answer(self, word, rating, **extra):
+        return {'event_id': str(uuid.uuid4()), 'word': word.id, 'rating': rating, **extra}
+
+    def test_next_returns_due_cards_most_overdue_first(self):
+        """Only the user's due words come back, oldest due date first"""
+        # Act
+        response = self.client.get(self.next_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([card['id'] for card in response.data], [self.overdue.id, self.due.id])
+        self.assertEqual(response.data[0]['meanings'][0]['definitions'][0]['definition'], 'A step-by-step procedure')
+
+    def test_next_limit(self):
+        """?limit caps the number of cards and is validated"""
+        # Act
+        response = self.client.get(self.next_url, {'limit': 1})
+        invalid = self.client.get(self.next_url, {'limit': 0})
+
+        # Assert
+        self.assertEqual([card['id'] for card in response.data], [self.overdue.id])
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_new_words_are_due_immediately(self):
+        """A word added now is in the queue straight away"""
+        # Arrange
+        self.client.post(reverse('words_list_create'), {'word': 'fresh'}, format='json')
+
+        # Act
+        response = self.client.get(self.next_url)
+
+        # Assert
+        self.assertIn('fresh', [card['word'] for card in response.data])
+
+    def test_batch_answers_reschedule_words(self):
+        """One POST reschedules every answered word"""
+        # Act
+        response = self.client.post(self.review_url, {'reviews': [
+            self.answer(self.overdue, GOOD),
+            self.answer(self.due, AGAIN),
+        ]}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 2)
+        self.overdue.refresh_from_db()
+        self.due.refresh_from_db()
+        self.assertEqual((self.overdue.interval, self.overdue.repetitions), (1, 1))
+        self.assertEqual(self.due.lapses, 1)
+        self.assertEqual(self.client.get(self.next_url).data, [])
+
+    def test_answers_apply_in_time_order(self):
+        """Answers for the same word are applied oldest first"""
+        # Arrange
+        now = timezone.now()
+
+        # Act
+        self.client.post(self.review_url, {'reviews': [
+            self.answer(self.due, GOOD, reviewed_at=(now - timedelta(minutes=1)).isoformat()),
+            self.answer(self.due, AGAIN, reviewed_at=(now - timedelta(minutes=5)).isoformat()),
+        ]}, format='json')
+
+        # Assert
+        self.due.refresh_from_db()
+        self.assertEqual((self.due.lapses, self.due.repetitions, self.due.interval), (1, 1, 1))
+
+    def test_answers_are_logged(self):
+        """Every answer is stored with the schedule it produced"""
+        # Arrange
+        answer = self.answer(self.due, GOOD)
+
+        # Act
+        response = self.client.post(self.review_url, {'reviews': [answer]}, format='json')
+
+        # Assert
+        self.assertEqual(response.data['logged'], 1)
+        log = ReviewLog.objects.get()
+        self.assertEqual(str(log.event_id), answer['event_id'])
+        self.assertEqual((log.user, log.word, log.rating, log.interval), (self.user, self.due, GOOD, 1))
+
+    def test_retried_batch_is_idempotent(self):
+        """Resending a batch logs and applies nothing twice"""
+        # Arrange
+        batch = {'reviews': [self.answer(self.due, GOOD), self.answer(self.overdue, EASY)]}
+        self.client.post(self.review_url, batch, format='json')
+
+        # Act
+        response = self.client.post(self.review_url, batch, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['updated'], response.data['logged']), (0, 0))
+        self.assertEqual(
+            sorted(str(event_id) for event_id in response.data['duplicates']),
+            sorted(answer['event_id'] for answer in batch['reviews']),
+        )
+        self.assertEqual(ReviewLog.objects.count(), 2)
+        self.due.refresh_from_db()
+        self.assertEqual(self.due.repetitions, 1)
+
+    def test_repeated_event_in_one_batch_counts_once(self):
+        """An event sent twice in the same batch is applied once"""
+        # Arrange
+        answer = self.answer(self.due, GOOD)
+
+        # Act
+        response = self.client.post(self.review_url, {'reviews': [answer, answer]}, format='json')
+
+        # Assert
+        self.assertEqual(response.data['logged'], 1)
+        self.assertEqual([str(event_id) for event_id in response.data['duplicates']], [answer['event_id']])
+
+    def test_foreign_words_are_skipped(self):
+        """Answers for other users' words are neither logged nor applied"""
+        # Act
+        response = self.client.post(self.review_url, {'reviews': [self.answer(self.foreign, GOOD)]}, format='json')
+
+        # Assert
+        self.assertEqual(response.data['skipped'], [self.foreign.id])
+        self.assertFalse(ReviewLog.objects.exists())
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.repetitions, 0)
+
+    def test_late_answer_is_logged_without_rescheduling(self):
+        """An answer older than the last review is history, not a new schedule"""
+        # Arrange
+        now = timezone.now()
+        self.client.post(self.review_url, {'reviews': [self.answer(self.due, GOOD)]}, format='json')
+
+        # Act
+        response = self.client.post(self.review_url, {'reviews': [
+            self.answer(self.due, AGAIN, reviewed_at=(now - timedelta(hours=1)).isoformat()),
+        ]}, format='json')
+
+        # Assert
+        self.assertEqual((response.data['updated'], response.data['logged']), (0, 1))
+        self.due.refresh_from_db()
+        self.assertEqual(self.due.lapses, 0)
+
+    def test_log_survives_word_deletion(self):
+        """Deleting a word keeps its review history"""
+        # Arrange
+        self.client.post(self.review_url, {'reviews': [self.answer(self.due, GOOD)]}, format='json')
+
+        # Act
+        self.due.delete()
+
+        # Assert
+        self.assertIsNone(ReviewLog.objects.get().word)
+
+    def test_invalid_batches_are_rejected(self):
+        """Unknown ratings, missing event ids, empty and oversized batches fail validation"""
+        # Act
+        bad_rating = self.client.post(self.review_url, {'reviews': [self.answer(self.due, 7)]}, format='json')
+        missing_event = self.client.post(self.review_url, {'reviews': [{'word': self.due.id, 'rating': GOOD}]}, format='json')
+        empty = self.client.post(self.review_url, {'reviews': []}, format='json')
+        oversized = self.client.post(self.review_url, {
+            'reviews': [self.answer(self.due, GOOD) for _ in range(REVIEW_BATCH_MAX + 1)],
+        }, format='json')
+
+        # Assert
+        self.assertEqual(bad_rating.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(missing_event.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(empty.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(oversized.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self):
+        """Anonymous users cannot read or answer the queue"""
+        # Arrange
+        self.client.force_authenticate(user=None)
+
+        # Act - Assert
+        self.assertEqual(self.client.get(self.next_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_due_query_uses_index_order(self):
+        """The queue is read from the (user, due_at) index without a sort"""
+        # Arrange
+        if connection.vendor != 'sqlite':
+            self.skipTest('plan text checked on SQLite only')
+
+        # Act
+        plan = ReviewService(self.user).due(20).explain()
+
+        # Assert
+        self.assertIn('word_user_due_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
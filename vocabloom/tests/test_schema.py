@@ -0,0 +1,114 @@
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch
+from ..schema import build_schema
+
+
+class CachedSchemaTestCase(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Build the schema once into a temporary SCHEMA_DIR"""
+        super().setUpClass()
+        cls.schema_dir = tempfile.mkdtemp()
+        with patch('drf_spectacular.drainage.GENERATOR_STATS.silent', True, create=True):
+            cls.version = build_schema(cls.schema_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.schema_dir)
+        super().tearDownClass()
+
+    def setUp(self):
+        """Serve the built schema as in production"""
+        overrides = override_settings(DEBUG=False, SCHEMA_DIR=self.schema_dir)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.schema_url = reverse('schema')
+
+    def test_built_schema_served_with_etag(self):
+        """The built YAML is served with an ETag and a short cache lifetime"""
+        # Act
+        response = self.client.get(self.schema_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], f'"{self.version}-yaml"')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=300')
+        self.assertIn(b'openapi: 3', response.content)
+
+    def test_json_format(self):
+        """?format=json serves the JSON file with its own ETag"""
+        # Act
+        response = self.client.get(self.schema_url, {'format': 'json'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], f'"{self.version}-json"')
+        self.assertIn('/api/words/', json.loads(response.content)['paths'])
+
+    def test_matching_etag_returns_not_modified(self):
+        """Revalidating with the current ETag gets an empty 304"""
+        # Act
+        response = self.client.get(self.schema_url, HTTP_IF_NONE_MATCH=f'"{self.version}-yaml"')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_versioned_url_is_immutable(self):
+        """The docs UI links the versioned URL, which caches for a year"""
+        # Arrange
+        swagger = self.client.get(reverse('swagger-ui'))
+        self.assertIn(self.version, swagger.content.decode())
+
+        # Act
+        response = self.client.get(self.schema_url, {'v': self.version})
+
+        # Assert
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+
+    def test_missing_build_returns_service_unavailable(self):
+        """Without a built schema production does not fall back to generating it"""
+        # Act
+        with override_settings(SCHEMA_DIR=tempfile.gettempdir() + '/vocabloom-no-schema'), \
+                self.assertLogs('vocabloom.views.schema_views', 'ERROR'):
+            response = self.client.get(self.schema_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    def test_debug_generates_live(self):
+        """In DEBUG the schema is generated per request, without an ETag"""
+        # Act
+        with override_settings(DEBUG=True), patch('drf_spectacular.drainage.GENERATOR_STATS.silent', True, create=True):
+            response = self.client.get(self.schema_url)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
+
+    def test_build_command_replaces_old_versions(self):
+        """Rebuilding leaves only the current version's files behind"""
+        # Arrange
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        open(f'{output_dir}/schema.0000000000000000.yaml', 'w').close()
+
+        # Act
+        with patch('drf_spectacular.drainage.GENERATOR_STATS.emit_summary'), \
+                patch('drf_spectacular.drainage.GENERATOR_STATS.silent', True, create=True):
+            call_command('build_schema', output_dir=output_dir, stdout=StringIO())
+
+        # Assert
+        self.assertEqual(
+            sorted(os.listdir(output_dir)),
+            ['manifest.json', f'schema.{self.version}.json', f'schema.{self.version}.yaml'],
+        )
@@ -0,0 +1,77 @@
+import io
+import json
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch, MagicMock
+from ..models import Word
+
+
+class ServerTimingTestCase(APITestCase):
+    def setUp(self):
+        """Set up test data and authenticate user"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        Word.objects.create(user=self.user, word='algorithm')
+
+    def _metrics(self, response):
+        return {
+            part.strip().split(';')[0]: part
+            for part in response['Server-Timing'].split(',')
+        }
+
+    def test_word_list_reports_db_serializer_and_render_time(self):
+        """A list response breaks time down into db, serialize and render"""
+        # Act
+        response = self.client.get(reverse('words_list_create'))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics = self._metrics(response)
+        for name in ('db', 'serialize', 'render', 'total'):
+            self.assertIn(name, metrics)
+        self.assertRegex(metrics['db'], r'desc="\d+ queries"')
+
+    @patch('vocabloom.services.polly_service.boto3')
+    def test_audio_reports_polly_time(self, mock_boto3):
+        """Time spent waiting on Polly is reported separately"""
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.synthesize_speech.return_value = {'AudioStream': io.BytesIO(b'fake_audio_data')}
+        mock_boto3.client.return_value = mock_client
+
+        # Act
+        response = self.client.post(reverse('text_to_speech'), {'text': 'Hello timing'})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('polly', self._metrics(response))
+
+    def test_timing_is_logged_as_json(self):
+        """Each sampled request writes one structured log line"""
+        # Act
+        with self.assertLogs('vocabloom.performance', level='INFO') as logs:
+            self.client.get(reverse('words_list_create'))
+
+        # Assert
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry['route'], 'words_list_create')
+        self.assertEqual(entry['status'], 200)
+        self.assertGreater(entry['db_queries'], 0)
+        self.assertIn('serialize_ms', entry)
+
+    @override_settings(PERFORMANCE_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_requests_have_no_header(self):
+        """A zero sample rate turns the instrumentation off"""
+        # Act
+        response = self.client.get(reverse('words_list_create'))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Server-Timing', response)
@@ -0,0 +1,196 @@
+import io
+import threading
+import time
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from unittest.mock import patch, MagicMock
+from ..services import single_flight
+from ..services.polly_service import PollyService
+from ..services.single_flight import SingleFlight
+
+
+class CountingEvent(threading.Event):
+    """Event that records how many callers are blocked on it"""
+    waiting = 0
+
+    def wait(self, timeout=None):
+        CountingEvent.waiting += 1
+        return super().wait(timeout)
+
+
+class CountingCall(single_flight._Call):
+    def __init__(self):
+        super().__init__()
+        self.done = CountingEvent()
+
+
+def wait_for_followers(count):
+    deadline = time.monotonic() + 5
+    while CountingEvent.waiting < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def run_concurrently(count, target):
+    """Call `target` from `count` threads and return their results"""
+    results = [None] * count
+
+    def worker(index):
+        try:
+            results[index] = target()
+        except Exception as error:
+            results[index] = error
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class SingleFlightTestCase(SimpleTestCase):
+    def setUp(self):
+        """Count waiting followers so tests release the leader deterministically"""
+        CountingEvent.waiting = 0
+        patcher = patch.object(single_flight, '_Call', CountingCall)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Callers with the same key wait for the leader and share its result"""
+        # Arrange
+        flight = SingleFlight('test')
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            release.wait(5)
+            return {'success': True}
+
+        key = flight.key('same')
+
+        # Act
+        threads, results = run_concurrently(5, lambda: flight.do(key, slow_call))
+        wait_for_followers(4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == {'success': True} for result in results))
+        self.assertEqual(flight._calls, {})
+
+    def test_different_keys_run_separately(self):
+        """Calls with different keys are not collapsed"""
+        # Arrange
+        flight = SingleFlight('test')
+
+        # Act
+        first = flight.do(flight.key('a'), lambda: 'a')
+        second = flight.do(flight.key('b'), lambda: 'b')
+
+        # Assert
+        self.assertEqual((first, second), ('a', 'b'))
+
+    def test_leader_error_is_raised_for_waiters(self):
+        """An exception in the shared call reaches every waiting caller"""
+        # Arrange
+        flight = SingleFlight('test')
+        release = threading.Event()
+
+        def failing_call():
+            release.wait(5)
+            raise ValueError('upstream down')
+
+        key = flight.key('boom')
+
+        # Act
+        threads, results = run_concurrently(3, lambda: flight.do(key, failing_call))
+        wait_for_followers(2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def _across_workers(self, lock_results):
+        """Run the cross-worker path on a stand-in PostgreSQL connection whose
+        pg_try_advisory_lock answers `lock_results` in turn"""
+        connection = MagicMock(vendor='postgresql')
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.side_effect = lambda: (next(lock_results),)
+        patcher = patch.object(single_flight, 'connection', connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        settings = override_settings(SINGLE_FLIGHT_ACROSS_WORKERS=True, SINGLE_FLIGHT_CACHE='default')
+        settings.enable()
+        self.addCleanup(settings.disable)
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_finished_call_is_not_reused_across_workers(self):
+        """A call made after the previous one finished goes upstream again"""
+        # Arrange
+        self._across_workers(iter(lambda: True, None))
+        flight = SingleFlight('test')
+        calls = []
+        key = flight.key('example')
+
+        # Act
+        first = flight.do(key, lambda: calls.append(1) or 'first sentence')
+        second = flight.do(key, lambda: calls.append(2) or 'second sentence')
+
+        # Assert
+        self.assertEqual((first, second), ('first sentence', 'second sentence'))
+        self.assertEqual(calls, [1, 2])
+
+    def test_waiting_worker_gets_the_leaders_result(self):
+        """A worker that found the call running takes its result from the cache"""
+        # Arrange
+        flight = SingleFlight('test')
+        key = flight.key('example')
+
+        def lock_results():
+            yield False
+            # The leader in the other worker finishes while this one waits
+            cache.set(f'single-flight:test:{key}', 'shared sentence')
+            while True:
+                yield False
+
+        self._across_workers(lock_results())
+        upstream = MagicMock()
+
+        # Act
+        result = flight.do(key, upstream)
+
+        # Assert
+        self.assertEqual(result, 'shared sentence')
+        upstream.assert_not_called()
+
+    @patch('vocabloom.services.polly_service.boto3')
+    def test_polly_identical_requests_call_polly_once(self, mock_boto3):
+        """Concurrent identical text-to-speech requests make one Polly call"""
+        # Arrange
+        release = threading.Event()
+        mock_client = MagicMock()
+
+        def synthesize_speech(**kwargs):
+            release.wait(5)
+            return {'AudioStream': io.BytesIO(b'fake_audio_data')}
+
+        mock_client.synthesize_speech.side_effect = synthesize_speech
+        mock_boto3.client.return_value = mock_client
+
+        # Act
+        threads, results = run_concurrently(
+            4, lambda: PollyService().text_to_speech('Hello class')
+        )
+        wait_for_followers(3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        mock_client.synthesize_speech.assert_called_once()
+        self.assertTrue(all(result['success'] for result in results))
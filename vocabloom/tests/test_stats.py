@@ -0,0 +1,194 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch
+from ..models import Tag, Word, UserExample, DailyStats, UserStats
+from ..services.review_service import AGAIN, GOOD
+from ..services.stats_service import StatsService, lock_rollups, reconcile
+
+
+class StatsTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with one tag and authenticate"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(user=self.user, name='Tech Words')
+        self.stats_url = reverse('stats')
+        self.today = timezone.localdate()
+
+    def _create_word(self, text, tag=None):
+        response = self.client.post(reverse('words_list_create'), {
+            'word': text, 'tag': tag.id if tag else None,
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Word.objects.get(id=response.data['id'])
+
+    def _stats(self, **params):
+        response = self.client.get(self.stats_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_writes_update_rollups(self):
+        """Words, examples and reviews added through the API show up in the stats"""
+        # Arrange
+        tagged = self._create_word('algorithm', tag=self.tag)
+        self._create_word('serendipity')
+        self.client.post(
+            reverse('user-example-create', kwargs={'word_id': tagged.id}), {'example_text': 'A clever algorithm.'}
+        )
+        self.client.post(reverse('review'), {'reviews': [
+            {'event_id': str(uuid.uuid4()), 'word': tagged.id, 'rating': GOOD},
+            {'event_id': str(uuid.uuid4()), 'word': tagged.id, 'rating': AGAIN, 'reviewed_at': (timezone.now() - timedelta(seconds=5)).isoformat()},
+        ]}, format='json')
+
+        # Act
+        stats = self._stats(days=7)
+
+        # Assert
+        self.assertEqual(dict(stats['totals']), {
+            'words': 2, 'untagged_words': 1, 'examples': 1,
+            'reviews': 2, 'reviews_correct': 1, 'accuracy': 0.5,
+        })
+        self.assertEqual([dict(tag) for tag in stats['tags']], [{'id': self.tag.id, 'name': 'Tech Words', 'words': 1}])
+        self.assertEqual(len(stats['daily']), 7)
+        self.assertEqual(stats['daily'][-1]['date'], self.today.isoformat())
+        self.assertEqual(
+            (stats['daily'][-1]['words_added'], stats['daily'][-1]['examples_added'], stats['daily'][-1]['reviews']),
+            (2, 1, 2),
+        )
+        self.assertEqual(stats['daily'][0]['words_added'], 0)
+
+    def test_deleting_a_word_removes_it_and_its_examples(self):
+        """Deleting a word lowers the totals, the tag count and the day it was added"""
+        # Arrange
+        word = self._create_word('algorithm', tag=self.tag)
+        self.client.post(reverse('user-example-create', kwargs={'word_id': word.id}), {'example_text': 'One example.'})
+
+        # Act
+        self.client.delete(reverse('word_detail', kwargs={'pk': word.id}))
+
+        # Assert
+        stats = self._stats()
+        self.assertEqual((stats['totals']['words'], stats['totals']['examples']), (0, 0))
+        self.assertEqual(stats['tags'][0]['words'], 0)
+        self.assertEqual((stats['daily'][-1]['words_added'], stats['daily'][-1]['examples_added']), (0, 0))
+
+    def test_retagging_moves_the_count(self):
+        """Changing a word's tag moves it between tag counts"""
+        # Arrange
+        other = Tag.objects.create(user=self.user, name='Zoology')
+        word = self._create_word('algorithm', tag=self.tag)
+
+        # Act
+        self.client.put(reverse('word_detail', kwargs={'pk': word.id}), {'word': 'algorithm', 'tag': other.id}, format='json')
+
+        # Assert
+        self.assertEqual([(tag['name'], tag['words']) for tag in self._stats()['tags']], [('Tech Words', 0), ('Zoology', 1)])
+
+    def test_new_user_gets_zeros(self):
+        """A user with no activity gets an empty dashboard, not an error"""
+        # Act
+        stats = self._stats(days=3)
+
+        # Assert
+        self.assertEqual(stats['totals']['words'], 0)
+        self.assertIsNone(stats['totals']['accuracy'])
+        self.assertEqual([day['reviews'] for day in stats['daily']], [0, 0, 0])
+
+    def test_days_is_validated(self):
+        """days must be between 1 and 365"""
+        # Act
+        response = self.client.get(self.stats_url, {'days': 0})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reconcile_repairs_drift(self):
+        """The reconcile command rebuilds the rollups from the source tables"""
+        # Arrange
+        word = Word.objects.create(user=self.user, tag=self.tag, word='algorithm')
+        UserExample.objects.create(word=word, user=self.user, example_text='Written without stats.')
+        UserStats.objects.create(user=self.user, words=40)
+
+        # Act
+        call_command('reconcile_stats', stdout=StringIO())
+
+        # Assert
+        stats = self._stats()
+        self.assertEqual((stats['totals']['words'], stats['totals']['examples']), (1, 1))
+        self.assertEqual(stats['tags'][0]['words'], 1)
+        self.assertEqual(stats['daily'][-1]['words_added'], 1)
+
+    def test_reconcile_keeps_history_outside_the_window(self):
+        """Without --full only recent daily rows are rewritten"""
+        # Arrange
+        old_day = self.today - timedelta(days=10)
+        DailyStats.objects.create(user=self.user, date=old_day, words_added=3)
+
+        # Act
+        call_command('reconcile_stats', days=2, stdout=StringIO())
+        kept = DailyStats.objects.filter(date=old_day).exists()
+        call_command('reconcile_stats', full=True, stdout=StringIO())
+
+        # Assert
+        self.assertTrue(kept)
+        self.assertFalse(DailyStats.objects.filter(date=old_day).exists())
+
+    def test_deletes_agree_with_reconcile(self):
+        """Deleting words and examples leaves nothing for the reconcile to correct"""
+        # Arrange
+        kept = self._create_word('algorithm', tag=self.tag)
+        deleted = self._create_word('serendipity', tag=self.tag)
+        batched = self._create_word('ephemeral')
+        for word in (kept, kept, deleted, batched):
+            self.client.post(reverse('user-example-create', kwargs={'word_id': word.id}), {'example_text': 'An example.'})
+        self.client.delete(reverse('user-example-detail', kwargs={
+            'word_id': kept.id, 'example_id': kept.user_examples.first().id,
+        }))
+        self.client.delete(reverse('word_detail', kwargs={'pk': deleted.id}))
+        self.client.post(reverse('words_batch'), {'operations': [{'op': 'delete', 'words': [batched.id]}]}, format='json')
+
+        def rollups():
+            return (
+                list(DailyStats.objects.values_list('date', 'words_added', 'examples_added')),
+                UserStats.objects.values_list('words', 'examples').get(),
+                Tag.objects.values_list('word_count', flat=True).get(),
+            )
+        before = rollups()
+
+        # Act
+        call_command('reconcile_stats', days=2, stdout=StringIO())
+
+        # Assert
+        self.assertEqual(rollups(), before)
+        self.assertEqual(before, ([(self.today, 1, 1)], (1, 1), 1))
+
+    def test_write_and_its_count_commit_together(self):
+        """A word whose count can't be written isn't saved either"""
+        # Act
+        with patch.object(StatsService, 'words_added', side_effect=RuntimeError('rollup down')), \
+                self.assertRaises(RuntimeError):
+            self.client.post(reverse('words_list_create'), {'word': 'algorithm'}, format='json')
+
+        # Assert
+        self.assertFalse(Word.objects.exists())
+
+    def test_reconcile_excludes_increments(self):
+        """Increments take the rollup lock shared and reconcile takes it exclusively"""
+        # Act
+        with patch('vocabloom.services.stats_service.lock_rollups', wraps=lock_rollups) as lock:
+            self._create_word('algorithm')
+            reconcile(users=User.objects.filter(id=self.user.id))
+
+        # Assert
+        self.assertEqual([call.kwargs for call in lock.call_args_list], [{}, {'shared': False}])
@@ -0,0 +1,185 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from django.contrib.auth.models import User
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from unittest.mock import patch, MagicMock
+from ..models import Word
+from ..services.word_audio_service import WordAudioService
+
+
+class ImmediateExecutor:
+    """Runs submitted work right away instead of on a background thread"""
+
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class WordAudioTestCase(APITestCase):
+    def setUp(self):
+        """Set up test data, a temporary media root and a fake Polly client"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(
+            MEDIA_ROOT=media_root,
+            MEDIA_URL='https://cdn.example.com/media/',
+            MEDIA_URL_IS_PUBLIC=True,
+            WORD_AUDIO_PRECOMPUTE=True,
+        )
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        boto3_patcher = patch('vocabloom.services.polly_service.boto3')
+        mock_boto3 = boto3_patcher.start()
+        self.addCleanup(boto3_patcher.stop)
+        self.polly_client = MagicMock()
+        self.polly_client.synthesize_speech.side_effect = lambda **kwargs: {
+            'AudioStream': io.BytesIO(b'fake_audio_data')
+        }
+        mock_boto3.client.return_value = self.polly_client
+
+    @patch('vocabloom.services.word_audio_service._get_executor', return_value=ImmediateExecutor())
+    def test_create_word_stores_audio_after_commit(self, mock_executor):
+        """Creating a word synthesizes its audio once the transaction commits"""
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('words_list_create'), {'word': 'serendipity'}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        word = Word.objects.get(pk=response.data['id'])
+        self.assertTrue(word.audio.startswith('https://cdn.example.com/media/audio/words/'))
+        self.assertTrue(word.audio.endswith('.mp3'))
+        self.polly_client.synthesize_speech.assert_called_once()
+
+    @patch('vocabloom.services.word_audio_service._get_executor', return_value=ImmediateExecutor())
+    def test_create_word_keeps_client_audio(self, mock_executor):
+        """A word posted with its own audio URL is left alone"""
+        # Arrange
+        data = {'word': 'cinema', 'audio': 'https://example.com/cinema.mp3'}
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('words_list_create'), data, format='json')
+
+        # Assert
+        self.assertEqual(response.data['audio'], 'https://example.com/cinema.mp3')
+        self.polly_client.synthesize_speech.assert_not_called()
+
+    def test_same_text_shares_one_file(self):
+        """Audio is content addressed, so identical words reuse the same file"""
+        # Arrange
+        other_user = User.objects.create_user(username='other', password='otherpass123')
+        first = Word.objects.create(user=self.user, word='algorithm')
+        second = Word.objects.create(user=other_user, word='algorithm')
+        service = WordAudioService()
+
+        # Act
+        first_url = service.attach_audio(first.id)
+        second_url = service.attach_audio(second.id)
+
+        # Assert
+        self.assertEqual(first_url, second_url)
+        self.polly_client.synthesize_speech.assert_called_once()
+
+    def test_polly_failure_leaves_audio_empty(self):
+        """A Polly error is logged and the word keeps no audio"""
+        # Arrange
+        self.polly_client.synthesize_speech.side_effect = Exception('AWS Error')
+        word = Word.objects.create(user=self.user, word='ephemeral')
+
+        # Act
+        url = WordAudioService().attach_audio(word.id)
+
+        # Assert
+        self.assertIsNone(url)
+        word.refresh_from_db()
+        self.assertIsNone(word.audio)
+
+    def test_backfill_command_updates_words_without_audio(self):
+        """The backfill command fills every word missing audio"""
+        # Arrange
+        other_user = User.objects.create_user(username='other', password='otherpass123')
+        Word.objects.create(user=self.user, word='laconic')
+        Word.objects.create(user=other_user, word='laconic')
+        Word.objects.create(user=self.user, word='terse', audio='')
+        Word.objects.create(user=self.user, word='kept', audio='https://example.com/kept.mp3')
+        out = io.StringIO()
+
+        # Act
+        call_command('backfill_word_audio', '--workers', '2', stdout=out)
+
+        # Assert
+        self.assertIn('3 word rows updated', out.getvalue())
+        self.assertEqual(self.polly_client.synthesize_speech.call_count, 2)
+        self.assertFalse(Word.objects.filter(audio__isnull=True).exists())
+        self.assertEqual(Word.objects.get(word='kept').audio, 'https://example.com/kept.mp3')
+
+    @patch('vocabloom.services.word_audio_service._get_executor', return_value=ImmediateExecutor())
+    def test_renaming_a_word_replaces_its_audio(self, mock_executor):
+        """A PUT that changes the text synthesizes the new pronunciation"""
+        # Arrange
+        with self.captureOnCommitCallbacks(execute=True):
+            word_id = self.client.post(reverse('words_list_create'), {'word': 'colour'}, format='json').data['id']
+        old_audio = Word.objects.get(pk=word_id).audio
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse('word_detail', kwargs={'pk': word_id}), {'word': 'color'}, format='json')
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        new_audio = Word.objects.get(pk=word_id).audio
+        self.assertNotEqual(new_audio, old_audio)
+        self.assertEqual(new_audio, WordAudioService().get_or_create_audio_url('color'))
+        self.assertEqual(self.polly_client.synthesize_speech.call_count, 2)
+
+    def test_backfill_refuses_relative_media_url(self):
+        """Without an absolute MEDIA_URL the backfill stores nothing"""
+        # Arrange
+        Word.objects.create(user=self.user, word='laconic')
+
+        # Act / Assert
+        with override_settings(MEDIA_URL='/media/', MEDIA_URL_IS_PUBLIC=False), self.assertRaises(CommandError):
+            call_command('backfill_word_audio')
+        self.polly_client.synthesize_speech.assert_not_called()
+
+    def test_production_settings_never_store_relative_audio_urls(self):
+        """Precomputing is off with a relative MEDIA_URL and can't be turned on"""
+        def load_settings(**overrides):
+            environment = {
+                key: value for key, value in os.environ.items()
+                if key not in ('MEDIA_URL', 'WORD_AUDIO_PRECOMPUTE')
+            }
+            environment.update(DEBUG='False', DJANGO_SETTINGS_MODULE='vocabloom_backend.settings', **overrides)
+            return subprocess.run(
+                [sys.executable, '-c', 'from django.conf import settings; print(settings.WORD_AUDIO_PRECOMPUTE)'],
+                cwd=settings.BASE_DIR, env=environment, capture_output=True, text=True,
+            )
+
+        # Act
+        default = load_settings()
+        forced = load_settings(WORD_AUDIO_PRECOMPUTE='True')
+        public = load_settings(MEDIA_URL='https://cdn.example.com/media/')
+
+        # Assert
+        self.assertEqual(default.stdout.strip(), 'False')
+        self.assertNotEqual(forced.returncode, 0)
+        self.assertIn('ImproperlyConfigured', forced.stderr)
+        self.assertEqual(public.stdout.strip(), 'True')
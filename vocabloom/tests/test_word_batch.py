@@ -0,0 +1,124 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from ..models import Tag, Word, UserExample, UserStats
+from ..serializers import WORD_BATCH_MAX_OPERATIONS
+
+
+class WordBatchTestCase(APITestCase):
+    def setUp(self):
+        """Set up a user with tagged and untagged words, and another user's word"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.movies = Tag.objects.create(user=self.user, name='Movies')
+        self.books = Tag.objects.create(user=self.user, name='Books')
+        self.words = [
+            self.client.post(reverse('words_list_create'), {'word': text, 'tag': self.movies.id}, format='json').data['id']
+            for text in ('algorithm', 'serendipity', 'ephemeral')
+        ]
+        self.foreign = Word.objects.create(user=self.other_user, word='secret', note='Theirs')
+        self.batch_url = reverse('words_batch')
+
+    def _batch(self, *operations):
+        return self.client.post(self.batch_url, {'operations': list(operations)}, format='json')
+
+    def test_operations_apply_in_order(self):
+        """Each operation reports the words it changed, in request order"""
+        # Act
+        response = self._batch(
+            {'op': 'set_tag', 'words': self.words[:2], 'tag': self.books.id},
+            {'op': 'update_note', 'words': [self.words[0]], 'note': 'Revisit'},
+            {'op': 'delete', 'words': [self.words[2]]},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [
+            {'op': 'set_tag', 'words': self.words[:2], 'missing': []},
+            {'op': 'update_note', 'words': [self.words[0]], 'missing': []},
+            {'op': 'delete', 'words': [self.words[2]], 'missing': []},
+        ])
+        self.assertEqual(
+            list(Word.objects.filter(user=self.user).order_by('id').values_list('tag_id', 'note')),
+            [(self.books.id, 'Revisit'), (self.books.id, None)],
+        )
+
+    def test_other_users_words_are_missing(self):
+        """Words the user doesn't have, or deleted earlier in the batch, are reported and left alone"""
+        # Act
+        response = self._batch(
+            {'op': 'delete', 'words': [self.words[0]]},
+            {'op': 'update_note', 'words': [self.words[0], self.words[1], self.foreign.id, 999], 'note': 'Mine'},
+        )
+
+        # Assert
+        self.assertEqual(response.data['results'][1]['words'], [self.words[1]])
+        self.assertEqual(response.data['results'][1]['missing'], [self.words[0], self.foreign.id, 999])
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.note, 'Theirs')
+
+    def test_untagging_with_null(self):
+        """set_tag with a null tag untags the words"""
+        # Act
+        self._batch({'op': 'set_tag', 'words': self.words, 'tag': None})
+
+        # Assert
+        self.assertFalse(Word.objects.filter(user=self.user, tag__isnull=False).exists())
+
+    def test_statistics_follow_the_batch(self):
+        """Tag counts and totals reflect re-tagged and deleted words"""
+        # Arrange
+        UserExample.objects.create(word_id=self.words[2], user=self.user, example_text='An example.')
+
+        # Act
+        self._batch(
+            {'op': 'set_tag', 'words': [self.words[0]], 'tag': self.books.id},
+            {'op': 'delete', 'words': [self.words[0], self.words[2]]},
+        )
+
+        # Assert
+        self.movies.refresh_from_db()
+        self.books.refresh_from_db()
+        self.assertEqual((self.movies.word_count, self.books.word_count), (1, 0))
+        self.assertEqual(UserStats.objects.get(user=self.user).words, 1)
+
+    def test_foreign_tag_rejects_the_whole_batch(self):
+        """A tag of another user is a 400 and nothing is applied"""
+        # Arrange
+        foreign_tag = Tag.objects.create(user=self.other_user, name='Secret')
+
+        # Act
+        response = self._batch(
+            {'op': 'delete', 'words': [self.words[0]]},
+            {'op': 'set_tag', 'words': [self.words[1]], 'tag': foreign_tag.id},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Word.objects.filter(user=self.user).count(), 3)
+
+    def test_operations_need_their_value(self):
+        """set_tag needs a tag and update_note a note"""
+        # Act
+        response = self._batch({'op': 'update_note', 'words': [self.words[0]]})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_size_is_limited(self):
+        """Too many operations are rejected"""
+        # Act
+        response = self._batch(*[{'op': 'delete', 'words': [self.words[0]]}] * (WORD_BATCH_MAX_OPERATIONS + 1))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -6,16 +6,27 @@ from .views import (
     IsAuthenticatedView,
     LogoutView,
     RegisterUserView,
+    DeleteAccountView,
     TagListCreateView,
     TagDetailView,
     WordsByTagView,
     WordListCreateView,
     WordDetailView,
+    WordBatchView,
+    WordExportView,
+    WordImportView,
+    DictionaryLookupView,
     TextToSpeechView,
     UserExampleListView,
     UserExampleCreateView,
     UserExampleDetailView,
     GenerateWordExampleView,
+    ReviewQueueView,
+    ReviewView,
+    QuizView,
+    StatsView,
+    BatchView,
+    MetricsView,
 )
 
 urlpatterns = [
@@ -25,6 +36,7 @@ urlpatterns = [
     path('logout/', LogoutView.as_view(), name='logout'), 
     path('authenticated/', IsAuthenticatedView.as_view(), name='is_authenticated'),
     path('register_user/', RegisterUserView.as_view(), name='register_user'),
+    path('account/', DeleteAccountView.as_view(), name='delete_account'),
 
     # Tag endpoints
     path('tags/', TagListCreateView.as_view(), name='tags_list_create'),
@@ -33,8 +45,14 @@ urlpatterns = [
     #  Word endpoints
     path('words/', WordListCreateView.as_view(), name='words_list_create'),
     path('words/<int:pk>/', WordDetailView.as_view(), name='word_detail'),
+    path('words/batch/', WordBatchView.as_view(), name='words_batch'),
+    path('words/export/', WordExportView.as_view(), name='words_export'),
+    path('words/import/', WordImportView.as_view(), name='words_import'),
     path('tags/<int:pk>/words/', WordsByTagView.as_view(), name='words_by_tag'),
 
+    # Dictionary lookups, cached for every user
+    path('lookup/<str:term>/', DictionaryLookupView.as_view(), name='dictionary_lookup'),
+
     # Audio endpoints
     path('audio/', TextToSpeechView.as_view(), name='text_to_speech'),
 
@@ -45,4 +63,16 @@ urlpatterns = [
 
     # Gemini AI Examples
     path('words/<int:word_id>/examples/generate/', GenerateWordExampleView.as_view(), name='generate-word-example'),
+
+    # Spaced-repetition review
+    path('review/', ReviewView.as_view(), name='review'),
+    path('review/next/', ReviewQueueView.as_view(), name='review_next'),
+    path('quiz/', QuizView.as_view(), name='quiz'),
+    path('stats/', StatsView.as_view(), name='stats'),
+
+    # Several reads in one round trip
+    path('batch/', BatchView.as_view(), name='batch'),
+
+    # Metrics
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
\ No newline at end of file
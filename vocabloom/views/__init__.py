@@ -4,6 +4,7 @@ from .auth_views import (
     LogoutView,
     IsAuthenticatedView,
     RegisterUserView,
+    DeleteAccountView,
 )
 
 from .tag_views import (
@@ -15,6 +16,7 @@ from .word_views import (
     WordsByTagView,
     WordListCreateView,
     WordDetailView,
+    WordBatchView,
 )
 
 from .user_example_views import (
@@ -24,6 +26,45 @@ from .user_example_views import (
     GenerateWordExampleView,
 )
 
+from .lookup_views import (
+    DictionaryLookupView,
+)
+
 from .audio_views import (
     TextToSpeechView,
-)
\ No newline at end of file
+)
+
+from .export_views import (
+    WordExportView,
+)
+
+from .import_views import (
+    WordImportView,
+)
+
+from .review_views import (
+    ReviewQueueView,
+    ReviewView,
+)
+
+from .quiz_views import (
+    QuizView,
+)
+
+from .stats_views import (
+    StatsView,
+)
+
+from .batch_views import (
+    BatchView,
+)
+
+from .metrics_views import (
+    MetricsView,
+)
+
+from .schema_views import (
+    CachedSchemaView,
+    CachedSwaggerView,
+    CachedRedocView,
+)
@@ -32,6 +32,7 @@ from ..services.polly_service import PollyService
             },
         },
         400: {"type": "object", "properties": {"error": {"type": "string"}}},
+        503: {"type": "object", "properties": {"error": {"type": "string"}}},
     },
     tags=["Audio"],
 )
@@ -51,6 +52,11 @@ class TextToSpeechView(GenericAPIView):
         polly_service = PollyService()
         result = polly_service.text_to_speech(text, voice_id)
 
+        if result.get("unavailable"):
+            return Response(
+                {"error": result["error"]}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
         if "error" in result:
             return Response(
                 {"error": result["error"]}, status=status.HTTP_400_BAD_REQUEST
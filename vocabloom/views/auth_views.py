@@ -9,11 +9,13 @@ from rest_framework_simplejwt.views import (
 )
 
 from ..serializers import (
+    AccountDeletionSerializer,
     UserRegistrationSerializer,
     SimpleSuccessSerializer,
     SimpleRefreshedSerializer,
     SimpleAuthenticatedSerializer,
 )
+from ..services.deletion_service import delete_account
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
@@ -96,4 +98,22 @@ class RegisterUserView(views.APIView):
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+@extend_schema(
+    request=AccountDeletionSerializer,
+    responses={204: None},
+    tags=["Authentication"],
+)
+class DeleteAccountView(views.APIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = AccountDeletionSerializer
+
+    def delete(self, request):
+        """Close the account: access ends now, the data is purged in the background"""
+        serializer = AccountDeletionSerializer(data=request.data, context={"request": request})
+        if serializer.is_valid():
+            delete_account(request.user)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
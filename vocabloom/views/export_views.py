@@ -0,0 +1,182 @@
+import csv
+import json
+from html import escape
+
+from django.http import StreamingHttpResponse
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.response import Response
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+
+from ..models import Word
+from ..serializers import WordSerializer
+
+EXPORT_CHUNK_SIZE = 500
+
+CSV_HEADER = [
+    "word",
+    "phonetic",
+    "tag",
+    "note",
+    "part_of_speech",
+    "definition",
+    "example",
+    "created_at",
+]
+
+
+# ===================================================
+# EXPORT RENDERERS
+# ===================================================
+# The view streams its own body; these renderers only exist so DRF's
+# `?format=` negotiation accepts the export formats. Error responses are
+# rendered as JSON (see WordExportView.finalize_response).
+
+class CSVExportRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+
+class JSONLinesExportRenderer(BaseRenderer):
+    media_type = "application/jsonl"
+    format = "jsonl"
+    charset = "utf-8"
+
+
+class AnkiExportRenderer(BaseRenderer):
+    media_type = "text/tab-separated-values"
+    format = "anki"
+    charset = "utf-8"
+
+
+class Echo:
+    """File-like object that hands back what csv.writer writes to it"""
+
+    def write(self, value):
+        return value
+
+
+# ===================================================
+# ROW GENERATORS
+# ===================================================
+
+def csv_rows(words):
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+    for word in words:
+        base = [
+            word.word,
+            word.phonetic or "",
+            word.tag.name if word.tag else "",
+            word.note or "",
+        ]
+        created_at = word.created_at.isoformat()
+        wrote_definition = False
+        for meaning in word.content["meanings"]:
+            for definition in meaning["definitions"]:
+                wrote_definition = True
+                yield writer.writerow(base + [
+                    meaning["part_of_speech"] or "",
+                    definition["definition"],
+                    definition["example"] or "",
+                    created_at,
+                ])
+        if not wrote_definition:
+            yield writer.writerow(base + ["", "", "", created_at])
+
+
+def jsonl_rows(words, context):
+    for word in words:
+        data = WordSerializer(word, context=context).data
+        data["tag_name"] = word.tag.name if word.tag else None
+        yield json.dumps(data, ensure_ascii=False) + "\n"
+
+
+def anki_rows(words):
+    # Anki's text importer reads these header lines to configure itself
+    yield "#separator:tab\n#html:true\n#tags column:3\n"
+    for word in words:
+        front = escape(word.word)
+        if word.phonetic:
+            front += f"<br>{escape(word.phonetic)}"
+
+        back = []
+        for meaning in word.content["meanings"]:
+            items = "".join(
+                f"<li>{escape(d['definition'])}"
+                + (f"<br><i>{escape(d['example'])}</i>" if d["example"] else "")
+                + "</li>"
+                for d in meaning["definitions"]
+            )
+            heading = f"<b>{escape(meaning['part_of_speech'])}</b>" if meaning["part_of_speech"] else ""
+            back.append(f"{heading}<ol>{items}</ol>")
+        if word.note:
+            back.append(f"<p>{escape(word.note)}</p>")
+
+        tags = word.tag.name.replace(" ", "_") if word.tag else ""
+        fields = [front, "".join(back), tags]
+        yield "\t".join(f.replace("\t", " ").replace("\n", "<br>") for f in fields) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "vocabloom-words.csv"),
+    "jsonl": ("application/jsonl", "vocabloom-words.jsonl"),
+    "anki": ("text/tab-separated-values", "vocabloom-anki.txt"),
+}
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="format",
+            type=OpenApiTypes.STR,
+            enum=list(EXPORT_FORMATS),
+            description="Export format (default: csv)",
+        ),
+    ],
+    responses={(200, "text/csv"): OpenApiTypes.BINARY},
+    tags=["Words"],
+)
+class WordExportView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [CSVExportRenderer, JSONLinesExportRenderer, AnkiExportRenderer]
+
+    def get_queryset(self):
+        return (
+            Word.objects.filter(user=self.request.user)
+            .select_related("tag")
+            .order_by("id")
+        )
+
+    def get(self, request, *args, **kwargs):
+        """Stream the user's whole vocabulary as CSV, JSON Lines or Anki text"""
+        export_format = request.accepted_renderer.format
+        content_type, filename = EXPORT_FORMATS[export_format]
+
+        # iterator() only holds one chunk of words (with their content) in
+        # memory at a time
+        words = self.get_queryset().iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+        if export_format == "jsonl":
+            rows = jsonl_rows(words, self.get_serializer_context())
+        elif export_format == "anki":
+            rows = anki_rows(words)
+        else:
+            rows = csv_rows(words)
+
+        response = StreamingHttpResponse(
+            rows, content_type=f"{content_type}; charset=utf-8"
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if isinstance(response, Response):
+            # Only errors come back as DRF responses; keep them JSON like the rest of the API
+            response.accepted_renderer = JSONRenderer()
+            response.accepted_media_type = JSONRenderer.media_type
+        return response
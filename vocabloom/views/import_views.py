@@ -0,0 +1,60 @@
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+
+from ..services.import_service import DeckImportError, DeckImportService
+
+
+@extend_schema(
+    request={
+        "multipart/form-data": {
+            "type": "object",
+            "properties": {
+                "file": {
+                    "type": "string",
+                    "format": "binary",
+                    "description": "Anki package (.apkg) or CSV/TSV deck",
+                },
+            },
+            "required": ["file"],
+        }
+    },
+    responses={
+        201: {
+            "type": "object",
+            "properties": {
+                "success": {"type": "boolean"},
+                "rows": {"type": "integer"},
+                "created": {"type": "integer"},
+                "merged": {"type": "integer"},
+                "duplicates": {"type": "integer"},
+                "skipped": {"type": "integer"},
+                "elapsed_seconds": {"type": "number"},
+                "rows_per_second": {"type": "number"},
+            },
+        },
+        400: {"type": "object", "properties": {"error": {"type": "string"}}},
+    },
+    tags=["Words"],
+)
+class WordImportView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        """Import an Anki or CSV deck into the user's vocabulary"""
+        upload = request.FILES.get("file")
+        if not upload:
+            return Response(
+                {"error": "File is required"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            report = DeckImportService(request.user).import_file(upload, upload.name)
+        except DeckImportError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"success": True, **report}, status=status.HTTP_201_CREATED)
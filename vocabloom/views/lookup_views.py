@@ -0,0 +1,45 @@
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+
+from ..serializers import DictionaryWordSerializer
+from ..services.dictionary_service import TERM_MAX_LENGTH, DictionaryService, DictionaryUnavailable
+
+
+@extend_schema(
+    responses={
+        200: DictionaryWordSerializer,
+        400: {"type": "object", "properties": {"error": {"type": "string"}}},
+        404: {"type": "object", "properties": {"detail": {"type": "string"}}},
+        503: {"type": "object", "properties": {"error": {"type": "string"}}},
+    },
+    tags=["Words"],
+)
+class DictionaryLookupView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = DictionaryWordSerializer
+
+    def get(self, request, term, *args, **kwargs):
+        """Phonetic, audio, meanings and definitions of a word from the shared dictionary cache"""
+        term = term.strip()
+        if not term or len(term) > TERM_MAX_LENGTH:
+            return Response(
+                {"error": f"Word must be 1 to {TERM_MAX_LENGTH} characters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            payload = DictionaryService().lookup(term)
+        except DictionaryUnavailable:
+            return Response(
+                {"error": "Dictionary service is temporarily unavailable"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        if payload is None:
+            return Response(
+                {"detail": f"No definitions found for '{term}'."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(self.get_serializer(payload).data)
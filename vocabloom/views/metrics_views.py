@@ -0,0 +1,18 @@
+from django.http import HttpResponse
+from rest_framework import views
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+
+from .. import metrics
+from ..permissions import IsStaffOrAllowedIP
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@extend_schema(responses={(200, "text/plain"): OpenApiTypes.STR}, tags=["Metrics"])
+class MetricsView(views.APIView):
+    permission_classes = [IsStaffOrAllowedIP]
+
+    def get(self, request):
+        """Latency percentiles, error rates and cache ratios in Prometheus text format"""
+        return HttpResponse(metrics.render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
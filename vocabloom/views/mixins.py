@@ -0,0 +1,22 @@
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+from ..db import routers
+
+
+class ReplicaReadMixin:
+    """
+    Serve safe (read-only) requests from a read replica.
+
+    Users who wrote recently keep reading from the primary; see
+    vocabloom.db.routers.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not settings.DATABASE_REPLICAS or request.method not in SAFE_METHODS:
+            return
+        if not (
+            request.user.is_authenticated and routers.wrote_recently(request.user.id)
+        ):
+            routers.allow_replica_reads()
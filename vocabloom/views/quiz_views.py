@@ -0,0 +1,30 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+
+from ..serializers import QuizQuerySerializer, QuizQuestionSerializer
+from ..services.quiz_service import QuizService
+from .mixins import ReplicaReadMixin
+
+
+@extend_schema(
+    parameters=[QuizQuerySerializer],
+    responses=QuizQuestionSerializer(many=True),
+    tags=["Review"],
+)
+class QuizView(ReplicaReadMixin, generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = QuizQuestionSerializer
+
+    def get(self, request, *args, **kwargs):
+        """Random multiple-choice questions: pick the definition of each word"""
+        query = QuizQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        questions = QuizService(request.user).build(
+            count=query.validated_data["count"],
+            choices=query.validated_data["choices"],
+            tag_id=query.validated_data.get("tag"),
+        )
+        return Response(self.get_serializer(questions, many=True).data)
@@ -0,0 +1,82 @@
+from django.db import transaction
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+
+from ..serializers import ReviewBatchSerializer, ReviewCardSerializer, ReviewStateSerializer
+from ..services.review_service import ReviewService
+from ..services.stats_service import StatsService
+from .mixins import ReplicaReadMixin
+
+REVIEW_QUEUE_DEFAULT_LIMIT = 20
+REVIEW_QUEUE_MAX_LIMIT = 100
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            "limit",
+            OpenApiTypes.INT,
+            description=f"Cards to return (default {REVIEW_QUEUE_DEFAULT_LIMIT}, max {REVIEW_QUEUE_MAX_LIMIT})",
+        ),
+    ],
+    tags=["Review"],
+)
+class ReviewQueueView(ReplicaReadMixin, generics.ListAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ReviewCardSerializer
+
+    def get_limit(self):
+        limit = self.request.query_params.get("limit", REVIEW_QUEUE_DEFAULT_LIMIT)
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValidationError({"limit": "A whole number is required."})
+        if not 1 <= limit <= REVIEW_QUEUE_MAX_LIMIT:
+            raise ValidationError({"limit": f"Must be between 1 and {REVIEW_QUEUE_MAX_LIMIT}."})
+        return limit
+
+    def get_queryset(self):
+        """Due words, most overdue first; definitions come from their content"""
+        return ReviewService(self.request.user).due(self.get_limit())
+
+
+@extend_schema(
+    request=ReviewBatchSerializer,
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "updated": {"type": "integer"},
+                "logged": {"type": "integer"},
+                "duplicates": {"type": "array", "items": {"type": "string", "format": "uuid"}},
+                "skipped": {"type": "array", "items": {"type": "integer"}},
+                "cards": {"type": "array", "items": {"type": "object"}},
+            },
+        },
+    },
+    tags=["Review"],
+)
+class ReviewView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ReviewBatchSerializer
+
+    def post(self, request, *args, **kwargs):
+        """Log a batch of answers and reschedule the reviewed words; safe to retry"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            result = ReviewService(request.user).record(serializer.validated_data["reviews"])
+            StatsService(request.user).reviews_logged(result["logs"])
+
+        return Response({
+            "updated": len(result["words"]),
+            "logged": len(result["logs"]),
+            "duplicates": result["duplicates"],
+            "skipped": result["skipped"],
+            "cards": ReviewStateSerializer(result["words"], many=True).data,
+        }, status=status.HTTP_200_OK)
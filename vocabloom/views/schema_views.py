@@ -0,0 +1,65 @@
+import logging
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from drf_spectacular.plumbing import set_query_parameters
+from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+
+from ..schema import built_schema
+
+logger = logging.getLogger(__name__)
+
+# A ?v=<version> URL always names the same bytes, so caches may keep it for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedSchemaView(SpectacularAPIView):
+    """
+    Serve the OpenAPI schema written by 'manage.py build_schema'.
+
+    Only DEBUG generates it live, so schema changes show up while
+    developing. Elsewhere a missing build is a deploy mistake and gets a 503.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if settings.DEBUG:
+            return super().get(request, *args, **kwargs)
+
+        schema = built_schema()
+        if schema is None:
+            logger.error("OpenAPI schema requested but not built; run 'manage.py build_schema'")
+            return JsonResponse(
+                {"error": "API schema is not available"}, status=503
+            )
+
+        fmt = request.accepted_renderer.format
+        etag = schema.etag(fmt)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(schema.contents[fmt], content_type=request.accepted_media_type)
+        response["ETag"] = etag
+        if request.GET.get("v") == schema.version:
+            response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response["Cache-Control"] = f"public, max-age={settings.SCHEMA_CACHE_MAX_AGE}"
+        return response
+
+
+class VersionedSchemaUrlMixin:
+    """Point the docs UI at the built schema's immutable, versioned URL"""
+
+    def _get_schema_url(self, request):
+        url = super()._get_schema_url(request)
+        schema = None if settings.DEBUG else built_schema()
+        if schema is None:
+            return url
+        return set_query_parameters(url, v=schema.version)
+
+
+class CachedSwaggerView(VersionedSchemaUrlMixin, SpectacularSwaggerView):
+    pass
+
+
+class CachedRedocView(VersionedSchemaUrlMixin, SpectacularRedocView):
+    pass
@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+
+from ..models import DailyStats, Tag, UserStats
+from ..serializers import StatsQuerySerializer, StatsSerializer, accuracy
+from .mixins import ReplicaReadMixin
+
+
+@extend_schema(parameters=[StatsQuerySerializer], tags=["Stats"])
+class StatsView(ReplicaReadMixin, generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = StatsSerializer
+
+    def get(self, request, *args, **kwargs):
+        """Learning dashboard for the last `days` days, read from the rollup tables"""
+        query = StatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        today = timezone.localdate()
+        start = today - timedelta(days=query.validated_data["days"] - 1)
+
+        totals = UserStats.objects.filter(user=request.user).first() or UserStats(user=request.user)
+        tags = list(Tag.objects.filter(user=request.user).only("id", "name", "word_count").order_by("name"))
+        recorded = {
+            row.date: row
+            for row in DailyStats.objects.filter(user=request.user, date__gte=start)
+        }
+        # Days without activity have no row; report them as zeros
+        daily = [
+            recorded.get(start + timedelta(days=offset)) or DailyStats(date=start + timedelta(days=offset))
+            for offset in range((today - start).days + 1)
+        ]
+
+        return Response(self.get_serializer({
+            "totals": {
+                "words": totals.words,
+                "untagged_words": totals.words - sum(tag.word_count for tag in tags),
+                "examples": totals.examples,
+                "reviews": totals.reviews,
+                "reviews_correct": totals.reviews_correct,
+                "accuracy": accuracy(totals.reviews_correct, totals.reviews),
+            },
+            "daily": daily,
+            "tags": tags,
+        }).data)
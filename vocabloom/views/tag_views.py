@@ -4,10 +4,12 @@ from drf_spectacular.utils import extend_schema
 
 from ..models import Tag
 from ..serializers import TagSerializer
+from ..services.deletion_service import delete_tag
+from .mixins import ReplicaReadMixin
 
 
 @extend_schema(tags=["Tags"])
-class TagListCreateView(generics.ListCreateAPIView):
+class TagListCreateView(ReplicaReadMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = TagSerializer
 
@@ -28,4 +30,7 @@ class TagDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def partial_update(self, request, *args, **kwargs):
         kwargs["partial"] = True
-        return self.update(request, *args, **kwargs)
\ No newline at end of file
+        return self.update(request, *args, **kwargs)
+
+    def perform_destroy(self, instance):
+        delete_tag(instance)
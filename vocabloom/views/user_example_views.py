@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
@@ -7,7 +8,10 @@ from drf_spectacular.utils import extend_schema
 
 from ..models import Word, UserExample
 from ..serializers import UserExampleSerializer
+from ..services.content_service import refresh_content
 from ..services.gemini_service import GeminiService
+from ..services.stats_service import StatsService
+from .mixins import ReplicaReadMixin
 
 
 @extend_schema(
@@ -22,13 +26,16 @@ class UserExampleCreateView(generics.CreateAPIView):
     def perform_create(self, serializer):
         word_id = self.kwargs["word_id"]
         word = get_object_or_404(Word, id=word_id, user=self.request.user)
-        serializer.save(word=word, user=self.request.user)
+        with transaction.atomic():
+            serializer.save(word=word, user=self.request.user)
+            refresh_content([word.id], parts=("user_examples",))
+            StatsService(self.request.user).examples_added()
 
 
 @extend_schema(
     responses={200: UserExampleSerializer(many=True)}, tags=["User Examples"]
 )
-class UserExampleListView(generics.ListAPIView):
+class UserExampleListView(ReplicaReadMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = UserExampleSerializer
 
@@ -53,6 +60,17 @@ class UserExampleDetailView(generics.RetrieveUpdateDestroyAPIView):
         word = get_object_or_404(Word, id=word_id, user=self.request.user)
         return UserExample.objects.filter(word=word, user=self.request.user)
 
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            example = serializer.save()
+            refresh_content([example.word_id], parts=("user_examples",))
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+            refresh_content([instance.word_id], parts=("user_examples",))
+            StatsService(self.request.user).examples_deleted([instance.created_at])
+
 
 @extend_schema(
     request={
@@ -93,5 +111,7 @@ class GenerateWordExampleView(GenericAPIView):
         
         if result.get('success'):
             return Response(result, status=status.HTTP_200_OK)
+        elif result.get('unavailable'):
+            return Response(result, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         else:
             return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
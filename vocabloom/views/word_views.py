@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
@@ -5,11 +6,17 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
 
 from ..models import Tag, Word
-from ..serializers import WordSerializer
+from ..serializers import WordBatchSerializer, WordSerializer
+from ..services.content_service import example_created_at
+from ..services.deletion_service import delete_words
+from ..services.stats_service import StatsService
+from ..services.word_batch_service import WordBatchService
+from ..services.word_audio_service import schedule_word_audio
+from .mixins import ReplicaReadMixin
 
 
 @extend_schema(tags=["Words"])
-class WordsByTagView(generics.ListAPIView):
+class WordsByTagView(ReplicaReadMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = WordSerializer
 
@@ -21,15 +28,19 @@ class WordsByTagView(generics.ListAPIView):
 
 
 @extend_schema(tags=["Words"])
-class WordListCreateView(generics.ListCreateAPIView):
+class WordListCreateView(ReplicaReadMixin, generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = WordSerializer
 
     def get_queryset(self):
-        return Word.objects.filter(user=self.request.user).prefetch_related('user_examples')
+        return Word.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        # The word and its count commit together; see reconcile()
+        with transaction.atomic():
+            word = serializer.save(user=self.request.user)
+            StatsService(self.request.user).words_added([word])
+        schedule_word_audio(word)
 
     def get_serializer_context(self):
         """Ensure request is in serializer context"""
@@ -44,7 +55,7 @@ class WordDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = WordSerializer
 
     def get_queryset(self):
-        return Word.objects.filter(user=self.request.user).prefetch_related('user_examples')
+        return Word.objects.filter(user=self.request.user)
 
     def partial_update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -62,4 +73,66 @@ class WordDetailView(generics.RetrieveUpdateDestroyAPIView):
         )
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+    def perform_update(self, serializer):
+        old_tag_id, old_text = serializer.instance.tag_id, serializer.instance.word
+        renamed = serializer.validated_data.get("word", old_text) != old_text
+        with transaction.atomic():
+            if renamed and "audio" not in serializer.validated_data:
+                # The stored pronunciation is of the old text
+                word = serializer.save(audio=None)
+            else:
+                word = serializer.save()
+            StatsService(self.request.user).word_retagged(old_tag_id, word.tag_id)
+        if renamed:
+            schedule_word_audio(word)
+
+    def perform_destroy(self, instance):
+        # The content snapshot lists the examples, so dating them costs no query
+        examples = example_created_at(instance.content)
+        with transaction.atomic():
+            # Hidden now, removed with its examples by 'manage.py purge_deleted'
+            delete_words(Word.objects.filter(id=instance.id))
+            StatsService(self.request.user).words_deleted([instance], examples=examples)
+
+
+@extend_schema(
+    request=WordBatchSerializer,
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "op": {"type": "string"},
+                            "words": {"type": "array", "items": {"type": "integer"}},
+                            "missing": {"type": "array", "items": {"type": "integer"}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    tags=["Words"],
+)
+class WordBatchView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = WordBatchSerializer
+
+    def post(self, request, *args, **kwargs):
+        """Re-tag, re-note or delete many words in one transaction; results follow the operations' order"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            result = WordBatchService(request.user).apply(serializer.validated_data["operations"])
+            stats = StatsService(request.user)
+            stats.words_retagged(result["retagged"])
+            if result["deleted"]:
+                stats.words_deleted(result["deleted"], examples=result["examples"])
+
+        return Response({"results": result["results"]}, status=status.HTTP_200_OK)
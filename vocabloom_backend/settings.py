@@ -14,6 +14,7 @@ import sys
 from pathlib import Path
 from datetime import timedelta
 import environ
+from django.core.exceptions import ImproperlyConfigured
 
 # ===================================================
 # BASIC CONFIGURATION
@@ -65,6 +66,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'vocabloom.middleware.ServerTimingMiddleware',
+    'vocabloom.middleware.CompressionMiddleware',
+    'vocabloom.middleware.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -106,7 +110,11 @@ WSGI_APPLICATION = 'vocabloom_backend.wsgi.application'
 
 DJANGO_ENV = env('DJANGO_ENV', default='development')
 
-if 'test' in sys.argv or 'test_coverage' in sys.argv:
+# DJANGO_TESTING lets subprocesses started by tests (e.g. profile_imports)
+# boot with the test settings too
+TESTING = 'test' in sys.argv or 'test_coverage' in sys.argv or env.bool('DJANGO_TESTING', default=False)
+
+if TESTING:
     # Test database configuration
     DATABASES = {
         'default': {
@@ -125,6 +133,70 @@ else:
         'default': env.db('DATABASE_URL'),
     }
 
+# Connection reuse. Opening a TLS connection to RDS costs several round trips,
+# so keep connections for DB_CONN_MAX_AGE seconds and health-check them before
+# reuse instead of reconnecting on every request.
+#
+# DB_PGBOUNCER: behind pgbouncer in transaction pooling mode, where a cursor
+# can't outlive its transaction, so server-side cursors are disabled.
+#
+# DB_POOL: an in-process pool of DB_POOL_MAX_SIZE connections shared by all
+# threads, for the ASGI path where per-thread persistent connections don't
+# work. Django hands each request's connection back to the pool when done.
+DB_PGBOUNCER = env.bool('DB_PGBOUNCER', default=False)
+
+if not TESTING:
+    DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=60)
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = env.bool('DB_CONN_HEALTH_CHECKS', default=True)
+    if DB_PGBOUNCER:
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    if env.bool('DB_POOL', default=False):
+        DATABASES['default']['ENGINE'] = 'vocabloom.db.pooled_postgresql'
+        # The pool owns connection lifetime; Django returns them after each request
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['POOL'] = {
+            'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+            'timeout': env.float('DB_POOL_TIMEOUT', default=10),
+            'max_lifetime': env.float('DB_POOL_MAX_LIFETIME', default=1800),
+            'check_after': env.float('DB_POOL_CHECK_AFTER', default=30),
+        }
+
+# Read replicas (comma-separated database URLs). List endpoints read from a
+# random replica; a user who wrote in the last REPLICA_STICKY_SECONDS reads
+# from the primary instead. Stickiness needs a cache shared by all workers.
+DATABASE_REPLICAS = []
+if not TESTING:
+    for index, url in enumerate(env.list('REPLICA_DATABASE_URLS', default=[])):
+        alias = f'replica_{index}'
+        DATABASES[alias] = {
+            **env.db_url_config(url),
+            'CONN_MAX_AGE': DATABASES['default']['CONN_MAX_AGE'],
+            'CONN_HEALTH_CHECKS': DATABASES['default']['CONN_HEALTH_CHECKS'],
+            'TEST': {'MIRROR': 'default'},
+        }
+        DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['vocabloom.db.routers.ReplicaRouter']
+REPLICA_STICKY_SECONDS = env.int('REPLICA_STICKY_SECONDS', default=10)
+REPLICA_STICKY_CACHE = env('REPLICA_STICKY_CACHE', default='default')
+
+# Cache shared by the workers, e.g. redis://host:6379/0 or dbcache://table
+# (run 'manage.py createcachetable'). The default is per process.
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# A per-process cache would only keep a user on the primary in the worker
+# that handled their write; reads in every other worker could go stale
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+if DATABASE_REPLICAS and CACHES.get(REPLICA_STICKY_CACHE, {}).get('BACKEND', PROCESS_LOCAL_CACHES[0]) in PROCESS_LOCAL_CACHES:
+    raise ImproperlyConfigured(
+        'REPLICA_DATABASE_URLS needs REPLICA_STICKY_CACHE to name a cache shared by all workers (set CACHE_URL)'
+    )
+
 # ===================================================
 # PASSWORD VALIDATION
 # ===================================================
@@ -160,6 +232,11 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Uploaded and generated files (pre-synthesized word audio). Point MEDIA_URL
+# at a CDN, or switch the default storage, to serve them from outside Django.
+MEDIA_URL = env('MEDIA_URL', default='/media/')
+MEDIA_ROOT = env('MEDIA_ROOT', default=os.path.join(BASE_DIR, 'media'))
+
 # ===================================================
 # DEFAULT FIELD TYPES
 # ===================================================
@@ -178,6 +255,45 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': [
+        'vocabloom.renderers.TimedJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# OpenAPI schema written at build time by 'manage.py build_schema'. Outside
+# DEBUG /api/schema/ serves these files and never generates the schema live.
+SCHEMA_DIR = env('SCHEMA_DIR', default=os.path.join(BASE_DIR, 'openapi'))
+# Cache lifetime for unversioned schema URLs; ?v=<version> URLs are immutable
+SCHEMA_CACHE_MAX_AGE = env.int('SCHEMA_CACHE_MAX_AGE', default=300)
+
+# ===================================================
+# PERFORMANCE INSTRUMENTATION
+# ===================================================
+
+# Share of requests that get a Server-Timing header and a timing log line
+PERFORMANCE_TIMING_SAMPLE_RATE = env.float('PERFORMANCE_TIMING_SAMPLE_RATE', default=1.0)
+
+# Per-route latency histograms, served in Prometheus format at /api/metrics/
+METRICS_ENABLED = env.bool('METRICS_ENABLED', default=True)
+METRICS_ALLOWED_IPS = env.list('METRICS_ALLOWED_IPS', default=['127.0.0.1', '::1'])
+# Shared directory where each gunicorn worker writes its totals for merging
+METRICS_MULTIPROC_DIR = env('METRICS_MULTIPROC_DIR', default=None)
+METRICS_FLUSH_INTERVAL = env.float('METRICS_FLUSH_INTERVAL', default=5)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'vocabloom.performance': {
+            'handlers': ['console'],
+            'level': env('PERFORMANCE_LOG_LEVEL', default='WARNING' if TESTING else 'INFO'),
+            'propagate': False,
+        },
+    },
 }
 
 # ===================================================
@@ -231,5 +347,85 @@ AWS_REGION = env('AWS_REGION')
 # Google Gemini API Configuration
 GEMINI_API_KEY = env('GEMINI_API_KEY')
 
+# Optional: alternate upstream endpoints, e.g. the benchmark stub servers
+POLLY_ENDPOINT_URL = env('POLLY_ENDPOINT_URL', default=None)
+GEMINI_API_ENDPOINT = env('GEMINI_API_ENDPOINT', default=None)
+
 # Optional: Polly default settings
-POLLY_DEFAULT_SPEED = env('POLLY_DEFAULT_SPEED', default='slow')
\ No newline at end of file
+POLLY_DEFAULT_SPEED = env('POLLY_DEFAULT_SPEED', default='slow')
+
+# Upstream timeouts (seconds). The deadline bounds the whole call including
+# SDK retries; a hedge starts a second attempt if the first is still running.
+POLLY_CONNECT_TIMEOUT = env.float('POLLY_CONNECT_TIMEOUT', default=2)
+POLLY_READ_TIMEOUT = env.float('POLLY_READ_TIMEOUT', default=5)
+POLLY_DEADLINE = env.float('POLLY_DEADLINE', default=8)
+POLLY_HEDGE_AFTER = env.float('POLLY_HEDGE_AFTER', default=None)
+GEMINI_TIMEOUT = env.float('GEMINI_TIMEOUT', default=10)
+GEMINI_DEADLINE = env.float('GEMINI_DEADLINE', default=12)
+GEMINI_HEDGE_AFTER = env.float('GEMINI_HEDGE_AFTER', default=None)
+UPSTREAM_MAX_WORKERS = env.int('UPSTREAM_MAX_WORKERS', default=16)
+
+# Circuit breakers fail fast after this many consecutive upstream failures
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = env.int('CIRCUIT_BREAKER_FAILURE_THRESHOLD', default=5)
+CIRCUIT_BREAKER_RESET_TIMEOUT = env.float('CIRCUIT_BREAKER_RESET_TIMEOUT', default=30)
+
+# Pre-synthesized word pronunciations stored in Word.audio. Clients get the
+# URL as is, so it has to be absolute: the relative default /media/ is not
+# served once DEBUG is off, and the SPA would resolve it against its own
+# origin. Precomputing is therefore only on by default when MEDIA_URL points
+# at a public host (a CDN or bucket).
+MEDIA_URL_IS_PUBLIC = MEDIA_URL.startswith(('http://', 'https://'))
+WORD_AUDIO_PRECOMPUTE = env.bool('WORD_AUDIO_PRECOMPUTE', default=MEDIA_URL_IS_PUBLIC)
+WORD_AUDIO_VOICE_ID = env('WORD_AUDIO_VOICE_ID', default='Joanna')
+WORD_AUDIO_DIR = env('WORD_AUDIO_DIR', default='audio/words')
+WORD_AUDIO_WORKERS = env.int('WORD_AUDIO_WORKERS', default=2)
+
+if WORD_AUDIO_PRECOMPUTE and not MEDIA_URL_IS_PUBLIC:
+    raise ImproperlyConfigured('WORD_AUDIO_PRECOMPUTE needs an absolute MEDIA_URL, e.g. https://cdn.example.com/media/')
+
+# Single-flight de-duplication of identical concurrent Polly/Gemini calls.
+# Sharing results across gunicorn workers needs PostgreSQL (advisory locks)
+# and a cache that all workers can read, e.g. the database cache backend.
+# The result is only shared with callers already waiting for it, so it stays
+# in the cache just long enough for them to read it (SINGLE_FLIGHT_RESULT_TTL
+# seconds); it is not a response cache.
+SINGLE_FLIGHT_ACROSS_WORKERS = env.bool('SINGLE_FLIGHT_ACROSS_WORKERS', default=False)
+SINGLE_FLIGHT_CACHE = env('SINGLE_FLIGHT_CACHE', default='default')
+SINGLE_FLIGHT_WAIT_SECONDS = env.float('SINGLE_FLIGHT_WAIT_SECONDS', default=30)
+SINGLE_FLIGHT_RESULT_TTL = env.int('SINGLE_FLIGHT_RESULT_TTL', default=2)
+
+if SINGLE_FLIGHT_ACROSS_WORKERS and DB_PGBOUNCER:
+    # Session-level advisory locks don't survive pgbouncer transaction pooling
+    raise ImproperlyConfigured('SINGLE_FLIGHT_ACROSS_WORKERS cannot be used with DB_PGBOUNCER')
+
+# Dictionary lookups (/api/lookup/<word>/). The client is any class with a
+# fetch(term) method; tests use the fixture client and never the network.
+# Found words are cached for DICTIONARY_CACHE_TTL seconds, unknown words
+# for DICTIONARY_NEGATIVE_CACHE_TTL.
+DICTIONARY_CLIENT = env(
+    'DICTIONARY_CLIENT',
+    default='vocabloom.services.dictionary_service.'
+    + ('FixtureDictionaryClient' if TESTING else 'FreeDictionaryClient'),
+)
+DICTIONARY_API_URL = env('DICTIONARY_API_URL', default='https://api.dictionaryapi.dev/api/v2/entries/en/{term}')
+DICTIONARY_FIXTURE_PATH = env('DICTIONARY_FIXTURE_PATH', default=str(BASE_DIR / 'vocabloom' / 'fixtures' / 'dictionary.json'))
+DICTIONARY_TIMEOUT = env.float('DICTIONARY_TIMEOUT', default=3)
+DICTIONARY_DEADLINE = env.float('DICTIONARY_DEADLINE', default=5)
+DICTIONARY_CACHE_TTL = env.int('DICTIONARY_CACHE_TTL', default=30 * 24 * 3600)
+DICTIONARY_NEGATIVE_CACHE_TTL = env.int('DICTIONARY_NEGATIVE_CACHE_TTL', default=24 * 3600)
+
+# Response compression (CompressionMiddleware). Brotli is used when the
+# client accepts it and the brotli package is installed, otherwise gzip.
+COMPRESSION_MIN_SIZE = env.int('COMPRESSION_MIN_SIZE', default=1024)
+COMPRESSION_GZIP_LEVEL = env.int('COMPRESSION_GZIP_LEVEL', default=6)
+COMPRESSION_BROTLI_QUALITY = env.int('COMPRESSION_BROTLI_QUALITY', default=5)
+
+if not 0 <= COMPRESSION_GZIP_LEVEL <= 9:
+    raise ImproperlyConfigured('COMPRESSION_GZIP_LEVEL must be between 0 and 9')
+if not 0 <= COMPRESSION_BROTLI_QUALITY <= 11:
+    raise ImproperlyConfigured('COMPRESSION_BROTLI_QUALITY must be between 0 and 11')
+
+# Deck imports (/api/words/import/). An .apkg is a zip whose collection is
+# extracted to a temporary file; a larger collection is refused so a small
+# compressed upload cannot fill the temp disk.
+IMPORT_MAX_COLLECTION_BYTES = env.int('IMPORT_MAX_COLLECTION_BYTES', default=200 * 1024 * 1024)
@@ -1,13 +1,19 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+
+from vocabloom.views import CachedRedocView, CachedSchemaView, CachedSwaggerView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('vocabloom.urls')),
 
     # API schema and docs
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    path('api/schema/', CachedSchemaView.as_view(), name='schema'),
+    path('api/schema/swagger-ui/', CachedSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+    path('api/schema/redoc/', CachedRedocView.as_view(url_name='schema'), name='redoc'),
 ]
+
+# Generated media (word audio) is served by Django only in development
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)